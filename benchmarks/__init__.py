@@ -0,0 +1 @@
+"""Performance benchmarks of the vendas-cli pipeline on synthetic data."""
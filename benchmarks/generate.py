@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from typing import IO
+
+import numpy as np
+import pandas as pd
+
+_BASE_NAMES = ("Camiseta", "Calça", "Tênis", "Boné", "Jaqueta", "Meia", "Relógio")
+_CHUNK_ROWS = 1_000_000
+
+
+@dataclass(frozen=True)
+class SyntheticConfig:
+    """Parameters of a synthetic sales CSV.
+
+    Parameters
+    ----------
+    rows : int
+        Number of data rows, excluding the header.
+    products : int
+        Number of distinct product names.
+    days : int
+        Number of consecutive days the sales are spread over.
+    invalid_ratio : float
+        Fraction of rows made invalid, each with a negative quantity, a
+        negative price or an impossible date.
+    encoding : str
+        Encoding of the written file; product names contain accented letters.
+    seed : int
+        Seed of the random generator; equal configs produce identical files.
+    start : str
+        First sale date in ISO YYYY-MM-DD format.
+
+    """
+
+    rows: int
+    products: int = 1_000
+    days: int = 365
+    invalid_ratio: float = 0.0
+    encoding: str = "utf-8"
+    seed: int = 0
+    start: str = "2025-01-01"
+
+    def file_name(self) -> str:
+        """Return a file name identifying this config, for reuse across runs."""
+
+        return (
+            f"vendas_{self.rows}r_{self.products}p_{self.days}d_"
+            f"{self.invalid_ratio:g}i_{self.encoding}_s{self.seed}.csv"
+        )
+
+
+def _product_names(products: int) -> np.ndarray:
+    return np.array(
+        [f"{_BASE_NAMES[i % len(_BASE_NAMES)]} {i:06d}" for i in range(products)],
+        dtype=object,
+    )
+
+
+def _chunk_frame(
+    rng: np.random.Generator,
+    rows: int,
+    config: SyntheticConfig,
+    names: np.ndarray,
+    dates: np.ndarray,
+) -> pd.DataFrame:
+    """Draw `rows` random sales, corrupting about `invalid_ratio` of them."""
+
+    quantities = rng.integers(1, 20, size=rows)
+    prices = rng.integers(1, 100_000, size=rows) / 100
+    days = dates[rng.integers(0, config.days, size=rows)]
+
+    invalid = np.flatnonzero(rng.random(rows) < config.invalid_ratio)
+    kinds = rng.integers(0, 3, size=len(invalid))
+    quantities[invalid[kinds == 0]] = -1
+    prices[invalid[kinds == 1]] = -1.0
+    days[invalid[kinds == 2]] = "2025-13-45"
+
+    return pd.DataFrame(
+        {
+            "produto": names[rng.integers(0, config.products, size=rows)],
+            "quantidade": quantities,
+            "preco_unitario": prices,
+            "data": days,
+        }
+    )
+
+
+def write_sales_csv(file: IO[str], config: SyntheticConfig) -> None:
+    """Write a synthetic sales CSV described by `config` to a text file.
+
+    Rows are drawn in chunks of `_CHUNK_ROWS` with NumPy, so files of 10^8
+    rows are written without holding them in memory.
+
+    Parameters
+    ----------
+    file : IO[str]
+        Destination opened in text mode with `config.encoding` and
+        `newline=""`.
+    config : SyntheticConfig
+        Size and shape of the data.
+
+    """
+
+    rng = np.random.default_rng(config.seed)
+    names = _product_names(config.products)
+    dates = (
+        pd.date_range(config.start, periods=config.days, freq="D")
+        .strftime("%Y-%m-%d")
+        .to_numpy(dtype=object)
+    )
+
+    file.write("produto,quantidade,preco_unitario,data\n")
+
+    for offset in range(0, config.rows, _CHUNK_ROWS):
+        rows = min(_CHUNK_ROWS, config.rows - offset)
+        _chunk_frame(rng, rows, config, names, dates).to_csv(
+            file, header=False, index=False, lineterminator="\n"
+        )
+
+
+def generate_sales_csv(path: str, config: SyntheticConfig) -> str:
+    """Write a synthetic sales CSV described by `config` to `path`.
+
+    Parameters
+    ----------
+    path : str
+        Destination file, overwritten if it exists.
+    config : SyntheticConfig
+        Size and shape of the data.
+
+    Returns
+    -------
+    str
+        `path`, for chaining.
+
+    """
+
+    with open(path, "w", encoding=config.encoding, newline="") as file:
+        write_sales_csv(file, config)
+
+    return path
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of `python -m benchmarks.generate`."""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.generate",
+        description="Write a deterministic synthetic sales CSV.",
+    )
+    parser.add_argument("path", help="Destination CSV file.")
+    parser.add_argument("--rows", type=int, default=100_000, help="Data rows.")
+    parser.add_argument(
+        "--products", type=int, default=1_000, help="Distinct products."
+    )
+    parser.add_argument("--days", type=int, default=365, help="Days of sales.")
+    parser.add_argument(
+        "--invalid-ratio",
+        type=float,
+        default=0.0,
+        help="Fraction of invalid rows.",
+    )
+    parser.add_argument("--encoding", default="utf-8", help="Output encoding.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point of `python -m benchmarks.generate`."""
+
+    args = build_parser().parse_args(argv)
+    generate_sales_csv(
+        args.path,
+        SyntheticConfig(
+            rows=args.rows,
+            products=args.products,
+            days=args.days,
+            invalid_ratio=args.invalid_ratio,
+            encoding=args.encoding,
+            seed=args.seed,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
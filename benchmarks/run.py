@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, replace
+from datetime import UTC, datetime
+from typing import Any, cast
+
+import pandas as pd
+
+from vendas_cli.core import compute_report
+from vendas_cli.encoding import resolve_encoding
+from vendas_cli.helpers import DataValidationError, validate_data
+from vendas_cli.output import render_output
+from vendas_cli.parser import _iter_raw_frames, load_csv
+from vendas_cli.typing import OutputFormat
+from vendas_cli.validators.validation import ProductsDFModel, is_valid_typed_frame
+
+from .generate import SyntheticConfig, generate_sales_csv
+
+RESULTS_VERSION = 2
+# `load_csv` checks typed frames with `is_valid_typed_frame` and only runs
+# Pandera (`validate_data`) on raw text frames when that check fails, so both
+# validations are timed on the frames they see in production.
+STAGES = (
+    "load_csv",
+    "validate_typed",
+    "validate_text",
+    "compute_report",
+    "render_output",
+)
+DEFAULT_ROWS = (10_000, 100_000, 1_000_000)
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_DATA_DIR = os.path.join(tempfile.gettempdir(), "vendas-cli-benchmarks")
+
+# Slowdowns smaller than this are timer noise at the smallest sizes.
+_MIN_REGRESSION_SECONDS = 0.005
+
+
+def _measure[T](
+    func: Callable[[], T], repeat: int, memory: bool
+) -> tuple[T, dict[str, float]]:
+    """Time `func` and optionally measure its peak traced memory.
+
+    The fastest of `repeat` untraced calls is kept; the peak comes from one
+    more call under `tracemalloc`, which would distort its timing.
+    """
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+
+    measurement = {"seconds": min(timings)}
+
+    if memory:
+        tracemalloc.start()
+        try:
+            func()
+            measurement["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return result, measurement
+
+
+def _validate_text(text: pd.DataFrame) -> None:
+    """Run Pandera on a raw text frame, as the text fallback does."""
+
+    # Invalid rows end validation with an error after the same work.
+    with contextlib.suppress(DataValidationError):
+        validate_data(text, ProductsDFModel)
+
+
+def benchmark_file(
+    csv_path: str,
+    rows: int,
+    repeat: int = 3,
+    memory: bool = True,
+    output_format: OutputFormat = "json",
+    encoding: str | None = None,
+) -> dict[str, dict[str, float]]:
+    """Time each pipeline stage on one CSV file.
+
+    Validation is timed twice: `validate_typed` is the vectorized check
+    `load_csv` runs on typed frames, and `validate_text` is Pandera on the
+    raw string frame, which production only pays for files with invalid rows.
+
+    Parameters
+    ----------
+    csv_path : str
+        Sales CSV. Invalid rows are quarantined instead of stopping the run.
+    rows : int
+        Number of data rows in the file, used for the throughput.
+    repeat : int, optional
+        Timed calls per stage; the fastest one is kept.
+    memory : bool, optional
+        Also record the peak memory allocated by each stage.
+    output_format : OutputFormat, optional
+        Format passed to `render_output`.
+    encoding : str | None, optional
+        Input encoding, detected when omitted.
+
+    Returns
+    -------
+    dict[str, dict[str, float]]
+        Per stage of `STAGES`: `seconds`, `rows_per_second` and, with
+        `memory`, `peak_bytes`.
+
+    """
+
+    results: dict[str, dict[str, float]] = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        reject_path = os.path.join(tmp, "rejects.csv")
+        df, results["load_csv"] = _measure(
+            lambda: load_csv(csv_path, encoding=encoding, reject_path=reject_path),
+            repeat,
+            memory,
+        )
+
+    _, results["validate_typed"] = _measure(
+        lambda: is_valid_typed_frame(df), repeat, memory
+    )
+
+    # The raw string frame the text fallback hands to Pandera.
+    text = next(_iter_raw_frames(csv_path, resolve_encoding(csv_path, encoding), None))
+    _, results["validate_text"] = _measure(lambda: _validate_text(text), repeat, memory)
+    summary, results["compute_report"] = _measure(
+        lambda: compute_report(df), repeat, memory
+    )
+    _, results["render_output"] = _measure(
+        lambda: render_output(summary, output_format), repeat, memory
+    )
+
+    for measurement in results.values():
+        measurement["rows_per_second"] = rows / max(measurement["seconds"], 1e-9)
+
+    return results
+
+
+def run_benchmarks(
+    sizes: Sequence[int],
+    config: SyntheticConfig,
+    data_dir: str = DEFAULT_DATA_DIR,
+    repeat: int = 3,
+    memory: bool = True,
+    output_format: OutputFormat = "json",
+) -> dict[str, Any]:
+    """Generate (or reuse) one synthetic file per size and benchmark it.
+
+    Parameters
+    ----------
+    sizes : Sequence[int]
+        Row counts to benchmark, e.g. 10^4 to 10^8.
+    config : SyntheticConfig
+        Shape of the synthetic data; its `rows` is replaced by each size.
+    data_dir : str, optional
+        Directory keeping the generated files, named after their config so
+        later runs skip the generation.
+    repeat : int, optional
+        Timed calls per stage; the fastest one is kept.
+    memory : bool, optional
+        Also record the peak memory allocated by each stage.
+    output_format : OutputFormat, optional
+        Format passed to `render_output`.
+
+    Returns
+    -------
+    dict[str, Any]
+        JSON-serializable results: the format `version`, the `environment`,
+        the data and output `config`, the `repeat` count, and `results`
+        keyed by row count and stage.
+
+    """
+
+    os.makedirs(data_dir, exist_ok=True)
+    results: dict[str, dict[str, dict[str, float]]] = {}
+
+    for rows in sizes:
+        sized = replace(config, rows=rows)
+        csv_path = os.path.join(data_dir, sized.file_name())
+
+        if not os.path.exists(csv_path):
+            generate_sales_csv(csv_path + ".tmp", sized)
+            os.replace(csv_path + ".tmp", csv_path)
+
+        results[str(rows)] = benchmark_file(
+            csv_path,
+            rows,
+            repeat=repeat,
+            memory=memory,
+            output_format=output_format,
+            encoding=config.encoding,
+        )
+
+    data_config = {key: value for key, value in asdict(config).items() if key != "rows"}
+
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "processor": platform.machine(),
+        },
+        "config": data_config | {"format": output_format},
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare_results(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    """List the stages slower or hungrier than the baseline allows.
+
+    Only sizes and stages present in both results are compared. A stage
+    regresses when its time or peak memory exceeds the baseline by more than
+    `tolerance`; slowdowns under `_MIN_REGRESSION_SECONDS` are ignored.
+
+    Parameters
+    ----------
+    current : dict[str, Any]
+        Results of `run_benchmarks`.
+    baseline : dict[str, Any]
+        Stored results of an earlier run, ideally on the same machine.
+    tolerance : float, optional
+        Allowed relative increase, e.g. 0.25 for 25%.
+
+    Returns
+    -------
+    list[str]
+        One message per regression, empty when there are none.
+
+    Raises
+    ------
+    ValueError
+        If the results have different versions or data configurations, so
+        their numbers are not comparable.
+
+    """
+
+    if baseline.get("version") != current["version"]:
+        raise ValueError(
+            f"Baseline results version {baseline.get('version')} does not match "
+            f"{current['version']}."
+        )
+
+    if baseline.get("config") != current["config"]:
+        raise ValueError(
+            f"Baseline config {baseline.get('config')} does not match "
+            f"{current['config']}."
+        )
+
+    regressions = []
+
+    for rows, stages in current["results"].items():
+        for stage, measurement in stages.items():
+            reference = baseline["results"].get(rows, {}).get(stage)
+            if reference is None:
+                continue
+
+            seconds, base_seconds = measurement["seconds"], reference["seconds"]
+            if (
+                seconds > base_seconds * (1 + tolerance)
+                and seconds - base_seconds > _MIN_REGRESSION_SECONDS
+            ):
+                regressions.append(
+                    f"{stage} @ {rows} rows: {seconds:.4f}s vs {base_seconds:.4f}s "
+                    f"(+{seconds / base_seconds - 1:.0%})"
+                )
+
+            peak, base_peak = measurement.get("peak_bytes"), reference.get("peak_bytes")
+            if peak is not None and base_peak and peak > base_peak * (1 + tolerance):
+                regressions.append(
+                    f"{stage} @ {rows} rows: peak {peak / 2**20:.1f} MiB vs "
+                    f"{base_peak / 2**20:.1f} MiB (+{peak / base_peak - 1:.0%})"
+                )
+
+    return regressions
+
+
+def format_results(report: dict[str, Any]) -> str:
+    """Render benchmark results as an aligned text table."""
+
+    lines = [
+        f"{'ROWS':>11}  {'STAGE':<15}  {'SECONDS':>9}  {'ROWS/S':>12}  {'PEAK MIB':>9}",
+        "-" * 64,
+    ]
+
+    for rows, stages in report["results"].items():
+        for stage, measurement in stages.items():
+            peak = measurement.get("peak_bytes")
+            peak_text = "-" if peak is None else f"{peak / 2**20:.1f}"
+            lines.append(
+                f"{int(rows):>11}  {stage:<15}  {measurement['seconds']:>9.4f}  "
+                f"{measurement['rows_per_second']:>12,.0f}  {peak_text:>9}"
+            )
+
+    return "\n".join(lines)
+
+
+def _parse_rows(value: str) -> int:
+    """Parse a row count such as `100000`, `1e6` or `10**7`."""
+
+    try:
+        if "**" in value:
+            base, exponent = value.split("**")
+            rows: int = int(base) ** int(exponent)
+        else:
+            rows = int(float(value))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid row count '{value}'.") from None
+
+    if rows <= 0:
+        raise argparse.ArgumentTypeError("Row counts must be positive.")
+
+    return rows
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of `python -m benchmarks.run`."""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description=(
+            "Time load_csv, typed and text validation, compute_report and "
+            "render_output on synthetic sales data and compare the results "
+            "with a baseline."
+        ),
+    )
+    parser.add_argument(
+        "--rows",
+        type=_parse_rows,
+        nargs="+",
+        default=list(DEFAULT_ROWS),
+        help="Row counts to benchmark, e.g. 1e4 1e5 1e6 1e7 1e8.",
+    )
+    parser.add_argument("--products", type=int, default=1_000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--invalid-ratio", type=float, default=0.0)
+    parser.add_argument("--encoding", default="utf-8")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--format",
+        choices=["text", "json", "ndjson"],
+        default="json",
+        help="Output format rendered by render_output.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed calls per stage (best kept)."
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Skip the extra tracemalloc call measuring peak memory.",
+    )
+    parser.add_argument(
+        "--data-dir",
+        default=DEFAULT_DATA_DIR,
+        help="Where generated CSV files are kept between runs.",
+    )
+    parser.add_argument(
+        "--output",
+        default="benchmark-results.json",
+        help="JSON file receiving the results.",
+    )
+    parser.add_argument(
+        "--baseline",
+        help="Results file to compare against; regressions exit with status 1.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed relative slowdown or memory growth (default: 0.25).",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point of `python -m benchmarks.run`."""
+
+    args = build_parser().parse_args(argv)
+    logging.getLogger("vendas-cli").setLevel(logging.WARNING)
+
+    report = run_benchmarks(
+        args.rows,
+        SyntheticConfig(
+            rows=0,
+            products=args.products,
+            days=args.days,
+            invalid_ratio=args.invalid_ratio,
+            encoding=args.encoding,
+            seed=args.seed,
+        ),
+        data_dir=args.data_dir,
+        repeat=args.repeat,
+        memory=not args.no_memory,
+        output_format=cast(OutputFormat, args.format),
+    )
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+        file.write("\n")
+
+    print(format_results(report))
+    print(f"\nResults written to {args.output}")
+
+    if args.baseline is None:
+        return
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    try:
+        regressions = compare_results(report, baseline, args.tolerance)
+    except ValueError as exc:
+        sys.exit(f"[ERROR] {exc}")
+
+    if regressions:
+        print(f"\nRegressions against {args.baseline}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+    print(f"\nNo regressions against {args.baseline}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,61 @@ from datetime import date
 import pandas as pd
 import pytest
 
+SALES_HEADER = "produto,quantidade,preco_unitario,data\n"
+
+# Mixed-case header, accented names, a blank line, a zero quantity and a
+# price without integer digits.
+SALES_CSV = (
+    "Produto,quantidade,preco_unitario,data\n"
+    "Camiseta,3,49.9,2025-01-01\n"
+    "Calça,2,99.90,2025-01-01\n"
+    "\n"
+    "Camiseta,1,49.9,2025-01-02\n"
+    "Boné,3,.5,2025-01-03\n"
+    "Tênis,0,199.9,2025-01-03\n"
+)
+
+# Inputs every report path must answer identically, or reject with the same
+# validation error.
+SALES_CASES = {
+    "mixed": SALES_CSV,
+    "large_values": SALES_HEADER
+    + "A,100,99999999.99,2025-01-02\n"
+    + "B,100000,99999.99,2025-01-03\n"
+    + "A,9223372036,1,2025-01-03\n",
+    "sale_value_overflow": SALES_HEADER + "A,100000000000,1000000000.00,2025-01-02\n",
+    "price_too_long": SALES_HEADER + "A,1,100000000000000000,2025-01-02\n",
+    "sub_cent_price": SALES_HEADER + "A,1,0.1,2025-01-02\nA,3,0.333,2025-01-03\n",
+}
+
+REPORT_WINDOWS = [
+    (None, None),
+    ("2025-01-02", "2025-01-03"),
+    ("2024-01-01", "2024-12-31"),
+]
+
+
+@pytest.fixture
+def sales_csv(tmp_path):
+    """Path of `SALES_CSV` written as UTF-8."""
+    path = tmp_path / "sales.csv"
+    path.write_text(SALES_CSV, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture(params=list(SALES_CASES))
+def sales_case_csv(request, tmp_path):
+    """Path of each input of `SALES_CASES`, written as UTF-8."""
+    path = tmp_path / f"{request.param}.csv"
+    path.write_text(SALES_CASES[request.param], encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture(params=REPORT_WINDOWS, ids=["all", "window", "empty"])
+def report_window(request):
+    """(start, end) date range: none, a partial window and an empty one."""
+    return request.param
+
 
 @pytest.fixture
 def df_sample():
@@ -19,3 +74,11 @@ def df_sample():
             ],
         }
     )
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep the dataset cache used by CLI runs out of the user's home."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("VENDAS_CLI_CACHE_DIR", str(cache_dir))
+    return cache_dir
@@ -0,0 +1,127 @@
+import json
+import logging
+
+import pytest
+
+from benchmarks.generate import SyntheticConfig, generate_sales_csv
+from benchmarks.run import (
+    RESULTS_VERSION,
+    STAGES,
+    compare_results,
+    main,
+    run_benchmarks,
+)
+from vendas_cli.parser import load_csv
+
+
+def test_generate_sales_csv_is_deterministic(tmp_path):
+    config = SyntheticConfig(rows=500, products=20, days=10, seed=7)
+
+    generate_sales_csv(str(tmp_path / "a.csv"), config)
+    generate_sales_csv(str(tmp_path / "b.csv"), config)
+    generate_sales_csv(str(tmp_path / "c.csv"), SyntheticConfig(rows=500))
+
+    content = (tmp_path / "a.csv").read_bytes()
+    assert content == (tmp_path / "b.csv").read_bytes()
+    assert content != (tmp_path / "c.csv").read_bytes()
+
+
+def test_generated_csv_matches_config(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    generate_sales_csv(
+        str(csv_path),
+        SyntheticConfig(rows=3_000, products=25, days=5, encoding="latin1"),
+    )
+
+    df = load_csv(str(csv_path), encoding="latin1")
+
+    assert len(df) == 3_000
+    assert df["produto"].nunique() == 25
+    assert df["data"].nunique() == 5
+    assert df["produto"].str.contains("Calça").any()
+
+
+def test_generated_csv_invalid_ratio(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    generate_sales_csv(
+        str(csv_path), SyntheticConfig(rows=2_000, invalid_ratio=0.05, days=3)
+    )
+
+    df = load_csv(str(csv_path), reject_path=str(tmp_path / "rejects.csv"))
+    invalid = df.attrs["invalid_products"]["total_invalid"]
+
+    assert 50 <= invalid <= 150
+    assert len(df) == 2_000 - invalid
+
+
+def test_run_benchmarks_times_every_stage(tmp_path):
+    report = run_benchmarks(
+        [200, 400], SyntheticConfig(rows=0), data_dir=str(tmp_path), repeat=1
+    )
+
+    assert list(report["results"]) == ["200", "400"]
+    for stages in report["results"].values():
+        assert tuple(stages) == STAGES
+        for measurement in stages.values():
+            assert measurement["seconds"] > 0
+            assert measurement["rows_per_second"] > 0
+            assert measurement["peak_bytes"] > 0
+
+    assert compare_results(report, report) == []
+
+
+def _report(seconds, peak_bytes, **config):
+    return {
+        "version": RESULTS_VERSION,
+        "config": {"products": 1_000} | config,
+        "results": {
+            "1000": {
+                "load_csv": {"seconds": seconds, "peak_bytes": peak_bytes},
+            }
+        },
+    }
+
+
+def test_compare_results_flags_regressions():
+    baseline = _report(1.0, 100)
+
+    assert compare_results(_report(1.2, 120), baseline) == []
+    assert compare_results(_report(1.5, 100), baseline) == [
+        "load_csv @ 1000 rows: 1.5000s vs 1.0000s (+50%)"
+    ]
+    assert len(compare_results(_report(1.0, 200), baseline)) == 1
+
+
+def test_compare_results_ignores_timer_noise():
+    assert compare_results(_report(0.002, 100), _report(0.001, 100)) == []
+
+
+def test_compare_results_rejects_other_config():
+    with pytest.raises(ValueError, match="does not match"):
+        compare_results(_report(1.0, 100, seed=1), _report(1.0, 100))
+
+
+@pytest.fixture
+def restore_log_level():
+    logger = logging.getLogger("vendas-cli")
+    level = logger.level
+    yield
+    logger.setLevel(level)
+
+
+@pytest.mark.usefixtures("restore_log_level")
+def test_main_exits_on_regression(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    argv = ["--rows", "1e2", "--repeat", "1", "--no-memory"]
+    argv += ["--data-dir", str(tmp_path), "--output", str(output)]
+
+    main(argv)
+    baseline = json.loads(output.read_text())
+    baseline["results"]["100"]["load_csv"]["seconds"] = 1e-6
+    (tmp_path / "baseline.json").write_text(json.dumps(baseline))
+
+    with pytest.raises(SystemExit) as exc:
+        main([*argv, "--baseline", str(tmp_path / "baseline.json")])
+
+    assert exc.value.code == 1
+    assert "load_csv @ 100 rows" in capsys.readouterr().out
@@ -0,0 +1,104 @@
+import os
+
+import pandas as pd
+import pytest
+
+from vendas_cli import cache
+from vendas_cli.cache import (
+    default_cache_dir,
+    evict_cache,
+    file_fingerprint,
+    load_csv_cached,
+)
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10\nB,1,5,2025-01-11"
+    )
+    return str(csv_path)
+
+
+def test_default_cache_dir_uses_env(isolated_cache_dir):
+    assert default_cache_dir() == str(isolated_cache_dir)
+
+
+def test_load_csv_cached_hit_skips_parsing(csv_file, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    first = load_csv_cached(csv_file, cache_dir=cache_dir)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("load_csv should not run on a cache hit")
+
+    monkeypatch.setattr(cache, "load_csv", fail)
+    second = load_csv_cached(csv_file, cache_dir=cache_dir)
+
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_fingerprint_changes_with_file(csv_file):
+    before = file_fingerprint(csv_file)
+    stat = os.stat(csv_file)
+    os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert file_fingerprint(csv_file) != before
+    assert file_fingerprint(csv_file, encoding="latin1") != file_fingerprint(csv_file)
+    assert file_fingerprint(csv_file, content_hash=True) != file_fingerprint(csv_file)
+
+
+def test_corrupt_entry_is_discarded(csv_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir(mode=0o700)
+    entry = cache_dir / f"{file_fingerprint(csv_file)}.pkl"
+    entry.write_bytes(b"not a pickle")
+
+    df = load_csv_cached(csv_file, cache_dir=str(cache_dir))
+
+    assert len(df) == 2
+    assert entry.read_bytes() != b"not a pickle"
+
+
+def test_evict_cache_removes_least_recently_used(tmp_path):
+    for age, name in enumerate(["new", "mid", "old"]):
+        entry = tmp_path / f"{name}.pkl"
+        entry.write_bytes(b"x" * 100)
+        os.utime(entry, (1_000_000 - age, 1_000_000 - age))
+
+    evict_cache(str(tmp_path), max_bytes=250)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["mid.pkl", "new.pkl"]
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="needs POSIX ownership")
+def test_cache_in_writable_by_others_dir_is_not_unpickled(csv_file, tmp_path):
+    cache_dir = tmp_path / "shared"
+    cache_dir.mkdir()
+    cache_dir.chmod(0o777)
+    entry = cache_dir / f"{file_fingerprint(csv_file)}.pkl"
+    pd.DataFrame({"planted": [1]}).to_pickle(entry)
+
+    df = load_csv_cached(csv_file, cache_dir=str(cache_dir))
+
+    assert "planted" not in df.columns
+    assert os.listdir(cache_dir) == [entry.name]
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="needs POSIX ownership")
+def test_cache_entry_writable_by_others_is_not_unpickled(csv_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir(mode=0o700)
+    entry = cache_dir / f"{file_fingerprint(csv_file)}.pkl"
+    pd.DataFrame({"planted": [1]}).to_pickle(entry)
+    entry.chmod(0o666)
+
+    assert "planted" not in load_csv_cached(csv_file, cache_dir=str(cache_dir))
+
+
+def test_entry_larger_than_cache_limit_is_not_stored(csv_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+
+    load_csv_cached(csv_file, cache_dir=str(cache_dir), max_bytes=10)
+
+    assert os.listdir(cache_dir) == []
@@ -1,8 +1,13 @@
+import json
+import os
+import subprocess
 import sys
+from pathlib import Path
 
 import pytest
 
 from vendas_cli.cli import main
+from vendas_cli.parser import iter_csv_chunks
 
 
 def test_cli_invalid_date_range(monkeypatch, capsys, tmp_path):
@@ -44,3 +49,370 @@ def test_cli_success(monkeypatch, capsys, tmp_path):
     assert "TOTAL SALES:" in output
     assert "A" in output
     assert exc.value.code == 0
+
+
+def test_cli_ndjson(monkeypatch, capsys, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10\nB,1,5,2025-01-11"
+    )
+
+    monkeypatch.setattr(
+        sys, "argv", ["vendas-cli", str(csv_path), "--format", "ndjson", "--no-cache"]
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    lines = capsys.readouterr().out.splitlines()
+    assert exc.value.code == 0
+    assert json.loads(lines[0])["valor_total"] == 25.0
+    assert [json.loads(line)["produto"] for line in lines[1:]] == ["A", "B"]
+
+
+def test_cli_export_csv(monkeypatch, capsysbinary, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\nB,1,5,2025-01-11\nA,2,10,2025-01-10"
+    )
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["vendas-cli", str(csv_path), "--format", "csv", "--start", "2025-01-10"]
+        + ["--end", "2025-01-10", "--no-cache"],
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    assert exc.value.code == 0
+    assert capsysbinary.readouterr().out.decode().splitlines() == [
+        "produto,quantidade_total,total_vendas",
+        "A,2,20.0",
+    ]
+
+
+@pytest.mark.parametrize("extra", [[], ["--split-file"], ["--chunk-size", "1"]])
+def test_cli_export_without_range_skips_daily_aggregate(
+    monkeypatch, capsysbinary, tmp_path, extra
+):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\n"
+        "B,1,5,2025-01-11\nA,2,10,2025-01-10\nB,3,5,2025-02-01\n"
+    )
+
+    def no_daily(*args, **kwargs):
+        raise AssertionError("export built a per-day aggregate")
+
+    monkeypatch.setattr("vendas_cli.parallel.aggregate_files_by_day", no_daily)
+    monkeypatch.setattr("vendas_cli.core.aggregate_by_day", no_daily)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["vendas-cli", str(csv_path), "--format", "csv", "--no-cache"]
+        + ["--workers", "1", *extra],
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    assert exc.value.code == 0
+    assert capsysbinary.readouterr().out.decode().splitlines() == [
+        "produto,quantidade_total,total_vendas",
+        "A,2,20.0",
+        "B,4,20.0",
+    ]
+
+
+def test_cli_export_rejects_jobs(monkeypatch, capsys, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10")
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["vendas-cli", str(csv_path), "--format", "csv", "--jobs", "jobs.json"],
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    assert exc.value.code == 2
+    assert "--jobs reports support" in capsys.readouterr().err
+
+
+def test_cli_top_sort_by(monkeypatch, capsys, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\n"
+        "A,2,10,2025-01-10\nB,1,50,2025-01-11\nC,5,1,2025-01-11"
+    )
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["vendas-cli", str(csv_path), "--top", "1", "--sort-by", "valor"]
+        + ["--format", "json", "--no-cache"],
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    data = json.loads(capsys.readouterr().out)
+    assert exc.value.code == 0
+    assert [total["produto"] for total in data["totais_por_produto"]] == ["B"]
+    assert data["valor_total"] == 75.0
+    assert data["produto_mais_vendido"] == "C"
+
+
+@pytest.mark.parametrize("extra", [[], ["--split-file"], ["--state", "state.json"]])
+def test_cli_top_matches_full_report(monkeypatch, capsys, tmp_path, extra):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\n"
+        "A,2,10,2025-01-10\nB,1,50,2025-01-11\nC,5,1,2025-01-11\nB,9,1,2025-03-01\n"
+    )
+
+    def no_index(*args, **kwargs):
+        raise AssertionError("--top built a prefix-sum index")
+
+    monkeypatch.setattr("vendas_cli.range_index.PrefixSumIndex.__init__", no_index)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["vendas-cli", str(csv_path), "--top", "2", "--format", "json"]
+        + ["--start", "2025-01-01", "--end", "2025-01-31", "--no-cache"]
+        + ["--workers", "1", *extra],
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    data = json.loads(capsys.readouterr().out)
+    assert exc.value.code == 0
+    assert [total["produto"] for total in data["totais_por_produto"]] == ["C", "A"]
+    assert data["valor_total"] == 75.0
+    assert data["produto_mais_vendido"] == "C"
+
+
+def test_cli_chunk_size(monkeypatch, capsys, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10\nB,1,5,2025-01-11"
+    )
+
+    monkeypatch.setattr(sys, "argv", ["vendas-cli", str(csv_path), "--chunk-size", "1"])
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    output = capsys.readouterr().out
+    assert "TOTAL SALES: 25.00" in output
+    assert exc.value.code == 0
+
+
+def test_cli_multiple_files(monkeypatch, capsys, tmp_path):
+    for name, row in (("a.csv", "A,2,10,2025-01-10"), ("b.csv", "B,1,5,2025-01-11")):
+        (tmp_path / name).write_text(f"produto,quantidade,preco_unitario,data\n{row}")
+
+    monkeypatch.setattr(
+        sys, "argv", ["vendas-cli", str(tmp_path / "*.csv"), "--workers", "1"]
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    output = capsys.readouterr().out
+    assert "TOTAL SALES: 25.00" in output
+    assert exc.value.code == 0
+
+
+def test_cli_auto_engine_streams_chunks_with_pandas(monkeypatch, capsys, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10\nB,1,5,2025-01-11"
+    )
+    chunks = []
+
+    def no_stream(*args, **kwargs):
+        raise AssertionError("--chunk-size ran the stream engine")
+
+    def spy(*args, **kwargs):
+        for chunk in iter_csv_chunks(*args, **kwargs):
+            chunks.append(len(chunk))
+            yield chunk
+
+    monkeypatch.setattr("vendas_cli.stream.compute_report_stream", no_stream)
+    monkeypatch.setattr("vendas_cli.parser.iter_csv_chunks", spy)
+    monkeypatch.setattr(sys, "argv", ["vendas-cli", str(csv_path), "--chunk-size", "1"])
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    assert exc.value.code == 0
+    assert chunks == [1, 1]
+    assert "TOTAL SALES: 25.00" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("engine", ["stream", "arrow"])
+def test_cli_engine_rejects_chunk_size(monkeypatch, capsys, tmp_path, engine):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10")
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["vendas-cli", str(csv_path), "--engine", engine, "--chunk-size", "1"],
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    assert exc.value.code == 2
+    assert "no --split-file, --chunk-size" in capsys.readouterr().err
+
+
+def test_cli_uses_cache_unless_disabled(monkeypatch, capsys, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10")
+    cache_dir = tmp_path / "cache"
+
+    for extra in (["--cache-dir", str(cache_dir)], ["--no-cache"]):
+        argv = ["vendas-cli", str(csv_path), "--engine", "pandas", *extra]
+        monkeypatch.setattr(sys, "argv", argv)
+        with pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code == 0
+
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+    assert "TOTAL SALES: 20.00" in capsys.readouterr().out
+
+
+def test_cli_state_requires_single_file(monkeypatch, tmp_path):
+    for name in ("a.csv", "b.csv"):
+        (tmp_path / name).write_text("produto,quantidade,preco_unitario,data\n")
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["vendas-cli", str(tmp_path), "--state", str(tmp_path / "state.json")],
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    assert exc.value.code == 2
+
+
+def test_cli_state(monkeypatch, capsys, tmp_path):
+    csv_path = tmp_path / "log.csv"
+    csv_path.write_text("produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10\n")
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["vendas-cli", str(csv_path), "--state", str(tmp_path / "state.json")],
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    assert "TOTAL SALES: 20.00" in capsys.readouterr().out
+    assert exc.value.code == 0
+
+
+def test_cli_quarantine(monkeypatch, capsys, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10\nB,-1,5,2025-01-11"
+    )
+
+    monkeypatch.setattr(
+        sys, "argv", ["vendas-cli", str(csv_path), "--on-invalid", "quarantine"]
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    assert exc.value.code == 0
+    assert "TOTAL SALES: 20.00" in capsys.readouterr().out
+    assert "B,-1,5,2025-01-11" in (tmp_path / "data.rejected.csv").read_text()
+
+
+def test_cli_directory_ignores_previous_reject_file(monkeypatch, capsys, tmp_path):
+    csv_path = tmp_path / "loja1.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10\nB,-1,5,2025-01-11"
+    )
+    argv = ["vendas-cli", "--no-cache"]
+
+    monkeypatch.setattr(
+        sys, "argv", [*argv, str(csv_path), "--on-invalid", "quarantine"]
+    )
+    with pytest.raises(SystemExit):
+        main()
+    assert (tmp_path / "loja1.rejected.csv").exists()
+
+    csv_path.write_text("produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10")
+    capsys.readouterr()
+    monkeypatch.setattr(sys, "argv", [*argv, str(tmp_path)])
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    assert exc.value.code == 0
+    assert "TOTAL SALES: 20.00" in capsys.readouterr().out
+
+
+def test_cli_reject_file_requires_quarantine(monkeypatch, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("produto,quantidade,preco_unitario,data\n")
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["vendas-cli", str(csv_path), "--reject-file", str(tmp_path / "r.csv")],
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    assert exc.value.code == 2
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--help"],
+        ["missing.csv"],
+        ["data.csv", "--start", "2025-01-01"],
+        ["serve", "--help"],
+        ["query", "data.csv", "--port", "1"],
+    ],
+)
+def test_cli_argument_handling_skips_heavy_imports(tmp_path, argv):
+    (tmp_path / "data.csv").write_text("produto,quantidade,preco_unitario,data\n")
+    script = (
+        "import sys\n"
+        "from vendas_cli.cli import main\n"
+        f"sys.argv = ['vendas-cli', *{argv!r}]\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "heavy = {'numpy', 'pandas', 'pandera', 'pydantic'} & set(sys.modules)\n"
+        "print(sorted(heavy))\n"
+    )
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[1])},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.splitlines()[-1] == "[]"
@@ -1,6 +1,21 @@
+import weakref
 from datetime import date
 
-from vendas_cli.core import compute_report, compute_totals_by_product
+import pandas as pd
+import pytest
+
+from vendas_cli.core import (
+    aggregate_by_day,
+    aggregate_by_product,
+    compute_report,
+    compute_report_chunked,
+    compute_totals_by_product,
+    filter_by_date,
+    merge_aggregates,
+    select_products,
+    summarize_aggregate,
+)
+from vendas_cli.parser import load_csv
 
 
 def test_compute_totals_by_product(df_sample):
@@ -12,6 +27,71 @@ def test_compute_totals_by_product(df_sample):
     assert result[0].total_vendas == 50.0
 
 
+def test_aggregate_by_product_sums_exact_cents():
+    df = pd.DataFrame(
+        {
+            "produto": ["A"] * 10 + ["B"],
+            "quantidade": [1] * 10 + [3],
+            "preco_unitario": [0.1] * 10 + [19.99],
+            "data": [date(2025, 1, 10)] * 11,
+        }
+    )
+
+    aggregated = aggregate_by_product(df)
+    summary = compute_report(df)
+
+    assert aggregated["total_centavos"].dtype == "int64"
+    assert aggregated["total_centavos"].tolist() == [100, 5997]
+    assert [t.total_vendas for t in summary.totais_por_produto] == [1.0, 59.97]
+    assert summary.valor_total == 60.97
+
+
+def test_aggregates_of_categorical_products_have_plain_labels():
+    df = pd.DataFrame(
+        {
+            "produto": pd.Categorical(["B", "A", "B"], categories=["A", "B", "C"]),
+            "quantidade": [1, 2, 3],
+            "preco_unitario": [1.0, 2.0, 3.0],
+            "data": pd.to_datetime(["2025-01-10", "2025-01-10", "2025-01-11"]),
+        }
+    )
+
+    by_product = aggregate_by_product(df)
+    by_day = aggregate_by_day(df)
+
+    assert by_product.index.tolist() == ["A", "B"]
+    assert not isinstance(by_product.index.dtype, pd.CategoricalDtype)
+    assert not isinstance(by_day.index.levels[0].dtype, pd.CategoricalDtype)
+    assert by_day["quantidade_total"].tolist() == [2, 1, 3]
+
+
+def test_merge_aggregates_folds_parts_incrementally(monkeypatch):
+    monkeypatch.setattr("vendas_cli.core._MERGE_BATCH", 4)
+    alive = []
+
+    def partials():
+        for i in range(100):
+            part = aggregate_by_day(
+                pd.DataFrame(
+                    {
+                        "produto": [f"P{i % 3}"],
+                        "quantidade": [1],
+                        "preco_unitario": [0.5],
+                        "data": pd.to_datetime([f"2025-01-{i % 5 + 1:02d}"]),
+                    }
+                )
+            )
+            alive.append(weakref.ref(part))
+            yield part
+            assert sum(ref() is not None for ref in alive) <= 6
+
+    merged = merge_aggregates(partials())
+
+    assert merged["quantidade_total"].sum() == 100
+    assert merged["total_centavos"].sum() == 5_000
+    assert len(merged) == 15
+
+
 def test_compute_report_full_range(df_sample):
     summary = compute_report(df_sample, start="2025-01-01", end="2025-12-31")
 
@@ -26,3 +106,113 @@ def test_compute_report_filtered(df_sample):
 
     assert summary.valor_total == 5.0
     assert summary.produto_mais_vendido == "B"
+
+
+def test_compute_report_chunked_matches_compute_report(df_sample):
+    chunks = [df_sample.iloc[:1], df_sample.iloc[1:2], df_sample.iloc[2:]]
+
+    chunked = compute_report_chunked(chunks, start="2025-01-01", end="2025-12-31")
+    full = compute_report(df_sample, start="2025-01-01", end="2025-12-31")
+
+    assert chunked == full
+
+
+def test_compute_report_chunked_empty_range(df_sample):
+    summary = compute_report_chunked([df_sample], start="2026-01-01", end="2026-12-31")
+
+    assert summary.valor_total == 0.0
+    assert summary.produto_mais_vendido == ""
+    assert summary.totais_por_produto == []
+
+
+def test_filter_by_date_sorted_uses_slice():
+    df = pd.DataFrame(
+        {
+            "produto": ["A", "B", "C", "D"],
+            "quantidade": [1, 1, 1, 1],
+            "preco_unitario": [1.0, 1.0, 1.0, 1.0],
+            "data": pd.to_datetime(
+                ["2025-01-01", "2025-01-10", "2025-01-10", "2025-02-01"]
+            ),
+        }
+    )
+
+    result = filter_by_date(df, start="2025-01-10", end="2025-01-31")
+
+    assert result["produto"].tolist() == ["B", "C"]
+    assert result.index.tolist() == [1, 2]
+
+
+def test_filter_by_date_on_frames_derived_from_load_csv(tmp_path):
+    header = "produto,quantidade,preco_unitario,data\n"
+    first = tmp_path / "a.csv"
+    first.write_text(header + "A,1,10,2025-01-01\nB,1,10,2025-01-05\n")
+    second = tmp_path / "b.csv"
+    second.write_text(header + "C,1,10,2025-01-02\nD,1,10,2025-01-03\n")
+
+    combined = pd.concat([load_csv(str(first)), load_csv(str(second))])
+    resorted = load_csv(str(first)).sort_values("produto", ascending=False)
+
+    window = filter_by_date(combined, start="2025-01-02", end="2025-01-03")
+    assert window["produto"].tolist() == ["C", "D"]
+    window = filter_by_date(resorted, start="2025-01-05", end="2025-01-05")
+    assert window["produto"].tolist() == ["B"]
+
+
+def test_filter_by_date_unsorted_falls_back(df_sample):
+    shuffled = df_sample.iloc[[2, 0, 1]]
+
+    result = filter_by_date(shuffled, start="2025-01-12", end="2025-01-31")
+
+    assert result["data"].tolist() == [date(2025, 1, 20), date(2025, 1, 15)]
+
+
+def test_compute_report_top_product_tie_keeps_first_name():
+    df = pd.DataFrame(
+        {
+            "produto": ["C", "B", "A"],
+            "quantidade": [1, 2, 2],
+            "preco_unitario": [1.0, 1.0, 1.0],
+            "data": [date(2025, 1, 10)] * 3,
+        }
+    )
+
+    summary = compute_report(df)
+
+    assert summary.produto_mais_vendido == "A"
+    assert [t.produto for t in summary.totais_por_produto] == ["A", "B", "C"]
+
+
+def make_aggregate():
+    return pd.DataFrame(
+        {
+            "quantidade_total": [1, 5, 3, 5],
+            "total_centavos": [9000, 500, 3000, 100],
+        },
+        index=pd.Index(["D", "C", "B", "A"], name="produto"),
+    )
+
+
+@pytest.mark.parametrize(
+    ("top", "sort_by", "expected"),
+    [
+        (None, None, ["A", "B", "C", "D"]),
+        (2, None, ["A", "C"]),
+        (3, "quantidade", ["A", "C", "B"]),
+        (2, "valor", ["D", "B"]),
+        (None, "valor", ["D", "B", "C", "A"]),
+        (10, "quantidade", ["A", "C", "B", "D"]),
+    ],
+)
+def test_select_products(top, sort_by, expected):
+    selected = select_products(make_aggregate(), top=top, sort_by=sort_by)
+
+    assert selected.index.tolist() == expected
+
+
+def test_summarize_aggregate_top_keeps_exact_totals():
+    summary = summarize_aggregate(make_aggregate(), top=1, sort_by="valor")
+
+    assert [total.produto for total in summary.totais_por_produto] == ["D"]
+    assert summary.valor_total == 126.0
+    assert summary.produto_mais_vendido == "A"
@@ -0,0 +1,79 @@
+import io
+
+import pytest
+
+import vendas_cli
+from vendas_cli.core import compute_report
+from vendas_cli.dataset import Dataset
+from vendas_cli.helpers import DataValidationError
+from vendas_cli.output import render_output
+from vendas_cli.parser import load_csv
+
+
+def test_package_exports_dataset():
+    assert vendas_cli.Dataset is Dataset
+
+
+def test_dataset_totals_and_render_match_report(sales_csv):
+    expected = compute_report(load_csv(sales_csv), start="2025-01-02", end="2025-01-03")
+    dataset = Dataset.from_csv(sales_csv)
+
+    assert dataset.totals("2025-01-02", "2025-01-03") == expected.totais_por_produto
+    assert dataset.render("json", "2025-01-02", "2025-01-03") == render_output(
+        expected, "json"
+    )
+
+
+def test_dataset_from_frame_and_several_files(tmp_path, sales_csv):
+    other = tmp_path / "other.csv"
+    other.write_text("produto,quantidade,preco_unitario,data\nBoné,1,.5,2025-02-01\n")
+
+    combined = Dataset.from_csv([sales_csv, str(other)])
+
+    assert (
+        Dataset.from_frame(load_csv(sales_csv)).report()
+        == Dataset.from_csv(sales_csv).report()
+    )
+    assert combined.totals()[0].quantidade_total == 4
+
+
+def test_dataset_memoizes_reports(sales_csv):
+    dataset = Dataset.from_csv(sales_csv)
+
+    assert dataset.report("2025-01-01", "2025-01-01") is dataset.report(
+        "2025-01-01", "2025-01-01"
+    )
+    assert dataset.index is dataset.index
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        ("produto,quantidade,preco_unitario,data\nA,x,10,2025-01-10\n", "Row 1"),
+        ("produto,quantidade,preco_unitario\nA,1,10\n", "Missing required column"),
+    ],
+)
+def test_dataset_raises_catchable_validation_errors(tmp_path, content, message):
+    path = tmp_path / "bad.csv"
+    path.write_text(content)
+
+    try:
+        Dataset.from_csv(str(path))
+    except Exception as exc:
+        assert isinstance(exc, DataValidationError)
+        assert isinstance(exc, ValueError)
+        assert message in str(exc)
+    else:
+        pytest.fail("DataValidationError not raised")
+
+
+def test_dataset_export_csv(sales_csv):
+    file = io.BytesIO()
+
+    Dataset.from_csv(sales_csv).export(file, "csv", "2025-01-03", "2025-01-03")
+
+    assert file.getvalue().decode("utf-8").splitlines() == [
+        "produto,quantidade_total,total_vendas",
+        "Boné,3,1.5",
+        "Tênis,0,0.0",
+    ]
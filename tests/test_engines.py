@@ -0,0 +1,143 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from vendas_cli.cli import main
+from vendas_cli.dataset import Dataset
+from vendas_cli.engines import (
+    EngineFallback,
+    available_engines,
+    compute_report_pandas,
+    compute_report_with,
+    get_engine,
+)
+from vendas_cli.helpers import DataValidationError
+from vendas_cli.stream import compute_report_stream
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data_test"
+
+
+def _engines():
+    engines = []
+    for name in available_engines():
+        if name == "arrow":
+            pytest.importorskip("pyarrow")
+        engines.append(name)
+    return engines
+
+
+def test_available_engines_lists_builtins_first():
+    assert available_engines()[:3] == ["pandas", "stream", "arrow"]
+
+
+def test_get_engine_loads_builtin():
+    assert get_engine("stream") is compute_report_stream
+
+
+def test_get_engine_unknown_name():
+    with pytest.raises(ValueError, match="Unknown engine 'nope'"):
+        get_engine("nope")
+
+
+def test_get_engine_entry_point(monkeypatch):
+    monkeypatch.setattr(
+        "vendas_cli.engines._entry_point_engines",
+        lambda: {"custom": "vendas_cli.engines:compute_report_pandas"},
+    )
+
+    assert "custom" in available_engines()
+    assert get_engine("custom") is compute_report_pandas
+
+
+def test_compute_report_with_falls_back_to_pandas(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("produto,quantidade,preco_unitario,data\nA,1,1e2,2025-01-10\n")
+
+    with pytest.raises(EngineFallback):
+        compute_report_stream(str(csv_path))
+
+    assert compute_report_with("stream", str(csv_path)) == compute_report_pandas(
+        str(csv_path)
+    )
+
+
+def test_compute_report_with_uses_given_fallback(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("produto,quantidade,preco_unitario,data\nA,1,1e2,2025-01-10\n")
+    expected = compute_report_pandas(str(csv_path))
+
+    assert compute_report_with("stream", str(csv_path), fallback=lambda: expected) is (
+        expected
+    )
+
+
+def test_cli_engine_fallback_honours_max_errors(monkeypatch, capsys, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\n"
+        + "".join(f"P{i},-1,5,2025-01-10\n" for i in range(5))
+    )
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["vendas-cli", str(csv_path), "--engine", "stream", "--max-errors", "2"],
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    assert "Row 2:" in str(exc.value.code)
+    assert "Row 3:" not in str(exc.value.code)
+
+
+def _outcome(func, *args):
+    try:
+        return func(*args)
+    except DataValidationError as exc:
+        return str(exc)
+
+
+def _dataset_report(csv_path, start, end):
+    return Dataset.from_csv(csv_path).report(start, end)
+
+
+def test_report_paths_agree(sales_case_csv, report_window):
+    start, end = report_window
+    expected = _outcome(compute_report_pandas, sales_case_csv, start, end)
+
+    for name in _engines():
+        assert (
+            _outcome(compute_report_with, name, sales_case_csv, start, end) == expected
+        )
+
+    assert _outcome(_dataset_report, sales_case_csv, start, end) == expected
+
+
+@pytest.mark.parametrize("csv_name", ["vendas.csv", "vendas1.csv", "vendas2.csv"])
+@pytest.mark.parametrize("output_format", ["text", "json"])
+def test_cli_engines_agree_on_fixtures(monkeypatch, capsys, csv_name, output_format):
+    argv = ["vendas-cli", str(DATA_DIR / csv_name), "--no-cache"]
+
+    outputs = {}
+    for name in _engines():
+        monkeypatch.setattr(
+            sys, "argv", [*argv, "--engine", name, "--format", output_format]
+        )
+        with pytest.raises(SystemExit) as exc:
+            main()
+        outputs[name] = (exc.value.code, str(exc.value), capsys.readouterr().out)
+
+    assert len(set(outputs.values())) == 1
+
+
+def test_cli_rejects_unknown_engine(monkeypatch, capsys):
+    monkeypatch.setattr(
+        sys, "argv", ["vendas-cli", str(DATA_DIR / "vendas.csv"), "--engine", "nope"]
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    assert exc.value.code == 2
+    assert "Unknown engine 'nope'" in capsys.readouterr().err
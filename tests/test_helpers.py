@@ -1,11 +1,17 @@
 import argparse
+import pickle
 
 import pytest
 
 from vendas_cli.helpers import (
+    DataValidationError,
+    expand_csv_paths,
     format_currency,
+    format_validation_failures,
     validate_csv_path,
+    validate_encoding,
     validate_filter_date,
+    validate_positive_int,
 )
 
 
@@ -51,3 +57,76 @@ def test_format_currency():
     assert format_currency(199.9) == "199.90"
     assert format_currency(10) == "10.00"
     assert format_currency(0) == "0.00"
+
+
+def test_validate_positive_int():
+    assert validate_positive_int("10") == 10
+
+    for value in ("0", "-1", "abc"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            validate_positive_int(value)
+
+
+def test_validate_encoding():
+    assert validate_encoding("latin1") == "latin1"
+
+    with pytest.raises(argparse.ArgumentTypeError) as exc:
+        validate_encoding("not-a-codec")
+
+    assert "Unknown encoding" in str(exc.value)
+
+
+def test_expand_csv_paths_directory_and_glob(tmp_path):
+    for name in ("b.csv", "a.csv", "notes.txt"):
+        (tmp_path / name).write_text("dummy,data")
+
+    expected = [str(tmp_path / "a.csv"), str(tmp_path / "b.csv")]
+
+    assert expand_csv_paths(str(tmp_path)) == expected
+    assert expand_csv_paths(str(tmp_path / "*")) == expected
+    assert expand_csv_paths(str(tmp_path / "a.csv")) == expected[:1]
+
+
+def test_expand_csv_paths_skips_reject_files(tmp_path):
+    (tmp_path / "loja1.csv").write_text("")
+    (tmp_path / "loja1.rejected.csv").write_text("")
+
+    expected = [str(tmp_path / "loja1.csv")]
+    assert expand_csv_paths(str(tmp_path)) == expected
+    assert expand_csv_paths(str(tmp_path / "*.csv")) == expected
+
+
+def test_expand_csv_paths_no_matches(tmp_path):
+    with pytest.raises(argparse.ArgumentTypeError) as exc:
+        expand_csv_paths(str(tmp_path / "*.csv"))
+
+    assert "No CSV files found" in str(exc.value)
+
+
+def test_data_validation_error_keeps_failures_when_pickled():
+    error = DataValidationError("[ERROR] bad", [(1, "quantidade", "x")], False)
+
+    restored = pickle.loads(pickle.dumps(error))  # noqa: S301
+
+    assert str(restored) == "[ERROR] bad"
+    assert restored.failures == [(1, "quantidade", "x")]
+    assert restored.complete is False
+
+
+@pytest.mark.parametrize(
+    ("count", "complete", "footer"),
+    [
+        (2, True, "..."),
+        (3, True, "... and 1 more"),
+        (1, False, "... more errors may exist (validation stopped early)"),
+        (2, False, "... more errors may exist (validation stopped early)"),
+        (5, False, "... more errors may exist (validation stopped early)"),
+    ],
+)
+def test_format_validation_failures_footer(count, complete, footer):
+    failures = [(row, "quantidade", "bad") for row in range(1, count + 1)]
+
+    message = format_validation_failures(failures, max_errors=2, complete=complete)
+
+    assert message.splitlines()[-1] == footer
+    assert "at least" not in message
@@ -2,10 +2,10 @@ import pandas as pd
 import pytest
 
 from tests.mocks.fake_pandera_model import FakePanderaModel
-from vendas_cli.helpers import validate_data
+from vendas_cli.helpers import DataValidationError, validate_data
 
 
-def test_validate_data_raises_systemexit_and_formats_errors():
+def test_validate_data_raises_and_formats_errors():
     df = pd.DataFrame(
         {
             "produto": ["", "Item", "Item"],
@@ -15,7 +15,7 @@ def test_validate_data_raises_systemexit_and_formats_errors():
         }
     )
 
-    with pytest.raises(SystemExit) as exc:
+    with pytest.raises(DataValidationError) as exc:
         validate_data(df, FakePanderaModel)
 
     message = str(exc.value)
@@ -36,7 +36,7 @@ def test_validate_data_raises_missing_column_error():
         }
     )
 
-    with pytest.raises(SystemExit) as exc:
+    with pytest.raises(DataValidationError) as exc:
         validate_data(df, FakePanderaModel)
 
     message = str(exc.value)
@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+from vendas_cli import incremental
+from vendas_cli.core import compute_report
+from vendas_cli.helpers import DataValidationError
+from vendas_cli.incremental import compute_report_incremental, update_daily_aggregates
+from vendas_cli.parser import load_csv
+
+HEADER = "produto,quantidade,preco_unitario,data\n"
+
+
+def test_incremental_matches_full_report(tmp_path):
+    csv_path = tmp_path / "log.csv"
+    state_path = tmp_path / "state.json"
+    csv_path.write_text(HEADER + "A,2,10,2025-01-10\nB,1,5,2025-01-11\n")
+
+    compute_report_incremental(str(csv_path), str(state_path))
+
+    with csv_path.open("a") as file:
+        file.write("A,3,10,2025-01-12\nC,4,2.5,2025-02-01\n")
+
+    summary = compute_report_incremental(
+        str(csv_path), str(state_path), start="2025-01-01", end="2025-01-31"
+    )
+    expected = compute_report(
+        load_csv(str(csv_path)), start="2025-01-01", end="2025-01-31"
+    )
+
+    assert summary == expected
+    assert json.loads(state_path.read_text())["rows"] == 4
+
+
+def test_incremental_parses_only_appended_rows(tmp_path, monkeypatch, caplog):
+    csv_path = tmp_path / "log.csv"
+    state_path = tmp_path / "state.json"
+    csv_path.write_text(HEADER + "A,2,10,2025-01-10\n")
+    update_daily_aggregates(str(csv_path), str(state_path))
+
+    with csv_path.open("a") as file:
+        file.write("B,1,5,2025-01-11\nC,9,")
+
+    seen = []
+    original = incremental.iter_byte_range_chunks
+
+    def spy(csv_path, byte_range, *args, **kwargs):
+        seen.append(byte_range)
+        return original(csv_path, byte_range, *args, **kwargs)
+
+    monkeypatch.setattr(incremental, "iter_byte_range_chunks", spy)
+    with caplog.at_level("WARNING"):
+        daily = update_daily_aggregates(str(csv_path), str(state_path))
+
+    start = len(HEADER + "A,2,10,2025-01-10\n")
+    end = start + len("B,1,5,2025-01-11\n")
+    assert seen == [(start, end), (end, end + len("C,9,"))]
+    assert sorted(daily.index.get_level_values("produto")) == ["A", "B"]
+    assert json.loads(state_path.read_text())["offset"] == end
+    assert any("unterminated last row" in message for message in caplog.messages)
+
+
+def test_incremental_reports_unterminated_last_row(tmp_path, caplog):
+    csv_path = tmp_path / "log.csv"
+    state_path = tmp_path / "state.json"
+    csv_path.write_text(HEADER + "A,2,10,2025-01-10\nB,1,2.5,2025-01-11")
+
+    first = compute_report_incremental(str(csv_path), str(state_path))
+    assert first == compute_report(load_csv(str(csv_path)))
+    assert json.loads(state_path.read_text())["rows"] == 1
+
+    with csv_path.open("a") as file:
+        file.write("\nC,1,1,2025-01-12\n")
+
+    second = compute_report_incremental(str(csv_path), str(state_path))
+    assert second == compute_report(load_csv(str(csv_path)))
+    assert json.loads(state_path.read_text())["rows"] == 3
+    assert "Skipped the unterminated" not in caplog.text
+
+
+def test_incremental_rebuilds_rewritten_file(tmp_path):
+    csv_path = tmp_path / "log.csv"
+    state_path = tmp_path / "state.json"
+    csv_path.write_text(HEADER + "A,2,10,2025-01-10\nB,1,5,2025-01-11\n")
+    update_daily_aggregates(str(csv_path), str(state_path))
+
+    csv_path.write_text(HEADER + "Z,1,1,2025-01-10\n")
+    daily = update_daily_aggregates(str(csv_path), str(state_path))
+
+    assert daily.index.get_level_values("produto").tolist() == ["Z"]
+
+
+def test_incremental_reports_global_row_numbers(tmp_path):
+    csv_path = tmp_path / "log.csv"
+    state_path = tmp_path / "state.json"
+    csv_path.write_text(HEADER + "A,2,10,2025-01-10\nB,1,5,2025-01-11\n")
+    update_daily_aggregates(str(csv_path), str(state_path))
+
+    with csv_path.open("a") as file:
+        file.write("C,-1,5,2025-01-12\n")
+
+    with pytest.raises(DataValidationError) as exc:
+        update_daily_aggregates(str(csv_path), str(state_path))
+
+    assert "Row 3: invalid value '-1' in column 'quantidade'" in str(exc.value)
+    assert json.loads(state_path.read_text())["rows"] == 2
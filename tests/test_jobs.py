@@ -0,0 +1,132 @@
+import json
+import sys
+
+import pytest
+
+from vendas_cli.cli import main
+from vendas_cli.core import aggregate_by_day, compute_report
+from vendas_cli.jobs import load_jobs, run_jobs
+from vendas_cli.output import render_output
+
+
+def write_jobs(tmp_path, jobs):
+    jobs_path = tmp_path / "jobs.json"
+    jobs_path.write_text(json.dumps(jobs))
+    return str(jobs_path)
+
+
+def test_load_jobs(tmp_path):
+    jobs = load_jobs(
+        write_jobs(
+            tmp_path,
+            [{"start": "2025-01-01", "end": "2025-01-31", "format": "json"}, {}],
+        )
+    )
+
+    assert str(jobs[0].start) == "2025-01-01"
+    assert jobs[0].format == "json"
+    assert jobs[1].start is None and jobs[1].output is None
+
+
+@pytest.mark.parametrize(
+    ("jobs", "message"),
+    [
+        ([{"start": "2025-01-01"}], "start and end must be provided together"),
+        ([{"start": "2025-02-01", "end": "2025-01-01"}], "cannot be after end"),
+        ([{"format": "xml"}], "format"),
+        ([{"outptu": "a.txt"}], "outptu"),
+        ([], "does not list any report"),
+    ],
+)
+def test_load_jobs_rejects_invalid_specs(tmp_path, jobs, message):
+    with pytest.raises(ValueError, match=message):
+        load_jobs(write_jobs(tmp_path, jobs))
+
+
+def test_load_jobs_rejects_invalid_json(tmp_path):
+    jobs_path = tmp_path / "jobs.json"
+    jobs_path.write_text("[{")
+
+    with pytest.raises(ValueError, match="Invalid jobs file"):
+        load_jobs(str(jobs_path))
+
+
+def test_run_jobs_matches_single_reports(df_sample, tmp_path):
+    output_path = tmp_path / "january.json"
+    jobs = load_jobs(
+        write_jobs(
+            tmp_path,
+            [
+                {
+                    "start": "2025-01-01",
+                    "end": "2025-01-15",
+                    "output": str(output_path),
+                },
+                {"format": "json"},
+                {"start": "2024-01-01", "end": "2024-12-31"},
+            ],
+        )
+    )
+
+    printed = run_jobs(aggregate_by_day(df_sample), jobs, default_format="json")
+
+    expected = [
+        render_output(compute_report(df_sample, start, end), "json")
+        for start, end in [
+            ("2025-01-01", "2025-01-15"),
+            (None, None),
+            ("2024-01-01", "2024-12-31"),
+        ]
+    ]
+    assert output_path.read_text() == expected[0] + "\n"
+    assert printed == expected[1:]
+
+
+def test_cli_jobs(monkeypatch, capsys, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10\nB,1,5,2025-02-11"
+    )
+    report_path = tmp_path / "february.txt"
+    jobs_path = write_jobs(
+        tmp_path,
+        [
+            {"start": "2025-02-01", "end": "2025-02-28", "output": str(report_path)},
+            {},
+        ],
+    )
+
+    monkeypatch.setattr(sys, "argv", ["vendas-cli", str(csv_path), "--jobs", jobs_path])
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    assert exc.value.code == 0
+    assert "TOTAL SALES: 25.00" in capsys.readouterr().out
+    assert "TOTAL SALES: 5.00" in report_path.read_text()
+
+
+def test_cli_jobs_rejects_date_filter(monkeypatch, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10")
+    jobs_path = write_jobs(tmp_path, [{}])
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "vendas-cli",
+            str(csv_path),
+            "--jobs",
+            jobs_path,
+            "--start",
+            "2025-01-01",
+            "--end",
+            "2025-01-31",
+        ],
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    assert exc.value.code == 2
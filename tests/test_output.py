@@ -1,7 +1,13 @@
+import io
 import json
+import sys
 from datetime import date
 
-from vendas_cli.output import render_output
+import pandas as pd
+import pytest
+
+from vendas_cli import output
+from vendas_cli.output import export_totals, iter_output, render_output, write_output
 from vendas_cli.schemas import ProductTotal, ReportFilters, SalesSummary
 
 
@@ -43,3 +49,95 @@ def test_render_output_empty_list():
 
     output = render_output(summary, output_format="text")
     assert "NO ITEMS FOUND IN THIS PERIOD" in output
+
+
+@pytest.mark.parametrize(
+    "summary",
+    [
+        make_summary(),
+        SalesSummary(
+            valor_total=1e16,
+            produto_mais_vendido='Calça "slim" \\ ✓',
+            totais_por_produto=[
+                ProductTotal(
+                    produto='Calça "slim" \\ ✓', quantidade_total=2, total_vendas=0.1
+                )
+            ],
+        ),
+        SalesSummary(valor_total=0, produto_mais_vendido="", totais_por_produto=[]),
+    ],
+)
+def test_streamed_json_matches_json_dumps(summary):
+    expected = json.dumps(
+        summary.model_dump(mode="json", exclude_none=True),
+        ensure_ascii=False,
+        indent=2,
+    )
+
+    assert render_output(summary, output_format="json") == expected
+
+
+@pytest.mark.parametrize("output_format", ["text", "json", "ndjson"])
+def test_write_output_streams_render_output(output_format):
+    summary = make_summary()
+    file = io.StringIO()
+
+    write_output(summary, output_format, file)
+
+    assert file.getvalue() == render_output(summary, output_format) + "\n"
+    assert len(list(iter_output(summary, output_format))) > 1
+
+
+@pytest.mark.parametrize("without_orjson", [False, True])
+def test_render_output_ndjson(monkeypatch, without_orjson):
+    if without_orjson:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.setattr(output, "_encode_line", output._load_line_encoder())
+
+    lines = render_output(make_summary(), output_format="ndjson").splitlines()
+
+    assert [json.loads(line) for line in lines] == [
+        {
+            "valor_total": 55.0,
+            "produto_mais_vendido": "A",
+            "filtros": {"start": "2025-01-01", "end": "2025-12-31"},
+        },
+        {"produto": "A", "quantidade_total": 5, "total_vendas": 50.0},
+        {"produto": "B", "quantidade_total": 1, "total_vendas": 5.0},
+    ]
+
+
+def make_aggregate():
+    return pd.DataFrame(
+        {"quantidade_total": [5, 1], "total_centavos": [5000, 550]},
+        index=pd.Index(["A", "Calça"], name="produto"),
+    )
+
+
+def test_export_totals_csv():
+    file = io.BytesIO()
+
+    export_totals(make_aggregate(), "csv", file)
+
+    assert file.getvalue().decode("utf-8").splitlines() == [
+        "produto,quantidade_total,total_vendas",
+        "A,5,50.0",
+        "Calça,1,5.5",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("export_format", "reader"),
+    [("parquet", pd.read_parquet), ("arrow", pd.read_feather)],
+)
+def test_export_totals_binary(export_format, reader):
+    pytest.importorskip("pyarrow")
+    file = io.BytesIO()
+
+    export_totals(make_aggregate(), export_format, file)
+    file.seek(0)
+    table = reader(file)
+
+    assert table["produto"].tolist() == ["A", "Calça"]
+    assert table["quantidade_total"].dtype == "int64"
+    assert table["total_vendas"].tolist() == [50.0, 5.5]
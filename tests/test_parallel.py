@@ -0,0 +1,116 @@
+import pytest
+
+from vendas_cli.core import aggregate_by_day, compute_report
+from vendas_cli.helpers import DataValidationError
+from vendas_cli.parallel import (
+    aggregate_byte_range,
+    aggregate_files,
+    aggregate_files_by_day,
+    aggregate_split_file,
+    compute_report_files,
+)
+from vendas_cli.parser import load_csv, split_byte_ranges
+
+HEADER = "produto,quantidade,preco_unitario,data\n"
+
+
+@pytest.fixture
+def store_files(tmp_path):
+    first = tmp_path / "loja1.csv"
+    first.write_text(HEADER + "A,2,10,2025-01-10\nB,1,5,2025-02-01\n")
+    second = tmp_path / "loja2.csv"
+    second.write_text(HEADER + "A,3,10,2025-01-15\nC,4,2.5,2025-03-01\n")
+    combined = tmp_path / "combined.csv"
+    combined.write_text(
+        HEADER
+        + "A,2,10,2025-01-10\nB,1,5,2025-02-01\n"
+        + "A,3,10,2025-01-15\nC,4,2.5,2025-03-01\n"
+    )
+    return [str(first), str(second)], str(combined)
+
+
+def test_compute_report_files_matches_single_file(store_files):
+    paths, combined = store_files
+
+    summary = compute_report_files(
+        paths, start="2025-01-01", end="2025-02-28", workers=1
+    )
+    expected = compute_report(load_csv(combined), start="2025-01-01", end="2025-02-28")
+
+    assert summary == expected
+
+
+def test_aggregate_files_process_pool(store_files):
+    paths, _ = store_files
+
+    aggregated = aggregate_files(paths, workers=2).sort_index()
+
+    assert aggregated.index.tolist() == ["A", "B", "C"]
+    assert aggregated["quantidade_total"].tolist() == [5, 1, 4]
+
+
+def test_aggregate_files_prefixes_errors_with_path(tmp_path):
+    good = tmp_path / "good.csv"
+    good.write_text(HEADER + "A,2,10,2025-01-10\n")
+    bad = tmp_path / "bad.csv"
+    bad.write_text(HEADER + "A,-2,10,2025-01-10\n")
+
+    with pytest.raises(DataValidationError) as exc:
+        aggregate_files([str(good), str(bad)], workers=1)
+
+    assert str(exc.value).startswith(f"{bad}: [ERROR] Data validation failed:")
+
+
+def test_aggregate_split_file_matches_load_csv(store_files):
+    _, combined = store_files
+
+    summary = compute_report_files([combined], workers=3, split=True)
+
+    assert summary == compute_report(load_csv(combined))
+
+
+def test_aggregate_split_file_reports_global_rows(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    rows = [f"P{i},{-1 if i in (3, 40) else 1},10,2025-01-10\n" for i in range(60)]
+    csv_path.write_text(HEADER + "".join(rows))
+
+    with pytest.raises(DataValidationError) as expected:
+        load_csv(str(csv_path))
+
+    with pytest.raises(DataValidationError) as exc:
+        aggregate_split_file(str(csv_path), workers=4)
+
+    assert str(exc.value) == str(expected.value)
+    assert "Row 41:" in str(exc.value)
+
+
+def test_aggregate_split_file_stopped_early_matches_load_csv(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(HEADER + "".join(f"P{i},-1,10,2025-01-10\n" for i in range(60)))
+
+    with pytest.raises(DataValidationError) as expected:
+        load_csv(str(csv_path), max_errors=2)
+
+    with pytest.raises(DataValidationError) as exc:
+        aggregate_split_file(str(csv_path), workers=4, max_errors=2)
+
+    assert str(exc.value) == str(expected.value)
+    assert str(exc.value).endswith("more errors may exist (validation stopped early)")
+
+
+def test_aggregate_byte_range_in_process(store_files):
+    _, combined = store_files
+    byte_range = split_byte_ranges(combined, parts=1)[0]
+
+    aggregated = aggregate_byte_range(combined, byte_range, encoding="utf-8")
+
+    assert aggregated.loc["A", "quantidade_total"] == 5
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_aggregate_files_by_day_matches_single_file(store_files, workers):
+    paths, combined = store_files
+
+    daily = aggregate_files_by_day(paths, workers=workers, chunk_size=1)
+
+    assert daily.sort_index().equals(aggregate_by_day(load_csv(combined)))
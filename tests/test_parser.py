@@ -1,4 +1,15 @@
-from vendas_cli.parser import load_csv
+import pandas as pd
+import pytest
+
+from vendas_cli.encoding import detect_encoding
+from vendas_cli.helpers import DataValidationError, validate_data
+from vendas_cli.parser import (
+    count_rows_before,
+    iter_byte_range_chunks,
+    iter_csv_chunks,
+    load_csv,
+    split_byte_ranges,
+)
 
 
 def test_load_csv_utf8(tmp_path):
@@ -25,3 +36,400 @@ def test_load_csv_fallback_latin(tmp_path, caplog):
             pass
 
     assert any("falling back to latin1" in message for message in caplog.messages)
+
+
+def test_iter_csv_chunks_keeps_global_row_index(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "Produto,quantidade,preco_unitario,data\n"
+        "A,2,10,2025-01-10\n"
+        "B,1,5,2025-01-11\n"
+        "\n"
+        "A,3,10,2025-01-12\n",
+        encoding="utf-8",
+    )
+
+    chunks = list(iter_csv_chunks(str(csv_path), chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert list(chunks[1].index) == [2]
+    assert list(chunks[0].columns) == [
+        "produto",
+        "quantidade",
+        "preco_unitario",
+        "data",
+    ]
+
+
+def test_iter_csv_chunks_reports_global_row_numbers(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\n"
+        "A,2,10,2025-01-10\n"
+        "B,1,5,2025-01-11\n"
+        "C,-1,5,2025-01-11\n",
+        encoding="utf-8",
+    )
+
+    with pytest.raises(DataValidationError) as exc:
+        list(iter_csv_chunks(str(csv_path), chunk_size=2))
+
+    assert "Row 3: invalid value '-1' in column 'quantidade'" in str(exc.value)
+
+
+def test_iter_csv_chunks_fallback_latin(tmp_path, caplog):
+    csv_path = tmp_path / "data_latin.csv"
+    csv_path.write_bytes(
+        "produto,quantidade,preco_unitario,data\nÁ,1,10,2025-01-10".encode("latin1")
+    )
+
+    with caplog.at_level("WARNING"):
+        chunks = list(iter_csv_chunks(str(csv_path), chunk_size=10, encoding="utf-8"))
+
+    assert chunks[0]["produto"].tolist() == ["Á"]
+    assert any("falling back to latin1" in message for message in caplog.messages)
+
+
+def test_load_csv_typed_columns(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10\nB,1,5.5,2025-01-11"
+    )
+
+    df = load_csv(str(csv_path))
+
+    assert df["quantidade"].dtype == "int64"
+    assert df["preco_unitario"].dtype == "float64"
+    assert pd.api.types.is_datetime64_any_dtype(df["data"])
+
+
+def test_load_csv_dictionary_encodes_repeated_values(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\n"
+        "B,1,5,2025-01-11\n"
+        "A,2,10,2025-01-10T08:30:00\n"
+        "B,3,5,2025-01-10\n"
+        "A,1,10,2025-01-11\n"
+    )
+
+    df = load_csv(str(csv_path))
+
+    assert isinstance(df["produto"].dtype, pd.CategoricalDtype)
+    assert df["produto"].cat.categories.tolist() == ["A", "B"]
+    assert df["produto"].tolist() == ["A", "B", "B", "A"]
+    assert (
+        df["data"].tolist()
+        == [pd.Timestamp(2025, 1, 10)] * 2 + [pd.Timestamp(2025, 1, 11)] * 2
+    )
+
+
+def test_load_csv_rejects_missing_date(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10\nB,1,5,\n"
+    )
+
+    with pytest.raises(DataValidationError) as exc:
+        load_csv(str(csv_path))
+
+    assert "Row 2" in str(exc.value)
+
+
+def test_load_csv_non_iso_dates_use_text_fallback(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\nA,2,10,Jan 10 2025\nB,1,5,Jan 11 2025"
+    )
+
+    df = load_csv(str(csv_path))
+
+    assert df["data"].tolist() == [pd.Timestamp(2025, 1, 10), pd.Timestamp(2025, 1, 11)]
+    assert df["quantidade"].dtype == "int64"
+
+
+def test_load_csv_reports_raw_values_on_invalid_rows(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10\nB,1,-5,2025-01-11"
+    )
+
+    with pytest.raises(DataValidationError) as exc:
+        load_csv(str(csv_path))
+
+    assert "Row 2: invalid value '-5.0' in column 'preco_unitario'" in str(exc.value)
+
+
+def test_load_csv_rejects_non_finite_prices(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10\nB,1,inf,2025-01-11"
+    )
+
+    with pytest.raises(DataValidationError) as exc:
+        load_csv(str(csv_path))
+
+    assert "Row 2: validation error in column 'preco_unitario': inf" in str(exc.value)
+
+
+@pytest.mark.parametrize(
+    ("row", "message"),
+    [
+        (
+            "A,1,100000000000000000,2025-01-10",
+            "Row 2: quantidade × preco_unitario exceeds the maximum sale value",
+        ),
+        (
+            "A,100000000000,1000000000.00,2025-01-10",
+            "Row 2: quantidade × preco_unitario exceeds the maximum sale value",
+        ),
+        (
+            "A,3,0.333,2025-01-10",
+            "Row 2: invalid value '0.333' in column 'preco_unitario' — more than "
+            "two decimal places.",
+        ),
+    ],
+)
+def test_load_csv_rejects_inexact_sale_values(tmp_path, row, message):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        f"produto,quantidade,preco_unitario,data\nB,1,5,2025-01-10\n{row}"
+    )
+
+    with pytest.raises(DataValidationError) as exc:
+        load_csv(str(csv_path))
+
+    assert message in str(exc.value)
+    assert str(exc.value).count("Row 2") == 1
+
+
+@pytest.mark.parametrize("quantity", ["1.0", "1.00000", "1e3", "True"])
+@pytest.mark.parametrize("chunk_size", [None, 1])
+def test_load_csv_rejects_non_integer_quantities(tmp_path, quantity, chunk_size):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        f"produto,quantidade,preco_unitario,data\nB,1,5,2025-01-10\n"
+        f"A,{quantity},10,2025-01-10\n"
+    )
+
+    with pytest.raises(DataValidationError) as exc:
+        if chunk_size:
+            list(iter_csv_chunks(str(csv_path), chunk_size=chunk_size))
+        else:
+            load_csv(str(csv_path))
+
+    assert f"Row 2: invalid value '{quantity}' in column 'quantidade'" in str(exc.value)
+
+
+def test_detect_encoding(tmp_path):
+    utf8_path = tmp_path / "utf8.csv"
+    utf8_path.write_text("produto\nÁ", encoding="utf-8")
+    bom_path = tmp_path / "bom.csv"
+    bom_path.write_text("produto\nA", encoding="utf-8-sig")
+    latin_path = tmp_path / "latin.csv"
+    latin_path.write_bytes("produto\nÁ".encode("latin1"))
+
+    assert detect_encoding(str(utf8_path)) == "utf-8"
+    assert detect_encoding(str(bom_path)) == "utf-8-sig"
+    assert detect_encoding(str(latin_path)) == "latin1"
+
+
+def test_detect_encoding_ignores_truncated_multibyte_sample(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("produto\nÁ", encoding="utf-8")
+
+    assert detect_encoding(str(csv_path), sample_size=len("produto\n") + 1) == "utf-8"
+
+
+def test_load_csv_detects_latin_once(tmp_path, caplog):
+    csv_path = tmp_path / "data_latin.csv"
+    csv_path.write_bytes(
+        "produto,quantidade,preco_unitario,data\nÁ,1,10,2025-01-10".encode("latin1")
+    )
+
+    with caplog.at_level("INFO"):
+        df = load_csv(str(csv_path))
+
+    assert df["produto"].tolist() == ["Á"]
+    assert any("Detected encoding 'latin1'" in message for message in caplog.messages)
+    assert not any("falling back" in message for message in caplog.messages)
+
+
+def test_iter_csv_chunks_undecodable_tail(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(
+        b"produto,quantidade,preco_unitario,data\n"
+        + b"A,1,10,2025-01-10\n" * 5
+        + "\u00c1,1,10,2025-01-10\n".encode("latin1")
+    )
+
+    with pytest.raises(ValueError, match="Use --encoding"):
+        list(iter_csv_chunks(str(csv_path), chunk_size=2, encoding="utf-8"))
+
+
+def test_split_byte_ranges_cover_all_rows(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    rows = [f"P{i},1,10,2025-01-{i % 28 + 1:02d}\r\n" for i in range(50)]
+    csv_path.write_bytes(
+        ("produto,quantidade,preco_unitario,data\r\n" + "".join(rows)).encode()
+    )
+
+    ranges = split_byte_ranges(str(csv_path), parts=4)
+    frames = [
+        df
+        for byte_range in ranges
+        for df in iter_byte_range_chunks(str(csv_path), byte_range, encoding="utf-8")
+    ]
+
+    assert len(ranges) == 4
+    assert ranges[0][0] == len(b"produto,quantidade,preco_unitario,data\r\n")
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:], strict=False))
+    assert [p for df in frames for p in df["produto"]] == [f"P{i}" for i in range(50)]
+
+
+def test_iter_byte_range_chunks_row_offset(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\n"
+        "A,2,10,2025-01-10\n"
+        "\n"
+        "B,x,5,2025-01-11\n"
+    )
+    byte_range = split_byte_ranges(str(csv_path), parts=1)[0]
+    second_row = len("produto,quantidade,preco_unitario,data\nA,2,10,2025-01-10\n\n")
+
+    assert count_rows_before(str(csv_path), second_row) == 1
+
+    with pytest.raises(DataValidationError) as exc:
+        list(
+            iter_byte_range_chunks(
+                str(csv_path), (second_row, byte_range[1]), "utf-8", row_offset=1
+            )
+        )
+
+    assert "Row 2: invalid value 'x' in column 'quantidade'" in str(exc.value)
+
+
+def test_load_csv_sorts_by_date(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\n"
+        "A,1,10,2025-01-12\nB,1,10,2025-01-10\nC,1,10,2025-01-12\n"
+    )
+
+    df = load_csv(str(csv_path))
+
+    assert df["produto"].tolist() == ["B", "A", "C"]
+    assert df.index.tolist() == [1, 0, 2]
+
+
+def test_load_csv_stops_after_max_errors(tmp_path, monkeypatch):
+    monkeypatch.setattr("vendas_cli.parser._TEXT_CHUNK_SIZE", 2)
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\n"
+        + "".join(f"P{i},-1,5,2025-01-10\n" for i in range(10))
+    )
+
+    with pytest.raises(DataValidationError) as exc:
+        load_csv(str(csv_path), max_errors=3)
+
+    message = str(exc.value)
+    assert not exc.value.complete
+    assert len(exc.value.failures) == 4
+    assert "Row 3: invalid value '-1'" in message
+    assert "Row 4:" not in message
+    assert message.endswith("... more errors may exist (validation stopped early)")
+
+
+def test_load_csv_validates_a_small_leading_frame(tmp_path, monkeypatch):
+    validated = []
+
+    def counting_validate(df, schema):
+        validated.append(len(df))
+        return validate_data(df, schema)
+
+    monkeypatch.setattr("vendas_cli.parser.validate_data", counting_validate)
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\n"
+        + "".join(f"P{i},1,5,2025-01-10\n" for i in range(3_500))
+        + "".join(f"P{i},-1,5,2025-01-10\n" for i in range(20_000))
+    )
+
+    with pytest.raises(DataValidationError) as exc:
+        load_csv(str(csv_path), max_errors=5)
+
+    assert not exc.value.complete
+    assert exc.value.failures[0][0] == 3_501
+    assert validated == [1_000, 2_000, 4_000]
+
+
+def test_iter_csv_chunks_collects_errors_across_chunks(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\n"
+        "A,-1,10,2025-01-10\n"
+        "B,1,5,2025-01-11\n"
+        "C,-1,5,2025-01-11\n"
+    )
+
+    with pytest.raises(DataValidationError) as exc:
+        list(iter_csv_chunks(str(csv_path), chunk_size=2, max_errors=5))
+
+    assert exc.value.complete
+    assert [row for row, _, _ in exc.value.failures] == [1, 3]
+
+
+def test_load_csv_quarantines_invalid_rows(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    reject_path = tmp_path / "rejected.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\n"
+        "A,2,10,2025-01-10\n"
+        "B,-1,5,2025-01-11\n"
+        "C,x,,2025-01-12\n"
+        "D,1,5,2025-01-13\n"
+    )
+
+    df = load_csv(str(csv_path), reject_path=str(reject_path))
+
+    assert df["produto"].tolist() == ["A", "D"]
+    assert df["quantidade"].dtype == "int64"
+    assert df.attrs["invalid_products"]["total_invalid"] == 2
+
+    rejected = pd.read_csv(reject_path, dtype=str, keep_default_na=False)
+    assert rejected["linha"].tolist() == ["2", "3"]
+    assert rejected["quantidade"].tolist() == ["-1", "x"]
+    assert "negative" in rejected["erros"][0]
+    assert "'preco_unitario'" in rejected["erros"][1]
+    assert "'quantidade'" in rejected["erros"][1]
+
+
+def test_iter_csv_chunks_quarantines_invalid_rows(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    reject_path = tmp_path / "rejected.csv"
+    csv_path.write_text(
+        "produto,quantidade,preco_unitario,data\n"
+        "A,-2,10,2025-01-10\n"
+        "B,1,5,2025-01-11\n"
+        "C,-1,5,2025-01-11\n"
+    )
+
+    chunks = list(
+        iter_csv_chunks(str(csv_path), chunk_size=2, reject_path=str(reject_path))
+    )
+
+    assert [chunk["produto"].tolist() for chunk in chunks] == [["B"], []]
+    rejected = pd.read_csv(reject_path)
+    assert rejected["linha"].tolist() == [1, 3]
+
+
+@pytest.mark.parametrize("quarantine", [False, True])
+def test_load_csv_missing_column_is_not_a_row_failure(tmp_path, quarantine):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("produto,quantidade,preco_unitario\nA,1,10\n")
+    reject_path = str(tmp_path / "rejects.csv") if quarantine else None
+
+    with pytest.raises(DataValidationError, match="Missing required column"):
+        load_csv(str(csv_path), reject_path=reject_path)
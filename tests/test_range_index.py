@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vendas_cli.core import compute_report
+from vendas_cli.range_index import PrefixSumIndex
+
+
+@pytest.fixture
+def df_random():
+    rng = np.random.default_rng(7)
+    days = pd.date_range("2025-01-01", "2025-03-31")
+    return pd.DataFrame(
+        {
+            "produto": rng.choice(list("ABCDEFG"), size=500),
+            "quantidade": rng.integers(0, 5, size=500),
+            "preco_unitario": rng.integers(100, 5000, size=500) / 100,
+            "data": rng.choice(days, size=500),
+        }
+    )
+
+
+def test_prefix_sum_index_matches_compute_report(df_random):
+    index = PrefixSumIndex.from_frame(df_random)
+    rng = np.random.default_rng(11)
+    days = pd.date_range("2024-12-25", "2025-04-05").strftime("%Y-%m-%d")
+
+    windows = [(None, None), ("2024-01-01", "2024-12-31"), ("2025-03-31", "2026-01-01")]
+    windows += [tuple(sorted(rng.choice(days, size=2))) for _ in range(30)]
+
+    for start, end in windows:
+        assert index.report(start, end) == compute_report(df_random, start, end)
+
+
+def test_prefix_sum_index_single_day(df_sample):
+    index = PrefixSumIndex.from_frame(df_sample)
+
+    summary = index.report("2025-01-15", "2025-01-15")
+
+    assert summary.valor_total == 30.0
+    assert [t.produto for t in summary.totais_por_produto] == ["A"]
+
+
+def test_prefix_sum_index_empty_frame(df_sample):
+    index = PrefixSumIndex.from_frame(df_sample.iloc[:0])
+
+    assert index.report().totais_por_produto == []
@@ -0,0 +1,117 @@
+import os
+import sys
+import threading
+
+import pytest
+
+from vendas_cli.cli import main
+from vendas_cli.client import request_report
+from vendas_cli.helpers import DataValidationError
+from vendas_cli.server import DatasetStore, make_server
+
+HEADER = "produto,quantidade,preco_unitario,data\n"
+
+
+@pytest.fixture
+def server():
+    store = DatasetStore()
+    httpd = make_server(store, port=0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _cli_output(monkeypatch, capsys, argv):
+    monkeypatch.setattr(sys, "argv", ["vendas-cli", *argv])
+    with pytest.raises(SystemExit) as exc:
+        main()
+    return exc.value.code, str(exc.value), capsys.readouterr().out
+
+
+def test_dataset_store_reloads_changed_file(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(f"{HEADER}A,2,10,2025-01-10\n")
+    store = DatasetStore()
+
+    dataset = store.dataset(str(csv_path))
+    assert store.dataset(str(csv_path)) is dataset
+
+    csv_path.write_text(f"{HEADER}A,2,10,2025-01-10\nB,1,5,2025-01-11\n")
+    os.utime(csv_path, ns=(0, 1))
+
+    totals = store.dataset(str(csv_path)).totals("2025-01-11", "2025-01-11")
+    assert [total.produto for total in totals] == ["B"]
+
+
+def test_dataset_store_evicts_least_recently_used(tmp_path):
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.csv"
+        path.write_text(f"{HEADER}{name.upper()},1,1,2025-01-10\n")
+        paths.append(str(path))
+    store = DatasetStore(max_datasets=2)
+
+    first = store.dataset(paths[0])
+    second = store.dataset(paths[1])
+    assert store.dataset(paths[0]) is first
+    store.dataset(paths[2])
+
+    assert store.dataset(paths[0]) is first
+    assert store.dataset(paths[1]) is not second
+
+
+def test_dataset_store_keeps_validation_error(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(f"{HEADER}A,x,10,2025-01-10\n")
+    store = DatasetStore()
+
+    with pytest.raises(DataValidationError) as first:
+        store.dataset(str(csv_path))
+    with pytest.raises(DataValidationError) as second:
+        store.dataset(str(csv_path))
+
+    assert first.value is second.value
+
+
+@pytest.mark.parametrize("output_format", ["text", "json"])
+def test_query_matches_cli(monkeypatch, capsys, tmp_path, server, output_format):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(f"{HEADER}B,1,5.5,2025-01-11\nA,2,10,2025-01-10\n")
+    dates = ["--start", "2025-01-10", "--end", "2025-01-10"]
+    options = ["--format", output_format, *dates]
+
+    expected = _cli_output(monkeypatch, capsys, [str(csv_path), "--no-cache", *options])
+    port = ["--port", str(server.server_port)]
+
+    assert (
+        _cli_output(monkeypatch, capsys, ["query", str(csv_path), *options, *port])
+        == expected
+    )
+
+
+def test_query_reports_validation_errors(monkeypatch, capsys, tmp_path, server):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(f"{HEADER}A,x,10,2025-01-10\n")
+
+    expected = _cli_output(monkeypatch, capsys, [str(csv_path), "--no-cache"])
+    port = ["--port", str(server.server_port)]
+
+    assert _cli_output(monkeypatch, capsys, ["query", str(csv_path), *port]) == expected
+
+
+def test_server_rejects_invalid_request(tmp_path, server):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(f"{HEADER}A,2,10,2025-01-10\n")
+
+    with pytest.raises(ValueError, match="Invalid format"):
+        request_report(str(csv_path), output_format="xml", port=server.server_port)
+
+
+def test_request_report_without_server(tmp_path):
+    with make_server(DatasetStore(), port=0) as unused:
+        port = unused.server_port
+
+    with pytest.raises(ValueError, match="Cannot reach a vendas-cli server"):
+        request_report(str(tmp_path / "data.csv"), port=port)
@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from vendas_cli.cli import main
+from vendas_cli.core import compute_report
+from vendas_cli.parser import load_csv
+from vendas_cli.stream import StreamFallback, compute_report_stream
+
+
+def test_compute_report_stream_latin1(tmp_path, sales_csv):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(Path(sales_csv).read_text(encoding="utf-8").encode("latin1"))
+
+    summary = compute_report_stream(str(csv_path), encoding="utf-8")
+
+    assert summary == compute_report(load_csv(str(csv_path)))
+
+
+@pytest.mark.parametrize(
+    "row",
+    [
+        "A,-1,10,2025-01-10",
+        "A,1,1e2,2025-01-10",
+        "A,1,10,Jan 10 2025",
+        "A,1,10",
+        "A,1,nan,2025-01-10",
+    ],
+)
+def test_compute_report_stream_falls_back(tmp_path, row):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(f"produto,quantidade,preco_unitario,data\n{row}\n")
+
+    with pytest.raises(StreamFallback):
+        compute_report_stream(str(csv_path))
+
+
+@pytest.mark.parametrize(
+    "rows",
+    ["B,1,5,2025-01-11\nA,2,10,2025-01-10\n", "A,2,10,2025-01-10\nB,-1,5,2025-01-11\n"],
+)
+@pytest.mark.parametrize("output_format", ["text", "json"])
+def test_cli_engines_print_identical_output(
+    monkeypatch, capsys, tmp_path, rows, output_format
+):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(f"produto,quantidade,preco_unitario,data\n{rows}")
+
+    outputs = []
+    for engine in ("pandas", "stream"):
+        argv = ["vendas-cli", str(csv_path), "--engine", engine, "--no-cache"]
+        monkeypatch.setattr(sys, "argv", [*argv, "--format", output_format])
+        with pytest.raises(SystemExit) as exc:
+            main()
+        outputs.append((exc.value.code, str(exc.value), capsys.readouterr().out))
+
+    assert outputs[0] == outputs[1]
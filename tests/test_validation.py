@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vendas_cli.validators.validation import is_valid_typed_frame
+
+
+@pytest.fixture
+def df_typed():
+    return pd.DataFrame(
+        {
+            "produto": pd.Series(["A", "B"], dtype="str"),
+            "quantidade": np.array([2, 0], dtype="int64"),
+            "preco_unitario": np.array([10.0, 0.0], dtype="float64"),
+            "data": pd.to_datetime(["2025-01-10", "2025-01-11"]),
+        }
+    )
+
+
+def test_is_valid_typed_frame_accepts_clean_frame(df_typed):
+    assert is_valid_typed_frame(df_typed)
+
+
+@pytest.mark.parametrize(
+    ("column", "value"),
+    [
+        ("quantidade", -1),
+        ("preco_unitario", -0.01),
+        ("preco_unitario", np.nan),
+        ("preco_unitario", np.inf),
+        ("preco_unitario", 0.333),
+        ("data", pd.NaT),
+    ],
+)
+def test_is_valid_typed_frame_rejects_invalid_values(df_typed, column, value):
+    df_typed.loc[1, column] = value
+
+    assert not is_valid_typed_frame(df_typed)
+
+
+def test_is_valid_typed_frame_rejects_out_of_range_sale_value(df_typed):
+    df_typed.loc[0, "preco_unitario"] = 1e11
+
+    assert not is_valid_typed_frame(df_typed)
+
+
+def test_is_valid_typed_frame_accepts_inexact_float_cents(df_typed):
+    df_typed["preco_unitario"] = [0.29, 99_999_999.99]
+    df_typed["quantidade"] = [3, 100]
+
+    assert is_valid_typed_frame(df_typed)
+
+
+def test_is_valid_typed_frame_rejects_missing_column(df_typed):
+    assert not is_valid_typed_frame(df_typed.drop(columns="data"))
+
+
+def test_is_valid_typed_frame_rejects_untyped_columns(df_typed):
+    assert not is_valid_typed_frame(df_typed.astype({"quantidade": "str"}))
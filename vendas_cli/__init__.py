@@ -1 +1,23 @@
-"""Main package for vendas-cli."""
+"""Main package for vendas-cli.
+
+The in-process API is `vendas_cli.Dataset`; it is imported on first access,
+so running the CLI does not pay for pandas until a report is computed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .dataset import Dataset
+
+__all__ = ["Dataset"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "Dataset":
+        from .dataset import Dataset
+
+        return Dataset
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
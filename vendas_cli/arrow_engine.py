@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import csv
+from datetime import date
+from typing import TYPE_CHECKING
+
+from .encoding import resolve_encoding
+from .engines import (
+    DAY_PATTERN,
+    MAX_SALE_CENTS,
+    PRICE_PATTERN,
+    QUANTITY_PATTERN,
+    SCHEMA_COLUMNS,
+    EngineFallback,
+    normalize_header,
+    summarize_totals,
+)
+from .logger import get_logger
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from .schemas import SalesSummary
+
+logger = get_logger()
+
+
+def _read_table(csv_path: str, encoding: str) -> pa.Table:
+    """Read the schema columns of a CSV file as Arrow string columns.
+
+    Values are kept exactly as written ("" is not null), so they can be
+    checked against the same patterns as the stream engine before casting.
+    Parsing and conversion use Arrow's multithreaded CSV reader.
+    """
+
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    try:
+        with open(csv_path, encoding=encoding, newline="") as file:
+            columns = normalize_header(next(csv.reader(file), []))
+
+        return pa_csv.read_csv(
+            csv_path,
+            read_options=pa_csv.ReadOptions(
+                column_names=columns, skip_rows=1, encoding=encoding
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=dict.fromkeys(columns, pa.string()),
+                include_columns=list(SCHEMA_COLUMNS),
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False,
+            ),
+        )
+    except (UnicodeDecodeError, pa.ArrowInvalid):
+        raise EngineFallback("file") from None
+
+
+def _matches(column: pa.ChunkedArray, pattern: str) -> bool:
+    """Return whether every value of `column` fully matches `pattern`."""
+
+    import pyarrow.compute as pc
+
+    matched = pc.match_substring_regex(column, f"^(?:{pattern})$")
+    return bool(pc.all(matched, min_count=0).as_py())
+
+
+def compute_report_arrow(
+    csv_path: str,
+    start: str | None = None,
+    end: str | None = None,
+    encoding: str | None = None,
+) -> SalesSummary:
+    """Compute the sales report on Apache Arrow columns.
+
+    Ingestion, validation, the date filter and the per-product group-by run
+    as Arrow compute kernels over whole columns, using several threads.
+    Sales values are summed in integer cents like `core.aggregate_by_product`,
+    so the result is identical to
+    `core.compute_report(parser.load_csv(csv_path), start, end)`.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+    encoding : str | None, optional
+        Encoding used to read the CSV. Detected from the file prefix when
+        omitted.
+
+    Returns
+    -------
+    SalesSummary
+        Report over the rows inside the inclusive date range.
+
+    Raises
+    ------
+    EngineFallback
+        If a row is invalid or not in the plain form this engine decodes;
+        the pandas engine should process the file instead.
+    ValueError
+        If `pyarrow` is not installed.
+
+    """
+
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        raise ValueError(
+            "The arrow engine requires pyarrow. Install it with "
+            "`pip install 'vendas-cli[arrow]'`."
+        ) from None
+
+    logger.info(f"Reading CSV into Arrow columns from path: {csv_path}")
+
+    table = _read_table(csv_path, resolve_encoding(csv_path, encoding))
+
+    if not (
+        _matches(table["quantidade"], QUANTITY_PATTERN)
+        and _matches(table["preco_unitario"], PRICE_PATTERN)
+        and _matches(table["data"], DAY_PATTERN)
+    ):
+        raise EngineFallback("rows")
+
+    try:
+        days = pc.cast(table["data"], pa.date32())
+    except pa.ArrowInvalid:
+        raise EngineFallback("dates") from None
+
+    quantities = pc.cast(table["quantidade"], pa.int64())
+    cents = pc.round(pc.multiply(pc.cast(table["preco_unitario"], pa.float64()), 100))
+
+    # Out-of-range rows are checked in float64, before the int64 product
+    # could overflow, and reported by the pandas engine.
+    largest = pc.max(pc.multiply(pc.cast(quantities, pa.float64()), cents)).as_py()
+    if largest is not None and largest > MAX_SALE_CENTS:
+        raise EngineFallback("sale value")
+
+    sales = pa.table(
+        {
+            "produto": table["produto"],
+            "quantidade": quantities,
+            "centavos": pc.multiply(quantities, pc.cast(cents, pa.int64())),
+        }
+    )
+
+    if start and end:
+        in_range = pc.and_(
+            pc.greater_equal(days, pa.scalar(date.fromisoformat(start))),
+            pc.less_equal(days, pa.scalar(date.fromisoformat(end))),
+        )
+        sales = sales.filter(in_range)
+
+    grouped = (
+        sales.group_by("produto")
+        .aggregate([("quantidade", "sum"), ("centavos", "sum")])
+        .sort_by("produto")
+    )
+
+    return summarize_totals(
+        zip(
+            grouped["produto"].to_pylist(),
+            grouped["quantidade_sum"].to_pylist(),
+            grouped["centavos_sum"].to_pylist(),
+            strict=True,
+        ),
+        start,
+        end,
+    )
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import tempfile
+
+import pandas as pd
+
+from .helpers import DEFAULT_MAX_ERRORS
+from .logger import get_logger
+from .parser import load_csv
+
+logger = get_logger()
+
+CACHE_FORMAT_VERSION = 4
+DEFAULT_MAX_CACHE_BYTES = 2 * 1024**3
+
+_CACHE_SUFFIX = ".pkl"
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+def default_cache_dir() -> str:
+    """Return the directory used for cached datasets.
+
+    `VENDAS_CLI_CACHE_DIR` takes precedence, then `$XDG_CACHE_HOME/vendas-cli`,
+    then `~/.cache/vendas-cli`.
+
+    Returns
+    -------
+    str
+        Cache directory path (not necessarily existing yet).
+
+    """
+
+    if cache_dir := os.environ.get("VENDAS_CLI_CACHE_DIR"):
+        return cache_dir
+
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "vendas-cli")
+
+
+def file_fingerprint(
+    csv_path: str,
+    encoding: str | None = None,
+    content_hash: bool = False,
+) -> str:
+    """Build the cache key for a CSV file.
+
+    The key covers the absolute path, size and modification time of the file,
+    the requested encoding and the cache format version. With `content_hash`,
+    a SHA-256 of the file contents is included as well, which catches edits
+    that preserve size and mtime at the cost of reading the file once.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    encoding : str | None, optional
+        Encoding requested for the load, `None` meaning auto-detection.
+    content_hash : bool, optional
+        Whether to hash the file contents into the key.
+
+    Returns
+    -------
+    str
+        Hex digest identifying the validated dataset.
+
+    """
+
+    stat = os.stat(csv_path)
+    key = hashlib.sha256()
+    key.update(
+        (
+            f"{CACHE_FORMAT_VERSION}|{os.path.abspath(csv_path)}|{stat.st_size}|"
+            f"{stat.st_mtime_ns}|{encoding or 'auto'}"
+        ).encode()
+    )
+
+    if content_hash:
+        with open(csv_path, "rb") as file:
+            while block := file.read(_HASH_BLOCK_SIZE):
+                key.update(block)
+
+    return key.hexdigest()
+
+
+def evict_cache(cache_dir: str, max_bytes: int = DEFAULT_MAX_CACHE_BYTES) -> None:
+    """Delete least recently used cache entries until the cache fits `max_bytes`.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Cache directory.
+    max_bytes : int, optional
+        Maximum total size of cached datasets.
+
+    """
+
+    entries = []
+    with os.scandir(cache_dir) as scan:
+        for entry in scan:
+            if entry.is_file() and entry.name.endswith(_CACHE_SUFFIX):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+        total -= size
+
+
+def _discard_entry(entry_path: str, reason: object) -> None:
+    """Remove a cache entry that cannot be used."""
+
+    logger.warning(f"Ignoring unreadable cache entry {entry_path}: {reason}")
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(entry_path)
+
+
+def _is_private(path: str) -> bool:
+    """Return whether `path` is owned by this user and not writable by others.
+
+    Entries are pickles, so anyone able to write into the cache directory
+    could run code as the user; only private directories and entries are
+    trusted. Platforms without POSIX ownership are not checked.
+    """
+
+    if not hasattr(os, "getuid"):
+        return True
+
+    stat = os.stat(path)
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def _read_entry(entry_path: str) -> pd.DataFrame | None:
+    """Read a cache entry, discarding it if it is missing or unreadable."""
+
+    try:
+        if not _is_private(entry_path):
+            logger.warning(
+                f"Ignoring cache entry {entry_path}: it is writable by other users."
+            )
+            return None
+        # Only read from a private directory (see `load_csv_cached`).
+        df = pd.read_pickle(entry_path)  # noqa: S301
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        _discard_entry(entry_path, exc)
+        return None
+
+    if not isinstance(df, pd.DataFrame):
+        _discard_entry(entry_path, f"unexpected {type(df).__name__}")
+        return None
+
+    os.utime(entry_path)
+    return df
+
+
+def _write_entry(
+    df: pd.DataFrame, cache_dir: str, entry_path: str, max_bytes: int
+) -> bool:
+    """Write a cache entry atomically, so concurrent runs never see partial files.
+
+    Entries larger than `max_bytes` are not kept, since eviction would remove
+    them straight away. Returns whether the entry was stored.
+    """
+
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            df.to_pickle(file, compression=None)
+        if os.path.getsize(tmp_path) > max_bytes:
+            os.remove(tmp_path)
+            return False
+        os.replace(tmp_path, entry_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    return True
+
+
+def load_csv_cached(
+    csv_path: str,
+    encoding: str | None = None,
+    cache_dir: str | None = None,
+    content_hash: bool = False,
+    max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+) -> pd.DataFrame:
+    """Load a validated dataset, reusing a cached copy when the file is unchanged.
+
+    On a cache hit the CSV is neither parsed nor validated: the typed
+    DataFrame produced by an earlier `load_csv` call is read back from a
+    binary columnar dump. On a miss the file is loaded normally and stored,
+    unless it alone exceeds `max_bytes`. Entries are pickles, so the cache is
+    bypassed when `cache_dir` is not owned by the current user or is
+    writable by group or others.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    encoding : str | None, optional
+        Encoding passed to `load_csv`; part of the cache key.
+    cache_dir : str | None, optional
+        Cache directory. Defaults to `default_cache_dir()`.
+    content_hash : bool, optional
+        Include a SHA-256 of the file contents in the cache key.
+    max_bytes : int, optional
+        Size bound enforced after each store by evicting the least recently
+        used entries.
+    max_errors : int, optional
+        Number of row-level failures after which validation stops.
+
+    Returns
+    -------
+    pd.DataFrame
+        Same DataFrame `load_csv` returns for the file.
+
+    """
+
+    cache_dir = cache_dir or default_cache_dir()
+
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        private = _is_private(cache_dir)
+    except OSError as exc:
+        logger.warning(f"Could not use dataset cache in {cache_dir}: {exc}")
+        private = False
+    else:
+        if not private:
+            logger.warning(
+                f"Not using dataset cache in {cache_dir}: the directory must be "
+                "owned by the current user and not writable by others."
+            )
+
+    if not private:
+        return load_csv(csv_path, encoding=encoding, max_errors=max_errors)
+
+    key = file_fingerprint(csv_path, encoding=encoding, content_hash=content_hash)
+    entry_path = os.path.join(cache_dir, f"{key}{_CACHE_SUFFIX}")
+
+    cached = _read_entry(entry_path)
+    if cached is not None:
+        logger.info(f"Loaded validated dataset from cache: {entry_path}")
+        return cached
+
+    df = load_csv(csv_path, encoding=encoding, max_errors=max_errors)
+
+    try:
+        stored = _write_entry(df, cache_dir, entry_path, max_bytes)
+        evict_cache(cache_dir, max_bytes=max_bytes)
+    except OSError as exc:
+        logger.warning(f"Could not write dataset cache in {cache_dir}: {exc}")
+    else:
+        if stored:
+            logger.info(f"Stored validated dataset in cache: {entry_path}")
+        else:
+            logger.info("Dataset is larger than the cache limit; not caching it.")
+
+    return df
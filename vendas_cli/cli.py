@@ -6,13 +6,28 @@ os.environ.setdefault("DISABLE_PANDERA_IMPORT_WARNING", "True")
 
 import argparse
 import sys
+from typing import TYPE_CHECKING, cast, get_args
 
-from .core import compute_report
-from .helpers import validate_csv_path, validate_filter_date
+from .helpers import (
+    DEFAULT_MAX_ERRORS,
+    REJECT_SUFFIX,
+    DataValidationError,
+    expand_csv_paths,
+    validate_csv_path,
+    validate_encoding,
+    validate_engine,
+    validate_filter_date,
+    validate_positive_int,
+)
 from .logger import get_logger
-from .output import render_output
-from .parser import load_csv
-from .typing import CLIArgs
+from .typing import CLIArgs, ExportFormat, OutputFormat
+
+# pandas, pandera and pydantic are only imported once a report is computed,
+# so `--help` and argument errors stay fast (see tests/test_cli.py).
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .schemas import ReportJob, SalesSummary
 
 logger = get_logger()
 
@@ -29,15 +44,44 @@ def map_parsed_args(args: argparse.Namespace) -> CLIArgs:
     -------
     CLIArgs
         Typed dictionary containing only the validated fields required by the
-        processing pipeline (csv_path, format, start, end).
+        processing pipeline (csv_paths, format, start, end, chunk_size,
+        encoding, workers, split, cache_dir, cache_hash, state_path,
+        jobs_path, max_errors, reject_path, engine, top, sort_by).
 
     """
 
+    from .cache import default_cache_dir
+
+    csv_paths = list(dict.fromkeys(path for group in args.csv_paths for path in group))
+    quarantine = args.on_invalid == "quarantine"
+    reject_path = (
+        args.reject_path or f"{os.path.splitext(csv_paths[0])[0]}{REJECT_SUFFIX}"
+        if quarantine
+        else None
+    )
+
     return CLIArgs(
-        csv_path=args.csv_path,
+        csv_paths=csv_paths,
         format=args.format,
         start=args.start,
         end=args.end,
+        chunk_size=args.chunk_size,
+        encoding=args.encoding,
+        workers=args.workers,
+        split=args.split,
+        cache_dir=(
+            None
+            if args.no_cache or quarantine
+            else args.cache_dir or default_cache_dir()
+        ),
+        cache_hash=args.cache_hash,
+        state_path=args.state_path,
+        jobs_path=args.jobs_path,
+        max_errors=args.max_errors,
+        reject_path=reject_path,
+        engine=args.engine,
+        top=args.top,
+        sort_by=args.sort_by,
     )
 
 
@@ -55,14 +99,33 @@ def _build_parser() -> argparse.ArgumentParser:
         prog="vendas-cli",
         description=(
             "Generate advanced sales reports from a CSV file using "
-            "Python standard libraries for ingestion and validated aggregation."
+            "Python standard libraries for ingestion and validated aggregation. "
+            "'vendas-cli serve' keeps datasets loaded in a local server answered "
+            "by 'vendas-cli query'; run either with --help for their options."
         ),
         epilog=(
             "Examples:\n"
             "  vendas-cli data.csv --format text\n"
             "  vendas-cli data.csv --format json\n"
+            "  vendas-cli data.csv --format ndjson > totals.ndjson\n"
+            "  vendas-cli data.csv --format parquet > totals.parquet\n"
             "  vendas-cli data.csv --start 2025-01-01 --end 2025-01-31\n"
             "  vendas-cli data.csv --format json --start 2025-01-01 --end 2025-01-31\n"
+            "  vendas-cli data.csv --chunk-size 100000\n"
+            "  vendas-cli data.csv --encoding latin1\n"
+            "  vendas-cli 'exports/2025-01-*.csv' --workers 8\n"
+            "  vendas-cli exports/ --format json\n"
+            "  vendas-cli year-end.csv --split-file --workers 16\n"
+            "  vendas-cli data.csv --no-cache\n"
+            "  vendas-cli sales-log.csv --state sales-log.state.json\n"
+            "  vendas-cli data.csv --jobs nightly-jobs.json\n"
+            "  vendas-cli suspicious.csv --max-errors 50\n"
+            "  vendas-cli dirty.csv --on-invalid quarantine --reject-file rejected.csv\n"
+            "  vendas-cli store-042.csv --engine stream\n"
+            "  vendas-cli year-end.csv --engine arrow\n"
+            "  vendas-cli catalog.csv --top 50 --sort-by valor\n"
+            "  vendas-cli serve --port 8642\n"
+            "  vendas-cli query data.csv --start 2025-01-01 --end 2025-01-31\n"
             "\n"
             "Exit codes:\n"
             "  0  Success\n"
@@ -70,22 +133,409 @@ def _build_parser() -> argparse.ArgumentParser:
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
         usage=(
-            "vendas-cli <csv_path> --format {text,json} "
-            "[--start YYYY-MM-DD --end YYYY-MM-DD]"
+            "vendas-cli <csv_path> [<csv_path> ...] --format {text,json,ndjson,csv,parquet,arrow} "
+            "[--start YYYY-MM-DD --end YYYY-MM-DD] [--chunk-size N] [--encoding NAME] "
+            "[--workers N] [--split-file] [--no-cache | --cache-dir DIR] [--cache-hash] "
+            "[--state FILE] [--jobs FILE] [--max-errors N] "
+            "[--on-invalid {fail,quarantine}] [--reject-file FILE] "
+            "[--engine NAME] [--top N] [--sort-by {quantidade,valor}]\n"
+            "       vendas-cli serve [--host HOST] [--port N] ...\n"
+            "       vendas-cli query <csv_path> [--format ...] [--start ... --end ...]"
         ),
     )
 
     parser.add_argument(
-        "csv_path",
-        type=validate_csv_path,
-        help="Path to the CSV file containing sales data.",
+        "csv_paths",
+        metavar="csv_path",
+        nargs="+",
+        type=expand_csv_paths,
+        help=(
+            "Path to a CSV file containing sales data. Accepts several paths, "
+            "directories and glob patterns; their rows are combined in one report."
+        ),
+    )
+    _add_report_arguments(parser, exports=True)
+    parser.add_argument(
+        "--chunk-size",
+        dest="chunk_size",
+        type=validate_positive_int,
+        default=None,
+        help=(
+            "Stream the CSV in chunks of N rows, aggregating each chunk as it is "
+            "read so memory stays bounded for very large files."
+        ),
+    )
+    parser.add_argument(
+        "--encoding",
+        dest="encoding",
+        type=validate_encoding,
+        default=None,
+        help=(
+            "Input file encoding (e.g. utf-8, latin1). Detected from the start "
+            "of the file when omitted."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        dest="workers",
+        type=validate_positive_int,
+        default=None,
+        help=(
+            "Number of worker processes used to aggregate multiple files. "
+            "Defaults to the number of CPU cores."
+        ),
+    )
+    parser.add_argument(
+        "--split-file",
+        dest="split",
+        action="store_true",
+        help=(
+            "Split each file into newline-aligned byte ranges parsed in parallel "
+            "by --workers processes. Quoted fields must not contain line breaks."
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="Always parse and validate the CSV instead of reusing a cached copy.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        default=None,
+        help=(
+            "Directory for cached validated datasets. Defaults to "
+            "$VENDAS_CLI_CACHE_DIR or ~/.cache/vendas-cli."
+        ),
+    )
+    parser.add_argument(
+        "--cache-hash",
+        dest="cache_hash",
+        action="store_true",
+        help=(
+            "Also key the cache on a hash of the file contents, not only on its "
+            "path, size and modification time."
+        ),
+    )
+    parser.add_argument(
+        "--state",
+        dest="state_path",
+        default=None,
+        metavar="FILE",
+        help=(
+            "Keep per-product, per-day totals of an append-only CSV in FILE and "
+            "only parse the rows appended since the previous run."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        dest="jobs_path",
+        default=None,
+        metavar="FILE",
+        help=(
+            "Render every report listed in the JSON file FILE (objects with "
+            "optional start, end, format and output keys) from a single load "
+            "of the data."
+        ),
+    )
+    parser.add_argument(
+        "--max-errors",
+        dest="max_errors",
+        type=validate_positive_int,
+        default=DEFAULT_MAX_ERRORS,
+        metavar="N",
+        help=(
+            "Stop validating once N row-level errors are known and list them "
+            f"in row order (default: {DEFAULT_MAX_ERRORS})."
+        ),
+    )
+    parser.add_argument(
+        "--on-invalid",
+        dest="on_invalid",
+        choices=["fail", "quarantine"],
+        default="fail",
+        help=(
+            "What to do with rows that fail validation: 'fail' stops with an "
+            "error, 'quarantine' writes them with their error reasons to a "
+            "reject file and reports over the valid rows."
+        ),
+    )
+    parser.add_argument(
+        "--reject-file",
+        dest="reject_path",
+        default=None,
+        metavar="FILE",
+        help=(
+            "CSV file receiving quarantined rows. Defaults to "
+            "<csv_path without .csv>.rejected.csv next to the input."
+        ),
+    )
+    parser.add_argument(
+        "--engine",
+        dest="engine",
+        type=validate_engine,
+        default="auto",
+        metavar="NAME",
+        help=(
+            "Report engine: 'pandas' builds DataFrames, 'stream' parses rows in "
+            "pure Python without importing pandas, 'arrow' runs multithreaded "
+            "Arrow kernels (needs pyarrow); installed plugins can add more. "
+            "'auto' (default) picks 'stream' for single files up to 1 MiB and "
+            "'pandas' otherwise, or with --chunk-size, which only 'pandas' "
+            "supports. Rows other engines cannot decode exactly are handed to "
+            "'pandas', so reports and errors are identical."
+        ),
+    )
+    parser.add_argument(
+        "--top",
+        dest="top",
+        type=validate_positive_int,
+        default=None,
+        metavar="N",
+        help=(
+            "List only the N best-selling products, selected without sorting "
+            "the whole catalog. TOTAL SALES and TOP PRODUCT still cover every "
+            "product."
+        ),
     )
+    parser.add_argument(
+        "--sort-by",
+        dest="sort_by",
+        choices=["quantidade", "valor"],
+        default=None,
+        help=(
+            "Rank listed products by units sold ('quantidade', the default with "
+            "--top) or by sales value ('valor'), largest first, instead of by name."
+        ),
+    )
+    return parser
+
+
+def _engine_supported(typed_args: CLIArgs) -> bool:
+    """Return whether an engine other than pandas can serve this run."""
+
+    return (
+        len(typed_args["csv_paths"]) == 1
+        and not typed_args["chunk_size"]
+        and not typed_args["split"]
+        and not typed_args["state_path"]
+        and not typed_args["reject_path"]
+    )
+
+
+def _compute_summary(typed_args: CLIArgs) -> SalesSummary:
+    """Run ingestion and aggregation for the inputs described by `typed_args`.
+
+    Parameters
+    ----------
+    typed_args : CLIArgs
+        Validated CLI arguments.
+
+    Returns
+    -------
+    SalesSummary
+        Computed report for all requested input files.
+
+    """
+
+    csv_paths = typed_args["csv_paths"]
+
+    engine = typed_args["engine"]
+
+    if engine == "auto":
+        from .stream import use_stream_engine
+
+        supported = _engine_supported(typed_args)
+        engine = "stream" if supported and use_stream_engine(csv_paths[0]) else "pandas"
+
+    def compute_pandas() -> SalesSummary:
+        from .core import summarize_aggregate
+
+        return summarize_aggregate(
+            _compute_aggregate(typed_args),
+            start=typed_args["start"],
+            end=typed_args["end"],
+        )
+
+    if engine != "pandas" and _engine_supported(typed_args):
+        from .engines import compute_report_with
+
+        return compute_report_with(
+            engine,
+            csv_paths[0],
+            typed_args["start"],
+            typed_args["end"],
+            typed_args["encoding"],
+            fallback=compute_pandas,
+        )
+
+    return compute_pandas()
+
+
+def _compute_aggregate(typed_args: CLIArgs) -> pd.DataFrame:
+    """Reduce the inputs to per-product sums over the requested date range.
+
+    Each run answers a single range, so rows are filtered while they are
+    aggregated and no per-day aggregate is built, except with `--state`,
+    whose stored state is one.
+
+    Parameters
+    ----------
+    typed_args : CLIArgs
+        Validated CLI arguments.
+
+    Returns
+    -------
+    pd.DataFrame
+        Aggregate indexed by produto, like `core.aggregate_by_product`.
+
+    """
+
+    from .cache import load_csv_cached
+    from .core import (
+        aggregate_by_product,
+        aggregate_chunks,
+        aggregate_daily,
+        filter_by_date,
+    )
+    from .incremental import update_daily_aggregates
+    from .parallel import aggregate_files
+    from .parser import iter_csv_chunks, load_csv
+
+    csv_paths = typed_args["csv_paths"]
+    start, end = typed_args["start"], typed_args["end"]
+
+    if typed_args["state_path"]:
+        logger.info("Updating incremental state and computing sales report...")
+        daily = update_daily_aggregates(
+            csv_paths[0],
+            typed_args["state_path"],
+            encoding=typed_args["encoding"],
+            chunk_size=typed_args["chunk_size"],
+            max_errors=typed_args["max_errors"],
+        )
+        return aggregate_daily(daily, start=start, end=end)
+
+    if len(csv_paths) > 1 or typed_args["split"]:
+        logger.info(f"Computing sales report across {len(csv_paths)} file(s)...")
+        return aggregate_files(
+            csv_paths,
+            start=start,
+            end=end,
+            workers=typed_args["workers"],
+            encoding=typed_args["encoding"],
+            chunk_size=typed_args["chunk_size"],
+            split=typed_args["split"],
+            cache_dir=typed_args["cache_dir"],
+            cache_hash=typed_args["cache_hash"],
+            max_errors=typed_args["max_errors"],
+        )
+
+    if typed_args["chunk_size"]:
+        logger.info("Streaming DataFrame chunks and computing sales report...")
+        return aggregate_chunks(
+            iter_csv_chunks(
+                csv_path=csv_paths[0],
+                chunk_size=typed_args["chunk_size"],
+                encoding=typed_args["encoding"],
+                max_errors=typed_args["max_errors"],
+                reject_path=typed_args["reject_path"],
+            ),
+            start=start,
+            end=end,
+        )
+
+    logger.info("Loading DataFrame...")
+    if typed_args["cache_dir"]:
+        df = load_csv_cached(
+            csv_path=csv_paths[0],
+            encoding=typed_args["encoding"],
+            cache_dir=typed_args["cache_dir"],
+            content_hash=typed_args["cache_hash"],
+            max_errors=typed_args["max_errors"],
+        )
+    else:
+        df = load_csv(
+            csv_path=csv_paths[0],
+            encoding=typed_args["encoding"],
+            max_errors=typed_args["max_errors"],
+            reject_path=typed_args["reject_path"],
+        )
+
+    logger.info("Computing sales report...")
+    return aggregate_by_product(filter_by_date(df, start=start, end=end))
+
+
+def _compute_daily(typed_args: CLIArgs) -> pd.DataFrame:
+    """Aggregate every input row by product and day for batch reports.
+
+    Parameters
+    ----------
+    typed_args : CLIArgs
+        Validated CLI arguments.
+
+    Returns
+    -------
+    pd.DataFrame
+        Daily aggregate indexed by (produto, data) over all input files.
+
+    """
+
+    from .incremental import update_daily_aggregates
+    from .parallel import aggregate_file_by_day, aggregate_files_by_day
+
+    csv_paths = typed_args["csv_paths"]
+
+    if typed_args["state_path"]:
+        return update_daily_aggregates(
+            csv_paths[0],
+            typed_args["state_path"],
+            encoding=typed_args["encoding"],
+            chunk_size=typed_args["chunk_size"],
+            max_errors=typed_args["max_errors"],
+        )
+
+    if typed_args["reject_path"]:
+        return aggregate_file_by_day(
+            csv_paths[0],
+            encoding=typed_args["encoding"],
+            chunk_size=typed_args["chunk_size"],
+            max_errors=typed_args["max_errors"],
+            reject_path=typed_args["reject_path"],
+        )
+
+    return aggregate_files_by_day(
+        csv_paths,
+        workers=typed_args["workers"],
+        encoding=typed_args["encoding"],
+        chunk_size=typed_args["chunk_size"],
+        cache_dir=typed_args["cache_dir"],
+        cache_hash=typed_args["cache_hash"],
+        max_errors=typed_args["max_errors"],
+    )
+
+
+def _add_report_arguments(
+    parser: argparse.ArgumentParser, exports: bool = False
+) -> None:
+    """Add the --format, --start and --end options shared with `query`."""
+
     parser.add_argument(
         "--format",
         dest="format",
-        choices=["text", "json"],
+        choices=[*get_args(OutputFormat), *(get_args(ExportFormat) if exports else ())],
         default="text",
-        help="Output format: 'text' for CLI display or 'json' for structured output.",
+        help=(
+            "Output format: 'text' for CLI display, 'json' for structured output "
+            "or 'ndjson' for one JSON object per line (summary, then products)."
+            + (
+                " 'csv', 'parquet' and 'arrow' write the per-product totals as a "
+                "table to stdout (parquet and arrow need pyarrow)."
+                if exports
+                else ""
+            )
+        ),
     )
     parser.add_argument(
         "--start",
@@ -101,9 +551,182 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="End date filter (YYYY-MM-DD). Must be used together with --start.",
     )
+
+
+def _check_date_range(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> None:
+    """Exit with a usage error unless --start and --end form a valid range."""
+
+    if bool(args.start) ^ bool(args.end):
+        parser.error(
+            "Both --start and --end must be provided together "
+            "(e.g., --start 2025-01-01 --end 2025-03-31)."
+        )
+
+    if args.start and args.end and args.start > args.end:
+        parser.error(
+            f"--start date ({args.start}) cannot be greater than --end date ({args.end}). "
+            "Please provide a valid date range in YYYY-MM-DD format."
+        )
+
+
+def _add_server_address_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the --host and --port options shared by `serve` and `query`."""
+
+    from .client import DEFAULT_HOST, DEFAULT_PORT
+
+    parser.add_argument(
+        "--host",
+        dest="host",
+        default=DEFAULT_HOST,
+        help=f"Server host (default: {DEFAULT_HOST}).",
+    )
+    parser.add_argument(
+        "--port",
+        dest="port",
+        type=int,
+        default=DEFAULT_PORT,
+        help=f"Server TCP port (default: {DEFAULT_PORT}).",
+    )
+
+
+def _build_serve_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of `vendas-cli serve`.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        Configured parser for the server options.
+
+    """
+
+    from .client import DEFAULT_MAX_DATASETS
+
+    parser = argparse.ArgumentParser(
+        prog="vendas-cli serve",
+        description=(
+            "Serve sales reports over localhost HTTP, keeping the most recently "
+            "requested CSV files loaded and validated in memory. A file is "
+            "reloaded when its size or modification time changes. Query it with "
+            "'vendas-cli query' or GET /report?path=...&start=...&end=...&format=..."
+        ),
+    )
+    _add_server_address_arguments(parser)
+    parser.add_argument(
+        "--encoding",
+        dest="encoding",
+        type=validate_encoding,
+        default=None,
+        help="Input file encoding. Detected per file when omitted.",
+    )
+    parser.add_argument(
+        "--max-errors",
+        dest="max_errors",
+        type=validate_positive_int,
+        default=DEFAULT_MAX_ERRORS,
+        metavar="N",
+        help=f"Row-level errors listed per invalid file (default: {DEFAULT_MAX_ERRORS}).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="Do not load or store validated datasets in the on-disk cache.",
+    )
+    parser.add_argument(
+        "--max-datasets",
+        dest="max_datasets",
+        type=validate_positive_int,
+        default=DEFAULT_MAX_DATASETS,
+        metavar="N",
+        help=(
+            "Files kept loaded; the least recently requested one is dropped "
+            f"beyond N (default: {DEFAULT_MAX_DATASETS})."
+        ),
+    )
+    return parser
+
+
+def _build_query_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of `vendas-cli query`.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        Configured parser for the client options.
+
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="vendas-cli query",
+        description=(
+            "Print a report computed by a running 'vendas-cli serve' process. "
+            "Output and errors match 'vendas-cli <csv_path>'."
+        ),
+    )
+    parser.add_argument(
+        "csv_path",
+        type=validate_csv_path,
+        help="Path to the CSV file, relative to the current directory.",
+    )
+    _add_report_arguments(parser)
+    _add_server_address_arguments(parser)
     return parser
 
 
+def _serve_main(argv: list[str]) -> None:
+    """Run `vendas-cli serve` until interrupted."""
+
+    args = _build_serve_parser().parse_args(argv)
+
+    from .cache import default_cache_dir
+    from .server import DatasetStore, serve
+
+    store = DatasetStore(
+        encoding=args.encoding,
+        max_errors=args.max_errors,
+        cache_dir=None if args.no_cache else default_cache_dir(),
+        max_datasets=args.max_datasets,
+    )
+
+    try:
+        serve(store, host=args.host, port=args.port)
+    except OSError as exc:
+        logger.error(f"Error: {exc}")
+        sys.exit(1)
+
+    sys.exit(0)
+
+
+def _query_main(argv: list[str]) -> None:
+    """Print the report returned by a running server and exit."""
+
+    parser = _build_query_parser()
+    args = parser.parse_args(argv)
+    _check_date_range(parser, args)
+
+    from .client import request_report
+
+    try:
+        output = request_report(
+            args.csv_path,
+            start=args.start,
+            end=args.end,
+            output_format=args.format,
+            host=args.host,
+            port=args.port,
+        )
+    except DataValidationError as exc:
+        sys.exit(str(exc))
+    except ValueError as exc:
+        logger.error(f"Error: {exc}")
+        sys.exit(1)
+
+    print(output)
+    sys.exit(0)
+
+
 def main() -> None:
     """Run the main entrypoint for vendas-cli.
 
@@ -111,43 +734,133 @@ def main() -> None:
     output. Handles exceptions and ensures appropriate exit codes.
     """
 
+    argv = sys.argv[1:]
+
+    if argv[:1] == ["serve"]:
+        _serve_main(argv[1:])
+    if argv[:1] == ["query"]:
+        _query_main(argv[1:])
+
     parser = _build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    _check_date_range(parser, args)
 
-    if bool(args.start) ^ bool(args.end):
+    if args.state_path and (args.split or sum(map(len, args.csv_paths)) > 1):
+        parser.error("--state works with exactly one CSV file and no --split-file.")
+
+    if args.on_invalid == "quarantine" and (
+        args.state_path or args.split or sum(map(len, args.csv_paths)) > 1
+    ):
         parser.error(
-            "Both --start and --end must be provided together "
-            "(e.g., --start 2025-01-01 --end 2025-03-31)."
+            "--on-invalid quarantine works with exactly one CSV file and no "
+            "--split-file or --state."
         )
 
-    if args.start and args.end and args.start > args.end:
+    export = args.format in get_args(ExportFormat)
+    ranked = args.top is not None or args.sort_by is not None
+
+    if args.engine not in ("auto", "pandas") and (
+        args.state_path
+        or args.split
+        or args.chunk_size
+        or args.jobs_path
+        or args.on_invalid == "quarantine"
+        or export
+        or ranked
+        or sum(map(len, args.csv_paths)) > 1
+    ):
         parser.error(
-            f"--start date ({args.start}) cannot be greater than --end date ({args.end}). "
-            "Please provide a valid date range in YYYY-MM-DD format."
+            f"--engine {args.engine} works with exactly one CSV file and no "
+            "--split-file, --chunk-size, --state, --jobs, --on-invalid quarantine, "
+            "--top, --sort-by or --format csv/parquet/arrow."
+        )
+
+    if export and args.jobs_path:
+        parser.error("--jobs reports support --format text, json or ndjson.")
+
+    if ranked and args.jobs_path:
+        parser.error("--top and --sort-by cannot be combined with --jobs.")
+
+    if args.format in ("parquet", "arrow") and sys.stdout.isatty():
+        parser.error(
+            f"--format {args.format} writes binary data; redirect stdout to a file."
         )
 
+    if args.reject_path and args.on_invalid != "quarantine":
+        parser.error("--reject-file requires --on-invalid quarantine.")
+
+    jobs: list[ReportJob] | None = None
+
+    if args.jobs_path:
+        if args.start or args.split:
+            parser.error(
+                "--jobs sets date ranges per report and cannot be combined with "
+                "--start/--end or --split-file."
+            )
+        from .jobs import load_jobs
+
+        try:
+            jobs = load_jobs(args.jobs_path)
+        except ValueError as exc:
+            parser.error(str(exc))
+
     try:
+        from .jobs import run_jobs
+        from .output import write_output
+
         typed_args: CLIArgs = map_parsed_args(args)
 
-        logger.info("Loading DataFrame...")
-        df = load_csv(csv_path=typed_args["csv_path"])
+        if export:
+            from .core import select_products
+            from .output import export_totals
 
-        logger.info("Computing sales report...")
-        summary = compute_report(
-            df=df,
-            start=typed_args["start"],
-            end=typed_args["end"],
-        )
+            aggregated = _compute_aggregate(typed_args)
 
-        logger.info("Rendering output...")
-        output = render_output(
-            summary=summary,
-            output_format=typed_args["format"],
-        )
+            logger.info("Exporting per-product totals...")
+            sys.stdout.flush()
+            export_totals(
+                select_products(aggregated, typed_args["top"], typed_args["sort_by"]),
+                cast(ExportFormat, typed_args["format"]),
+                sys.stdout.buffer,
+            )
+            sys.stdout.buffer.flush()
+            sys.exit(0)
 
-        print(output)
+        # Table formats were handled above and are rejected with --jobs.
+        output_format = cast(OutputFormat, typed_args["format"])
+
+        if ranked:
+            from .core import summarize_aggregate
+
+            summary = summarize_aggregate(
+                _compute_aggregate(typed_args),
+                start=typed_args["start"],
+                end=typed_args["end"],
+                top=typed_args["top"],
+                sort_by=typed_args["sort_by"],
+            )
+
+            logger.info("Rendering selected products...")
+            write_output(summary, output_format, sys.stdout)
+            sys.exit(0)
+
+        if jobs is not None:
+            logger.info(f"Loading data once for {len(jobs)} report job(s)...")
+            for output in run_jobs(
+                _compute_daily(typed_args), jobs, default_format=output_format
+            ):
+                print(output)
+            sys.exit(0)
+
+        summary = _compute_summary(typed_args)
+
+        logger.info("Rendering output...")
+        write_output(summary, output_format, sys.stdout)
         sys.exit(0)
 
+    except DataValidationError as exc:
+        # Printed as is on stderr, with exit status 1.
+        sys.exit(str(exc))
     except Exception as exc:
         logger.error(f"Error: {exc}")
         sys.exit(1)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+import urllib.error
+import urllib.parse
+import urllib.request
+from http import HTTPStatus
+from typing import cast
+
+from .helpers import DataValidationError
+from .typing import OutputFormat
+
+# The client only needs the standard library, so `vendas-cli query` answers
+# without importing pandas.
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8642
+# Datasets a server keeps loaded before evicting the least recently used.
+DEFAULT_MAX_DATASETS = 16
+
+# Requests go to a local server, so proxy settings from the environment
+# must not apply.
+_OPENER = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+
+def request_report(
+    csv_path: str,
+    start: str | None = None,
+    end: str | None = None,
+    output_format: OutputFormat = "text",
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    timeout: float | None = None,
+) -> str:
+    """Ask a running `vendas-cli serve` process for a rendered report.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file, resolved against the current directory.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+    output_format : OutputFormat, optional
+        "text", "json" or "ndjson".
+    host : str, optional
+        Host of the server.
+    port : int, optional
+        Port of the server.
+    timeout : float | None, optional
+        Seconds to wait for the answer; no limit by default, since the first
+        request for a file waits for it to be loaded.
+
+    Returns
+    -------
+    str
+        The report, exactly as `vendas-cli` would print it.
+
+    Raises
+    ------
+    DataValidationError
+        If the file fails validation, with the message `vendas-cli` prints.
+    ValueError
+        If the server is unreachable, rejects the request or fails to
+        process the file.
+
+    """
+
+    params = {"path": os.path.abspath(csv_path), "format": output_format}
+    if start and end:
+        params.update(start=start, end=end)
+
+    url = f"http://{host}:{port}/report?{urllib.parse.urlencode(params)}"
+
+    try:
+        with _OPENER.open(url, timeout=timeout) as response:
+            return cast(bytes, response.read()).decode("utf-8")
+    except urllib.error.HTTPError as exc:
+        message = exc.read().decode("utf-8")
+        if exc.code == HTTPStatus.UNPROCESSABLE_ENTITY:
+            raise DataValidationError(message) from None
+        raise ValueError(message) from None
+    except urllib.error.URLError as exc:
+        raise ValueError(
+            f"Cannot reach a vendas-cli server at {host}:{port} ({exc.reason}). "
+            "Start one with `vendas-cli serve`."
+        ) from None
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from decimal import Decimal
+from collections.abc import Iterable
 
 import pandas as pd
 
@@ -9,6 +9,227 @@ from .schemas import (
     ReportFilters,
     SalesSummary,
 )
+from .typing import SortKey
+
+_AGGREGATE_COLUMNS = ["quantidade_total", "total_centavos"]
+
+# Partial aggregates buffered by `merge_aggregates` before they are summed.
+_MERGE_BATCH = 16
+
+_SORT_COLUMNS: dict[SortKey, str] = {
+    "quantidade": "quantidade_total",
+    "valor": "total_centavos",
+}
+
+
+def _sale_cents(df: pd.DataFrame) -> pd.Series:
+    """Return each row's sale value in integer cents.
+
+    Validated prices are whole cents, so rounding only removes the float
+    error of `preco_unitario * 100`, and validated rows are at most
+    `engines.MAX_SALE_CENTS`, so every sum built on top of this is exact
+    integer arithmetic.
+    """
+
+    cents = (df["preco_unitario"].astype("float64") * 100).round().astype("int64")
+    return df["quantidade"].astype("int64") * cents
+
+
+def filter_by_date(
+    df: pd.DataFrame,
+    start: str | None = None,
+    end: str | None = None,
+) -> pd.DataFrame:
+    """Keep only the rows whose `data` falls inside the inclusive date range.
+
+    When `data` is a datetime64 column sorted in ascending order, as returned
+    by `parser.load_csv`, the range is found with two binary searches and
+    returned as a positional slice. Other frames fall back to an element-wise
+    comparison. The order is checked on every call: it is a single linear
+    pass, cheap next to parsing, and stays correct for frames concatenated or
+    re-sorted after loading.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Validated sales DataFrame with a `data` column.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+
+    Returns
+    -------
+    pd.DataFrame
+        The filtered DataFrame, or `df` itself when no range is given.
+
+    """
+
+    if not (start and end):
+        return df
+
+    start_ts, end_ts = pd.Timestamp(start), pd.Timestamp(end)
+    dates = df["data"]
+
+    if pd.api.types.is_datetime64_dtype(dates) and dates.is_monotonic_increasing:
+        lower = dates.searchsorted(start_ts, side="left")
+        upper = dates.searchsorted(end_ts, side="right")
+        return df.iloc[lower:upper]
+
+    dates = pd.to_datetime(dates)
+    return df[(dates >= start_ts) & (dates <= end_ts)]
+
+
+def _plain_products(aggregated: pd.DataFrame) -> pd.DataFrame:
+    """Turn a categorical `produto` index level into plain strings.
+
+    Grouping on a categorical `produto` column works on its integer codes;
+    the resulting labels are converted back so aggregates from any source
+    can be merged and cached alike.
+    """
+
+    index = aggregated.index
+
+    if isinstance(index, pd.MultiIndex):
+        level = index.levels[0]
+        if isinstance(level.dtype, pd.CategoricalDtype):
+            aggregated.index = index.set_levels(level.astype(str).tolist(), level=0)
+    elif isinstance(index.dtype, pd.CategoricalDtype):
+        aggregated.index = index.astype(str)
+
+    return aggregated
+
+
+def aggregate_by_product(df: pd.DataFrame) -> pd.DataFrame:
+    """Compute per-product partial sums that can be merged across chunks.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame containing produto, quantidade and preco_unitario columns.
+
+    Returns
+    -------
+    pd.DataFrame
+        Frame indexed by produto with `quantidade_total` and
+        `total_centavos` (sales value in integer cents) sums.
+
+    """
+
+    if df.empty:
+        return pd.DataFrame(
+            columns=_AGGREGATE_COLUMNS, index=pd.Index([], name="produto")
+        )
+
+    df = df.assign(_total_cents=_sale_cents(df))
+
+    return _plain_products(
+        df.groupby("produto", observed=True).agg(
+            quantidade_total=("quantidade", "sum"),
+            total_centavos=("_total_cents", "sum"),
+        )
+    )
+
+
+def aggregate_by_day(df: pd.DataFrame) -> pd.DataFrame:
+    """Compute per-(produto, day) partial sums that can be merged across runs.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Validated DataFrame containing produto, quantidade, preco_unitario
+        and data columns.
+
+    Returns
+    -------
+    pd.DataFrame
+        Frame indexed by (produto, data) with `quantidade_total` and
+        `total_centavos` (sales value in integer cents) sums.
+
+    """
+
+    if df.empty:
+        return pd.DataFrame(
+            columns=_AGGREGATE_COLUMNS,
+            index=pd.MultiIndex.from_arrays([[], []], names=["produto", "data"]),
+        )
+
+    df = df.assign(
+        data=pd.to_datetime(df["data"]).dt.normalize(),
+        _total_cents=_sale_cents(df),
+    )
+
+    return _plain_products(
+        df.groupby(["produto", "data"], observed=True).agg(
+            quantidade_total=("quantidade", "sum"),
+            total_centavos=("_total_cents", "sum"),
+        )
+    )
+
+
+def _sum_parts(parts: list[pd.DataFrame]) -> pd.DataFrame:
+    """Sum non-empty partial aggregates sharing the same index levels."""
+
+    if len(parts) == 1:
+        return parts[0]
+
+    merged = pd.concat(parts)
+    return merged.groupby(level=list(range(merged.index.nlevels))).sum()
+
+
+def merge_aggregates(parts: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Merge partial sums produced by `aggregate_by_product` or `aggregate_by_day`.
+
+    Parts are consumed lazily and folded into a running total every
+    `_MERGE_BATCH` parts, so at most that many partials are alive at once
+    however many a generator yields.
+
+    Parameters
+    ----------
+    parts : Iterable[pd.DataFrame]
+        Partial aggregates sharing the same index levels.
+
+    Returns
+    -------
+    pd.DataFrame
+        Single aggregate with one row per distinct index entry.
+
+    """
+
+    pending: list[pd.DataFrame] = []
+    empty: pd.DataFrame | None = None
+
+    for part in parts:
+        if part.empty:
+            if empty is None:
+                empty = part
+            continue
+
+        pending.append(part)
+        if len(pending) > _MERGE_BATCH:
+            pending = [_sum_parts(pending)]
+
+    if not pending:
+        return empty if empty is not None else aggregate_by_product(pd.DataFrame())
+
+    return _sum_parts(pending)
+
+
+def _totals_from_aggregate(aggregated: pd.DataFrame) -> list[ProductTotal]:
+    """Convert a per-product aggregate sorted by produto into `ProductTotal` models.
+
+    Columns are converted to Python values in bulk, then zipped into models,
+    avoiding a pandas `Series` per row.
+    """
+
+    products = aggregated.index.astype(str).tolist()
+    quantities = aggregated["quantidade_total"].astype("int64").tolist()
+    values = (aggregated["total_centavos"].astype("int64") / 100).tolist()
+
+    return [
+        ProductTotal(produto=produto, quantidade_total=quantidade, total_vendas=valor)
+        for produto, quantidade, valor in zip(products, quantities, values, strict=True)
+    ]
 
 
 def compute_totals_by_product(
@@ -33,43 +254,74 @@ def compute_totals_by_product(
     if df.empty:
         return []
 
-    df = df.assign(_total_value=df["quantidade"] * df["preco_unitario"])
+    return _totals_from_aggregate(aggregate_by_product(df).sort_index())
 
-    aggregated = (
-        df.groupby("produto", as_index=False)
-        .agg(
-            quantidade_total=("quantidade", "sum"),
-            total_vendas=("_total_value", "sum"),
-        )
-        .sort_values(by="produto")
-    )
 
-    return [
-        ProductTotal(
-            produto=row["produto"],
-            quantidade_total=int(row["quantidade_total"]),
-            total_vendas=round(float(row["total_vendas"]), 2),
-        )
-        for _, row in aggregated.iterrows()
-    ]
+def select_products(
+    aggregated: pd.DataFrame,
+    top: int | None = None,
+    sort_by: SortKey | None = None,
+) -> pd.DataFrame:
+    """Choose and order the products listed in a report.
 
+    With `top`, only the `top` largest products are selected, using
+    `DataFrame.nlargest` (a partial selection, linear in the number of
+    products) instead of sorting the whole aggregate.
 
-def compute_report(
-    df: pd.DataFrame,
+    Parameters
+    ----------
+    aggregated : pd.DataFrame
+        Per-product sums indexed by produto.
+    top : int | None, optional
+        Number of products to keep, largest first.
+    sort_by : SortKey | None, optional
+        Rank by units sold (`quantidade`, the default with `top`) or by sales
+        value (`valor`). Without `top`, every product is kept in this order.
+
+    Returns
+    -------
+    pd.DataFrame
+        Selected rows, sorted by produto when neither option is given and by
+        the ranking column descending otherwise. Ties keep produto order.
+
+    """
+
+    aggregated = aggregated.sort_index()
+
+    if top is None and sort_by is None:
+        return aggregated
+
+    column = _SORT_COLUMNS[sort_by or "quantidade"]
+
+    if top is not None:
+        aggregated = aggregated.nlargest(top, column, keep="first").sort_index()
+
+    return aggregated.sort_values(column, ascending=False, kind="stable")
+
+
+def summarize_aggregate(
+    aggregated: pd.DataFrame,
     start: str | None = None,
     end: str | None = None,
+    top: int | None = None,
+    sort_by: SortKey | None = None,
 ) -> SalesSummary:
-    """Compute the final sales summary report for the dataset.
+    """Build the final sales summary from a per-product aggregate.
 
     Parameters
     ----------
-    df : pd.DataFrame
-        Validated sales DataFrame containing at minimum the columns
-        produto, quantidade, preco_unitario.
+    aggregated : pd.DataFrame
+        Per-product sums as returned by `aggregate_by_product` or
+        `merge_aggregates`.
     start : str | None, optional
-        Optional start date in ISO YYYY-MM-DD format.
+        Start date of the applied filter, if any.
     end : str | None, optional
-        Optional end date in ISO YYYY-MM-DD format.
+        End date of the applied filter, if any.
+    top : int | None, optional
+        List only this many products; see `select_products`. `valor_total`
+        and `produto_mais_vendido` still cover every product.
+    sort_by : SortKey | None, optional
+        Order of the listed products; see `select_products`.
 
     Returns
     -------
@@ -79,16 +331,14 @@ def compute_report(
 
     """
 
-    if start and end:
-        start_date = pd.to_datetime(start).date()
-        end_date = pd.to_datetime(end).date()
-        df = df[(df["data"] >= start_date) & (df["data"] <= end_date)]
+    aggregated = aggregated.sort_index()
+    totals = _totals_from_aggregate(select_products(aggregated, top, sort_by))
 
-    totals = compute_totals_by_product(df=df)
-
-    total_sales_value = float(sum(Decimal(str(item.total_vendas)) for item in totals))
+    total_sales_value = int(aggregated["total_centavos"].sum()) / 100
     top_product = (
-        max(totals, key=lambda item: item.quantidade_total).produto if totals else ""
+        str(aggregated.index[int(aggregated["quantidade_total"].to_numpy().argmax())])
+        if len(aggregated)
+        else ""
     )
     filters = (
         ReportFilters.model_validate({"start": start, "end": end})
@@ -102,3 +352,159 @@ def compute_report(
         totais_por_produto=totals,
         filtros=filters,
     )
+
+
+def aggregate_daily(
+    daily: pd.DataFrame,
+    start: str | None = None,
+    end: str | None = None,
+) -> pd.DataFrame:
+    """Reduce per-(produto, day) sums to per-product sums for a date range.
+
+    Parameters
+    ----------
+    daily : pd.DataFrame
+        Aggregate indexed by (produto, data) as returned by `aggregate_by_day`.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+
+    Returns
+    -------
+    pd.DataFrame
+        Aggregate indexed by produto, like `aggregate_by_product` on the
+        underlying rows.
+
+    """
+
+    if start and end and not daily.empty:
+        days = daily.index.get_level_values("data")
+        daily = daily[(days >= pd.Timestamp(start)) & (days <= pd.Timestamp(end))]
+
+    if daily.empty:
+        return aggregate_by_product(pd.DataFrame())
+
+    return daily.groupby(level="produto").sum()
+
+
+def summarize_daily(
+    daily: pd.DataFrame,
+    start: str | None = None,
+    end: str | None = None,
+) -> SalesSummary:
+    """Build the sales summary from per-(produto, day) sums.
+
+    Parameters
+    ----------
+    daily : pd.DataFrame
+        Aggregate indexed by (produto, data) as returned by `aggregate_by_day`.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+
+    Returns
+    -------
+    SalesSummary
+        Same summary `compute_report` would produce for the underlying rows.
+
+    """
+
+    return summarize_aggregate(
+        aggregate_daily(daily, start=start, end=end), start=start, end=end
+    )
+
+
+def compute_report(
+    df: pd.DataFrame,
+    start: str | None = None,
+    end: str | None = None,
+) -> SalesSummary:
+    """Compute the final sales summary report for the dataset.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Validated sales DataFrame containing at minimum the columns
+        produto, quantidade, preco_unitario.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+
+    Returns
+    -------
+    SalesSummary
+        Pydantic model containing total sales, top-selling product, per-product
+        breakdown, and filter metadata if applied.
+
+    """
+
+    df = filter_by_date(df, start=start, end=end)
+
+    return summarize_aggregate(aggregate_by_product(df), start=start, end=end)
+
+
+def aggregate_chunks(
+    chunks: Iterable[pd.DataFrame],
+    start: str | None = None,
+    end: str | None = None,
+) -> pd.DataFrame:
+    """Filter and reduce a stream of validated chunks to per-product sums.
+
+    Each chunk is reduced as soon as it arrives, so memory is bounded by the
+    chunk size and the number of distinct products rather than by the input
+    size.
+
+    Parameters
+    ----------
+    chunks : Iterable[pd.DataFrame]
+        Validated chunks, e.g. from `parser.iter_csv_chunks`.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+
+    Returns
+    -------
+    pd.DataFrame
+        Per-product aggregate indexed by produto.
+
+    """
+
+    aggregated = aggregate_by_product(pd.DataFrame())
+
+    for chunk in chunks:
+        partial = aggregate_by_product(filter_by_date(chunk, start=start, end=end))
+        aggregated = merge_aggregates([aggregated, partial])
+
+    return aggregated
+
+
+def compute_report_chunked(
+    chunks: Iterable[pd.DataFrame],
+    start: str | None = None,
+    end: str | None = None,
+) -> SalesSummary:
+    """Compute the sales summary from a stream of validated chunks.
+
+    Parameters
+    ----------
+    chunks : Iterable[pd.DataFrame]
+        Validated chunks, e.g. from `parser.iter_csv_chunks`.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+
+    Returns
+    -------
+    SalesSummary
+        Same summary `compute_report` would produce for the concatenated chunks.
+
+    """
+
+    aggregated = aggregate_chunks(chunks, start=start, end=end)
+
+    return summarize_aggregate(aggregated, start=start, end=end)
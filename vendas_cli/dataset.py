@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import cached_property, lru_cache
+from typing import BinaryIO, TextIO
+
+import pandas as pd
+
+from .core import aggregate_by_day, select_products
+from .helpers import DEFAULT_MAX_ERRORS
+from .output import export_totals, render_output, write_output
+from .parallel import aggregate_files_by_day
+from .range_index import PrefixSumIndex
+from .schemas import ProductTotal, SalesSummary
+from .typing import ExportFormat, OutputFormat, SortKey
+
+_REPORT_CACHE_SIZE = 256
+
+
+class Dataset:
+    """Validated sales data answering many reports from one load.
+
+    The rows are reduced once to per-(produto, day) sums. The
+    `PrefixSumIndex` over them is built on the first report, and the latest
+    `_REPORT_CACHE_SIZE` summaries are memoized by date range, so repeated
+    queries cost a dictionary lookup and new ranges cost time proportional to
+    the number of products. Returned models are shared between calls and
+    should be treated as read-only.
+
+    Unlike `cli.main`, nothing is printed and validation failures, including
+    missing columns, raise `helpers.DataValidationError` (a `ValueError`)
+    instead of ending the process.
+
+    Parameters
+    ----------
+    daily : pd.DataFrame
+        Aggregate indexed by (produto, data), as returned by
+        `core.aggregate_by_day`.
+
+    Examples
+    --------
+    >>> dataset = Dataset.from_csv("data_test/vendas.csv")  # doctest: +SKIP
+    >>> dataset.report("2025-01-01", "2025-01-31").valor_total  # doctest: +SKIP
+    >>> print(dataset.render("json"))  # doctest: +SKIP
+
+    """
+
+    def __init__(self, daily: pd.DataFrame) -> None:
+        self._daily = daily
+        self._report = lru_cache(maxsize=_REPORT_CACHE_SIZE)(self._compute_report)
+
+    @classmethod
+    def from_csv(
+        cls,
+        csv_paths: str | Sequence[str],
+        encoding: str | None = None,
+        chunk_size: int | None = None,
+        cache_dir: str | None = None,
+        max_errors: int = DEFAULT_MAX_ERRORS,
+        workers: int | None = None,
+    ) -> Dataset:
+        """Load, validate and aggregate one or more CSV files.
+
+        Parameters
+        ----------
+        csv_paths : str | Sequence[str]
+            Path of a CSV file, or paths of several files combined into one
+            dataset.
+        encoding : str | None, optional
+            Explicit input encoding, detected per file when omitted.
+        chunk_size : int | None, optional
+            Stream each file in chunks of this many rows.
+        cache_dir : str | None, optional
+            Reuse validated datasets cached in this directory.
+        max_errors : int, optional
+            Number of row-level failures after which validation stops.
+        workers : int | None, optional
+            Number of worker processes used for several files.
+
+        Returns
+        -------
+        Dataset
+            Dataset over every row of the files.
+
+        Raises
+        ------
+        DataValidationError
+            If a file contains invalid rows.
+
+        """
+
+        paths = [csv_paths] if isinstance(csv_paths, str) else list(csv_paths)
+
+        return cls(
+            aggregate_files_by_day(
+                paths,
+                workers=workers,
+                encoding=encoding,
+                chunk_size=chunk_size,
+                cache_dir=cache_dir,
+                max_errors=max_errors,
+            )
+        )
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> Dataset:
+        """Build a dataset from a validated sales DataFrame.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            DataFrame as returned by `parser.load_csv`.
+
+        Returns
+        -------
+        Dataset
+            Dataset over every row of `df`.
+
+        """
+
+        return cls(aggregate_by_day(df))
+
+    @property
+    def daily(self) -> pd.DataFrame:
+        """Per-(produto, day) sums of quantity and sales cents."""
+
+        return self._daily
+
+    @cached_property
+    def index(self) -> PrefixSumIndex:
+        """Prefix-sum index over `daily`, built on first use."""
+
+        return PrefixSumIndex(self._daily)
+
+    def aggregate(
+        self, start: str | None = None, end: str | None = None
+    ) -> pd.DataFrame:
+        """Return the per-product sums for the inclusive date range.
+
+        Parameters
+        ----------
+        start : str | None, optional
+            Optional start date in ISO YYYY-MM-DD format.
+        end : str | None, optional
+            Optional end date in ISO YYYY-MM-DD format.
+
+        Returns
+        -------
+        pd.DataFrame
+            Frame indexed by produto with `quantidade_total` and
+            `total_centavos`, like `core.aggregate_by_product`.
+
+        """
+
+        return self.index.aggregate(start, end)
+
+    def _compute_report(
+        self,
+        start: str | None,
+        end: str | None,
+        top: int | None,
+        sort_by: SortKey | None,
+    ) -> SalesSummary:
+        return self.index.report(start=start, end=end, top=top, sort_by=sort_by)
+
+    def report(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        top: int | None = None,
+        sort_by: SortKey | None = None,
+    ) -> SalesSummary:
+        """Compute the sales summary for the inclusive date range.
+
+        Parameters
+        ----------
+        start : str | None, optional
+            Optional start date in ISO YYYY-MM-DD format.
+        end : str | None, optional
+            Optional end date in ISO YYYY-MM-DD format. The range only
+            applies when both bounds are given, as in `core.compute_report`.
+        top : int | None, optional
+            List only this many products; see `core.select_products`.
+        sort_by : SortKey | None, optional
+            Order of the listed products; see `core.select_products`.
+
+        Returns
+        -------
+        SalesSummary
+            Same summary `core.compute_report` produces for the loaded rows.
+
+        """
+
+        return self._report(start, end, top, sort_by)
+
+    def totals(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        top: int | None = None,
+        sort_by: SortKey | None = None,
+    ) -> list[ProductTotal]:
+        """Return the per-product totals for the inclusive date range.
+
+        Parameters
+        ----------
+        start : str | None, optional
+            Optional start date in ISO YYYY-MM-DD format.
+        end : str | None, optional
+            Optional end date in ISO YYYY-MM-DD format.
+        top : int | None, optional
+            List only this many products; see `core.select_products`.
+        sort_by : SortKey | None, optional
+            Order of the listed products; see `core.select_products`.
+
+        Returns
+        -------
+        list[ProductTotal]
+            Totals of the products sold in the range, sorted by produto
+            unless `top` or `sort_by` is given.
+
+        """
+
+        return self.report(start, end, top, sort_by).totais_por_produto
+
+    def render(
+        self,
+        fmt: OutputFormat = "text",
+        start: str | None = None,
+        end: str | None = None,
+        top: int | None = None,
+        sort_by: SortKey | None = None,
+    ) -> str:
+        """Render the report for the inclusive date range.
+
+        Parameters
+        ----------
+        fmt : OutputFormat, optional
+            "text", "json" or "ndjson".
+        start : str | None, optional
+            Optional start date in ISO YYYY-MM-DD format.
+        end : str | None, optional
+            Optional end date in ISO YYYY-MM-DD format.
+        top : int | None, optional
+            List only this many products; see `core.select_products`.
+        sort_by : SortKey | None, optional
+            Order of the listed products; see `core.select_products`.
+
+        Returns
+        -------
+        str
+            The report exactly as `vendas-cli` prints it.
+
+        """
+
+        return render_output(
+            summary=self.report(start, end, top, sort_by), output_format=fmt
+        )
+
+    def write(
+        self,
+        file: TextIO,
+        fmt: OutputFormat = "text",
+        start: str | None = None,
+        end: str | None = None,
+        top: int | None = None,
+        sort_by: SortKey | None = None,
+    ) -> None:
+        """Stream the report for the inclusive date range to `file`.
+
+        Parameters
+        ----------
+        file : TextIO
+            Destination, e.g. `sys.stdout` or a file opened for writing.
+        fmt : OutputFormat, optional
+            "text", "json" or "ndjson".
+        start : str | None, optional
+            Optional start date in ISO YYYY-MM-DD format.
+        end : str | None, optional
+            Optional end date in ISO YYYY-MM-DD format.
+        top : int | None, optional
+            List only this many products; see `core.select_products`.
+        sort_by : SortKey | None, optional
+            Order of the listed products; see `core.select_products`.
+
+        """
+
+        write_output(self.report(start, end, top, sort_by), fmt, file)
+
+    def export(
+        self,
+        file: BinaryIO,
+        fmt: ExportFormat,
+        start: str | None = None,
+        end: str | None = None,
+        top: int | None = None,
+        sort_by: SortKey | None = None,
+    ) -> None:
+        """Write the per-product totals for the date range as a table.
+
+        Parameters
+        ----------
+        file : BinaryIO
+            Destination opened in binary mode.
+        fmt : ExportFormat
+            "csv", "parquet" or "arrow".
+        start : str | None, optional
+            Optional start date in ISO YYYY-MM-DD format.
+        end : str | None, optional
+            Optional end date in ISO YYYY-MM-DD format.
+        top : int | None, optional
+            List only this many products; see `core.select_products`.
+        sort_by : SortKey | None, optional
+            Order of the listed products; see `core.select_products`.
+
+        """
+
+        export_totals(
+            select_products(self.aggregate(start, end), top, sort_by), fmt, file
+        )
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import codecs
+
+from .logger import get_logger
+
+logger = get_logger()
+
+_DETECT_SAMPLE_SIZE = 1 << 20
+
+
+def detect_encoding(csv_path: str, sample_size: int = _DETECT_SAMPLE_SIZE) -> str:
+    """Detect the file encoding from a small prefix, without reading it all.
+
+    A UTF-8 byte order mark selects 'utf-8-sig'. Otherwise the prefix is
+    decoded incrementally as UTF-8 (a multi-byte character cut at the end of
+    the sample is not an error); if that fails the file is assumed to be
+    'latin1', which can decode any byte sequence.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    sample_size : int, optional
+        Number of leading bytes to inspect.
+
+    Returns
+    -------
+    str
+        The detected encoding name.
+
+    """
+
+    with open(csv_path, "rb") as file:
+        sample = file.read(sample_size)
+
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return "latin1"
+
+    return "utf-8"
+
+
+def resolve_encoding(csv_path: str, encoding: str | None) -> str:
+    """Return the explicit encoding or detect it, logging the choice.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    encoding : str | None
+        Explicit encoding, or `None` to run `detect_encoding`.
+
+    Returns
+    -------
+    str
+        Encoding to read the file with.
+
+    """
+
+    if encoding:
+        logger.info(f"Using encoding '{encoding}'.")
+        return encoding
+
+    detected = detect_encoding(csv_path)
+    logger.info(f"Detected encoding '{detected}' from the file prefix.")
+    return detected
+
+
+def allows_latin1_fallback(encoding: str) -> bool:
+    """Return whether a decoding failure with `encoding` may retry as latin1.
+
+    Parameters
+    ----------
+    encoding : str
+        Encoding that failed to decode the file.
+
+    Returns
+    -------
+    bool
+        `True` for the UTF-8 family, which keeps the historical fallback.
+
+    """
+
+    return codecs.lookup(encoding).name in {"utf-8", "utf-8-sig"}
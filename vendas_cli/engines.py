@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, cast
+
+from .logger import get_logger
+
+if TYPE_CHECKING:
+    from .schemas import SalesSummary
+
+logger = get_logger()
+
+ENTRY_POINT_GROUP = "vendas_cli.engines"
+
+ReportEngine = Callable[[str, str | None, str | None, str | None], "SalesSummary"]
+
+# Only values that `parser.load_csv` decodes to exactly the same numbers and
+# days are accepted by the non-pandas engines; anything else (signs,
+# exponents, whitespace, more than two decimals, non-ISO dates) raises
+# `EngineFallback`.
+QUANTITY_PATTERN = r"\d{1,18}"
+PRICE_PATTERN = r"\d{1,15}(?:\.\d{0,2})?|\.\d{1,2}"
+DAY_PATTERN = r"\d{4}-\d{2}-\d{2}"
+
+# Largest value of one row (quantidade x preco_unitario), in cents. Rows above
+# it are rejected, so cents stay exact in float64 and per-product sums of
+# millions of rows stay inside int64.
+MAX_SALE_CENTS = 10**12
+
+SCHEMA_COLUMNS = ("produto", "quantidade", "preco_unitario", "data")
+
+# Built-in engines are referenced by "module:function" so that choosing one
+# only imports its own dependencies.
+_BUILTIN_ENGINES = {
+    "pandas": "vendas_cli.engines:compute_report_pandas",
+    "stream": "vendas_cli.stream:compute_report_stream",
+    "arrow": "vendas_cli.arrow_engine:compute_report_arrow",
+}
+
+
+class EngineFallback(Exception):
+    """Raised by an engine when the input needs the pandas engine.
+
+    Engines only accept rows they decode exactly like `parser.load_csv`.
+    Invalid or unusual input raises this instead of a validation error, so
+    `compute_report_with` can re-read the file with the pandas engine, which
+    reports the usual row-numbered messages.
+    """
+
+
+def normalize_header(header: list[str]) -> list[str]:
+    """Normalize CSV header names like `parser.load_csv` does.
+
+    Parameters
+    ----------
+    header : list[str]
+        Raw header row.
+
+    Returns
+    -------
+    list[str]
+        Stripped, lower-cased column names.
+
+    Raises
+    ------
+    EngineFallback
+        If a schema column is missing or a name is repeated.
+
+    """
+
+    columns = [c.strip().lower() for c in header]
+
+    if len(set(columns)) != len(columns) or not set(SCHEMA_COLUMNS) <= set(columns):
+        raise EngineFallback("header")
+
+    return columns
+
+
+def summarize_totals(
+    totals: Iterable[tuple[str, int, int]],
+    start: str | None = None,
+    end: str | None = None,
+) -> SalesSummary:
+    """Build the same `SalesSummary` as `core.summarize_aggregate`.
+
+    Parameters
+    ----------
+    totals : Iterable[tuple[str, int, int]]
+        `(produto, quantidade_total, total_centavos)` entries sorted by
+        produto.
+    start : str | None, optional
+        Start date of the applied filter, if any.
+    end : str | None, optional
+        End date of the applied filter, if any.
+
+    Returns
+    -------
+    SalesSummary
+        Summary with values converted from integer cents.
+
+    """
+
+    from .schemas import ProductTotal, ReportFilters, SalesSummary
+
+    product_totals: list[ProductTotal] = []
+    total_cents = 0
+
+    for produto, units, cents in totals:
+        product_totals.append(
+            ProductTotal(
+                produto=produto, quantidade_total=units, total_vendas=cents / 100
+            )
+        )
+        total_cents += cents
+
+    top_product = (
+        max(product_totals, key=lambda total: total.quantidade_total).produto
+        if product_totals
+        else ""
+    )
+    filters = (
+        ReportFilters.model_validate({"start": start, "end": end})
+        if start and end
+        else None
+    )
+
+    return SalesSummary(
+        valor_total=total_cents / 100,
+        produto_mais_vendido=top_product,
+        totais_por_produto=product_totals,
+        filtros=filters,
+    )
+
+
+def compute_report_pandas(
+    csv_path: str,
+    start: str | None = None,
+    end: str | None = None,
+    encoding: str | None = None,
+) -> SalesSummary:
+    """Compute a report with `parser.load_csv` and `core.compute_report`.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+    encoding : str | None, optional
+        Encoding used to read the CSV, detected when omitted.
+
+    Returns
+    -------
+    SalesSummary
+        Report over the rows inside the inclusive date range.
+
+    """
+
+    from .core import compute_report
+    from .parser import load_csv
+
+    return compute_report(load_csv(csv_path, encoding=encoding), start=start, end=end)
+
+
+def _entry_point_engines() -> dict[str, str]:
+    """Return engines registered by installed packages, by name."""
+
+    from importlib.metadata import entry_points
+
+    return {ep.name: ep.value for ep in entry_points(group=ENTRY_POINT_GROUP)}
+
+
+def available_engines() -> list[str]:
+    """List the names of every registered report engine.
+
+    Built-in engines come first; packages can add more by declaring an entry
+    point in the `vendas_cli.engines` group that points to a function with
+    the signature of `compute_report_pandas`.
+
+    Returns
+    -------
+    list[str]
+        Engine names, built-in ones first.
+
+    """
+
+    return list(dict.fromkeys([*_BUILTIN_ENGINES, *_entry_point_engines()]))
+
+
+def get_engine(name: str) -> ReportEngine:
+    """Load the report function of a registered engine.
+
+    Parameters
+    ----------
+    name : str
+        Engine name, as listed by `available_engines`.
+
+    Returns
+    -------
+    ReportEngine
+        Function taking `(csv_path, start, end, encoding)` and returning a
+        `SalesSummary`.
+
+    Raises
+    ------
+    ValueError
+        If no engine is registered under `name`.
+
+    """
+
+    target = _BUILTIN_ENGINES.get(name) or _entry_point_engines().get(name)
+
+    if target is None:
+        raise ValueError(
+            f"Unknown engine '{name}'. Available: {', '.join(available_engines())}."
+        )
+
+    module_name, _, attribute = target.partition(":")
+    return cast(ReportEngine, getattr(importlib.import_module(module_name), attribute))
+
+
+def compute_report_with(
+    name: str,
+    csv_path: str,
+    start: str | None = None,
+    end: str | None = None,
+    encoding: str | None = None,
+    fallback: Callable[[], SalesSummary] | None = None,
+) -> SalesSummary:
+    """Compute a report with the named engine, falling back to pandas.
+
+    Parameters
+    ----------
+    name : str
+        Engine name, as listed by `available_engines`.
+    csv_path : str
+        Path to the CSV file.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+    encoding : str | None, optional
+        Encoding used to read the CSV, detected when omitted.
+    fallback : Callable[[], SalesSummary] | None, optional
+        Pandas computation used when the engine raises `EngineFallback`,
+        e.g. one honouring a cache or `max_errors`. Defaults to
+        `compute_report_pandas` on the same arguments.
+
+    Returns
+    -------
+    SalesSummary
+        The same report `compute_report_pandas` returns for the file.
+
+    """
+
+    engine = get_engine(name)
+
+    try:
+        return engine(csv_path, start, end, encoding)
+    except EngineFallback as exc:
+        logger.info(
+            f"Engine '{name}' cannot decode the {exc} exactly; using the pandas engine."
+        )
+
+    if fallback is not None:
+        return fallback()
+
+    return compute_report_pandas(csv_path, start, end, encoding)
@@ -1,15 +1,27 @@
+from __future__ import annotations
+
 import argparse
+import codecs
+import glob
 import os
 from datetime import datetime
-
-import pandas as pd
-import pandera as pa
+from typing import TYPE_CHECKING
 
 from .logger import get_logger
-from .validators.validation import ProductsDFModel
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .validators.validation import ProductsDFModel
 
 logger = get_logger()
 
+DEFAULT_MAX_ERRORS = 10
+
+# Suffix of the default `--on-invalid quarantine` reject file, which is
+# written next to its input and must not be read back as sales data.
+REJECT_SUFFIX = ".rejected.csv"
+
 
 def validate_csv_path(path: str) -> str:
     """Validate that the provided path exists and points to a valid CSV file.
@@ -39,6 +51,53 @@ def validate_csv_path(path: str) -> str:
     return path
 
 
+def expand_csv_paths(source: str) -> list[str]:
+    """Expand a CLI input into the CSV files it refers to.
+
+    A directory expands to the `.csv` files directly inside it, a glob
+    pattern (e.g. `exports/2025-01-*.csv`) to its matching `.csv` files, and
+    any other value is checked with `validate_csv_path`. Reject files
+    (`*.rejected.csv`) are left out of directories and patterns. Results are
+    sorted.
+
+    Parameters
+    ----------
+    source : str
+        File path, directory or glob pattern provided via CLI.
+
+    Returns
+    -------
+    list[str]
+        Paths of the matched CSV files.
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        Raised if a plain path is invalid, or if a directory or pattern
+        matches no CSV file.
+    """
+
+    if os.path.isdir(source):
+        pattern = os.path.join(source, "*")
+    elif glob.has_magic(source):
+        pattern = source
+    else:
+        return [validate_csv_path(source)]
+
+    matches = sorted(
+        path
+        for path in glob.glob(pattern)
+        if path.lower().endswith(".csv")
+        and not path.lower().endswith(REJECT_SUFFIX)
+        and os.path.isfile(path)
+    )
+
+    if not matches:
+        raise argparse.ArgumentTypeError(f"No CSV files found for '{source}'")
+
+    return matches
+
+
 def validate_filter_date(date_str: str) -> str:
     """Validate that the date string follows the `YYYY-MM-DD` pattern.
 
@@ -67,6 +126,98 @@ def validate_filter_date(date_str: str) -> str:
         ) from err
 
 
+def validate_positive_int(value: str) -> int:
+    """Validate that the value is a strictly positive integer.
+
+    Parameters
+    ----------
+    value : str
+        Raw value provided via CLI.
+
+    Returns
+    -------
+    int
+        The parsed integer if it is valid.
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        Raised if the value is not an integer greater than zero.
+    """
+
+    try:
+        number = int(value)
+    except ValueError as err:
+        raise argparse.ArgumentTypeError(
+            f"Invalid value '{value}'. Use a positive integer."
+        ) from err
+
+    if number <= 0:
+        raise argparse.ArgumentTypeError(
+            f"Invalid value '{value}'. Use a positive integer."
+        )
+
+    return number
+
+
+def validate_encoding(encoding: str) -> str:
+    """Validate that the encoding name is known to Python's codec registry.
+
+    Parameters
+    ----------
+    encoding : str
+        Encoding name provided via CLI (e.g. `utf-8`, `latin1`).
+
+    Returns
+    -------
+    str
+        The same encoding name if it is valid.
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        Raised if no codec is registered under that name.
+    """
+
+    try:
+        codecs.lookup(encoding)
+    except LookupError as err:
+        raise argparse.ArgumentTypeError(f"Unknown encoding '{encoding}'.") from err
+
+    return encoding
+
+
+def validate_engine(name: str) -> str:
+    """Validate that the name is `auto` or a registered report engine.
+
+    Parameters
+    ----------
+    name : str
+        Engine name provided via CLI (e.g. `pandas`, `stream`, `arrow`).
+
+    Returns
+    -------
+    str
+        The same engine name if it is valid.
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        Raised if no engine is registered under that name.
+    """
+
+    from .engines import available_engines
+
+    engines = available_engines()
+
+    if name != "auto" and name not in engines:
+        raise argparse.ArgumentTypeError(
+            f"Unknown engine '{name}'. Use auto, {', '.join(engines)}."
+        )
+
+    return name
+
+
 def format_currency(value: float) -> str:
     """Format a numeric value as currency with two decimal places.
 
@@ -85,6 +236,84 @@ def format_currency(value: float) -> str:
     return f"{value:.2f}"
 
 
+class DataValidationError(ValueError):
+    """Friendly validation failure that also carries the row-level failures.
+
+    Its message is the formatted error `vendas-cli` prints; only `cli.main`
+    turns it into a process exit, so library callers can handle it like any
+    `ValueError`. Callers that validate data in pieces (e.g. byte ranges of
+    one file) can catch it, shift `failures` rows to global positions and
+    re-format.
+
+    Attributes
+    ----------
+    failures : list[tuple[int, str, str]]
+        `(row, column, detail)` entries, with 1-based row numbers relative to
+        the validated DataFrame index.
+    complete : bool
+        Whether every row was checked, or collection stopped early once
+        enough failures were known.
+
+    """
+
+    def __init__(
+        self,
+        message: str,
+        failures: list[tuple[int, str, str]] | None = None,
+        complete: bool = True,
+    ) -> None:
+        super().__init__(message)
+        self.failures = failures or []
+        self.complete = complete
+
+    def __reduce__(self) -> tuple[type[DataValidationError], tuple[object, ...]]:
+        # Keep the failures when the error crosses a process boundary.
+        return type(self), (str(self), self.failures, self.complete)
+
+
+def format_validation_failures(
+    failures: list[tuple[int, str, str]],
+    max_errors: int = DEFAULT_MAX_ERRORS,
+    complete: bool = True,
+) -> str:
+    """Format row-level failures into the CLI validation error message.
+
+    Parameters
+    ----------
+    failures : list[tuple[int, str, str]]
+        `(row, column, detail)` entries, in any order.
+    max_errors : int, optional
+        Maximum number of failures listed.
+    complete : bool, optional
+        Whether `failures` covers every row, or collection stopped early.
+
+    Returns
+    -------
+    str
+        Message listing up to `max_errors` failures sorted by row and column,
+        followed by how many more there are, or by a note that more may exist
+        when collection stopped early.
+
+    """
+
+    sorted_errors = sorted(failures, key=lambda x: (x[0], x[1]))
+
+    messages = [f"Row {row}: {detail}" for row, _, detail in sorted_errors]
+
+    formatted = "\n".join(messages[:max_errors])
+    hidden = max(len(messages) - max_errors, 0)
+
+    if not complete:
+        # Rows after the stop were never checked, so no count is meaningful.
+        footer = "... more errors may exist (validation stopped early)"
+    elif hidden:
+        footer = f"... and {hidden} more"
+    else:
+        footer = "..."
+
+    return f"[ERROR] Data validation failed:\n{formatted}\n{footer}"
+
+
 def validate_data(df: pd.DataFrame, model: type[ProductsDFModel]) -> pd.DataFrame:
     """Validate a DataFrame using a Pandera schema and reformat raw Pandera errors into
     clear, user-friendly CLI messages.
@@ -104,13 +333,18 @@ def validate_data(df: pd.DataFrame, model: type[ProductsDFModel]) -> pd.DataFram
 
     Raises
     ------
-    SystemExit
-        Exits the CLI with a friendly formatted error message summarizing validation
-        issues when data does not conform to the schema. Displays up to 10 error lines,
-        and appends `...` if more errors were detected.
+    DataValidationError
+        With a friendly formatted error message summarizing validation issues
+        when data does not conform to the schema. Displays up to 10 error lines,
+        and appends `...` if more errors were detected. Row-level failures are
+        kept in its `failures` attribute; missing columns have none.
 
     """
 
+    import pandera as pa
+
+    from .engines import MAX_SALE_CENTS
+
     try:
         return model.validate(df, lazy=True)
     except pa.errors.SchemaErrors as err:
@@ -121,17 +355,16 @@ def validate_data(df: pd.DataFrame, model: type[ProductsDFModel]) -> pd.DataFram
 
         if missing_columns:
             missing_list = ", ".join(sorted(missing_columns))
-            raise SystemExit(
+            raise DataValidationError(
                 f"[ERROR] Missing required column(s): {missing_list}. "
                 "Ensure the CSV headers match the expected schema."
             ) from None
 
         failures = err.failure_cases
-        messages = []
 
         error_buffer = []
 
-        for _, failure in failures.iterrows():
+        for failure in failures.to_dict("records"):
             idx = failure.get("index", None)
             column = failure.get("column", "?")
             failure_case = failure.get("failure_case", "<empty>")
@@ -142,27 +375,37 @@ def validate_data(df: pd.DataFrame, model: type[ProductsDFModel]) -> pd.DataFram
 
             row = int(idx) + 1
 
-            if "null" in check or "nullable" in check:
-                text = f"Row {row}: required field '{column}' is missing or empty."
+            if check == "sale_value_range":
+                # Reported once per row, on the price column.
+                if column != "preco_unitario":
+                    continue
+                detail = (
+                    "quantidade × preco_unitario exceeds the maximum sale value "
+                    f"of {format_currency(MAX_SALE_CENTS / 100)} per row."
+                )
+            elif check == "whole_cents":
+                detail = (
+                    f"invalid value '{failure_case}' in column '{column}' — "
+                    "more than two decimal places."
+                )
+            elif "null" in check or "nullable" in check:
+                detail = f"required field '{column}' is missing or empty."
             elif "type" in check or "coerce" in check:
-                text = f"Row {row}: invalid value '{failure_case}' in column '{column}' — incorrect type."
+                detail = f"invalid value '{failure_case}' in column '{column}' — incorrect type."
             elif "greater_than" in check:
-                text = f"Row {row}: invalid value '{failure_case}' in column '{column}' — negative."
-            else:
-                text = (
-                    f"Row {row}: validation error in column '{column}': {failure_case}"
+                detail = (
+                    f"invalid value '{failure_case}' in column '{column}' — negative."
                 )
+            else:
+                detail = f"validation error in column '{column}': {failure_case}"
 
-            error_buffer.append((row, column, text))
-
-        sorted_errors = sorted(error_buffer, key=lambda x: (x[0], x[1]))
-
-        messages = [text for _, _, text in sorted_errors]
+            error_buffer.append((row, column, detail))
 
-        if not messages:
-            raise SystemExit(
+        if not error_buffer:
+            raise DataValidationError(
                 "[ERROR] Validation failed, but all errors were internal Pandera-level and ignored."
             ) from None
 
-        formatted = "\n".join(messages[:10])
-        raise SystemExit(f"[ERROR] Data validation failed:\n{formatted}\n...") from None
+        raise DataValidationError(
+            format_validation_failures(error_buffer), error_buffer
+        ) from None
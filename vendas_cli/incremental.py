@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any
+
+import pandas as pd
+
+from .core import aggregate_by_day, merge_aggregates, summarize_daily
+from .encoding import resolve_encoding
+from .helpers import DEFAULT_MAX_ERRORS
+from .logger import get_logger
+from .parser import data_start_offset, iter_byte_range_chunks
+from .schemas import SalesSummary
+from .typing import IncrementalState
+
+logger = get_logger()
+
+STATE_FORMAT_VERSION = 2
+
+_HEAD_SAMPLE_SIZE = 64 * 1024
+_SCAN_BLOCK_SIZE = 1 << 16
+
+
+def _complete_rows_end(csv_path: str, start: int) -> int:
+    """Return the offset just after the last line break at or after `start`.
+
+    A trailing line without a line break may still be being written, so the
+    stored offset never moves past it; see `_read_unterminated_tail`.
+    """
+
+    with open(csv_path, "rb") as file:
+        position = os.fstat(file.fileno()).st_size
+
+        while position > start:
+            block_start = max(start, position - _SCAN_BLOCK_SIZE)
+            file.seek(block_start)
+            block = file.read(position - block_start)
+            if (index := block.rfind(b"\n")) >= 0:
+                return block_start + index + 1
+            position = block_start
+
+    return start
+
+
+def _read_unterminated_tail(
+    csv_path: str, start: int, encoding: str, row_offset: int
+) -> pd.DataFrame | None:
+    """Aggregate a last row written without a line break, if it is valid.
+
+    Many exporters omit the final line break, so such a row is included in
+    the current report. It is not folded into the stored state, since it may
+    still be being written; the next run reads it again. A row that does not
+    validate is assumed to be partial and skipped with a warning.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    start : int
+        Offset just after the last line break, from `_complete_rows_end`.
+    encoding : str
+        Resolved encoding of the file.
+    row_offset : int
+        Number of data rows before the tail, for error row numbers.
+
+    Returns
+    -------
+    pd.DataFrame | None
+        Daily aggregate of the tail, or `None` when there is none to add.
+
+    """
+
+    end = os.path.getsize(csv_path)
+    if end <= start:
+        return None
+
+    try:
+        chunks = list(
+            iter_byte_range_chunks(
+                csv_path, (start, end), encoding, row_offset=row_offset
+            )
+        )
+    except (UnicodeDecodeError, ValueError) as exc:
+        logger.warning(
+            f"Skipped the unterminated last row of {csv_path}, which looks "
+            f"partially written ({str(exc).splitlines()[-1]}); it is read "
+            "again on the next run."
+        )
+        return None
+
+    return merge_aggregates(aggregate_by_day(chunk) for chunk in chunks)
+
+
+def _head_digest(csv_path: str, length: int) -> str:
+    """Hash the first `length` bytes of the file, capped at a small sample."""
+
+    with open(csv_path, "rb") as file:
+        return hashlib.sha256(file.read(min(length, _HEAD_SAMPLE_SIZE))).hexdigest()
+
+
+def _daily_to_columns(daily: pd.DataFrame) -> dict[str, list[Any]]:
+    """Serialize a per-(produto, day) aggregate into JSON-friendly columns."""
+
+    flat = daily.reset_index()
+
+    return {
+        "produto": flat["produto"].astype(str).tolist(),
+        "data": pd.to_datetime(flat["data"]).dt.strftime("%Y-%m-%d").tolist(),
+        "quantidade_total": flat["quantidade_total"].astype("int64").tolist(),
+        "total_centavos": flat["total_centavos"].astype("int64").tolist(),
+    }
+
+
+def _daily_from_columns(columns: dict[str, list[Any]]) -> pd.DataFrame:
+    """Rebuild a per-(produto, day) aggregate from its serialized columns."""
+
+    if not columns.get("produto"):
+        return aggregate_by_day(pd.DataFrame())
+
+    flat = pd.DataFrame(columns)
+    flat["data"] = pd.to_datetime(flat["data"], format="%Y-%m-%d")
+
+    return flat.set_index(["produto", "data"])
+
+
+def load_state(state_path: str) -> IncrementalState | None:
+    """Read a persisted incremental state, if present and readable.
+
+    Parameters
+    ----------
+    state_path : str
+        Path to the JSON state file.
+
+    Returns
+    -------
+    IncrementalState | None
+        The stored state, or `None` when there is no usable state.
+
+    """
+
+    try:
+        with open(state_path, encoding="utf-8") as file:
+            state: IncrementalState = json.load(file)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        logger.warning(f"Ignoring unreadable state file {state_path}: {exc}")
+        return None
+
+    if state.get("version") != STATE_FORMAT_VERSION:
+        logger.warning(f"Ignoring state file {state_path} from another version.")
+        return None
+
+    return state
+
+
+def save_state(state_path: str, state: IncrementalState) -> None:
+    """Write the incremental state atomically.
+
+    Parameters
+    ----------
+    state_path : str
+        Path to the JSON state file.
+    state : IncrementalState
+        State to persist.
+
+    """
+
+    directory = os.path.dirname(os.path.abspath(state_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(state, file, ensure_ascii=False)
+        os.replace(tmp_path, state_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _is_same_file(state: IncrementalState, csv_path: str, encoding: str | None) -> bool:
+    """Check that the state still describes a prefix of the current file."""
+
+    if state["csv_path"] != os.path.abspath(csv_path):
+        return False
+    if encoding and encoding != state["encoding"]:
+        return False
+    if os.path.getsize(csv_path) < state["offset"]:
+        return False
+    return _head_digest(csv_path, state["offset"]) == state["head_sha256"]
+
+
+def update_daily_aggregates(
+    csv_path: str,
+    state_path: str,
+    encoding: str | None = None,
+    chunk_size: int | None = None,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+) -> pd.DataFrame:
+    """Fold rows appended since the last run into the persisted daily sums.
+
+    Only the bytes after the stored offset are parsed and validated. The
+    state advances up to the last complete line; a last row without a line
+    break is added to the returned sums when it validates, but re-read on the
+    next run. If the file was truncated, replaced or read with a different
+    encoding, the state is rebuilt from the beginning.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the append-only CSV file.
+    state_path : str
+        Path to the JSON state file, created on the first run.
+    encoding : str | None, optional
+        Explicit input encoding, detected on the first run when omitted.
+    chunk_size : int | None, optional
+        Parse the appended rows in chunks of this many rows.
+    max_errors : int, optional
+        Number of row-level failures after which validation stops.
+
+    Returns
+    -------
+    pd.DataFrame
+        Per-(produto, day) aggregate covering every consumed row and a valid
+        unterminated last row.
+
+    Raises
+    ------
+    ValueError
+        If the appended rows cannot be decoded with the stored encoding.
+
+    """
+
+    state = load_state(state_path)
+
+    if state is not None and not _is_same_file(state, csv_path, encoding):
+        logger.warning(f"{csv_path} no longer matches {state_path}; rebuilding.")
+        state = None
+
+    if state is None:
+        resolved = resolve_encoding(csv_path, encoding)
+        offset, rows = data_start_offset(csv_path), 0
+        daily = aggregate_by_day(pd.DataFrame())
+    else:
+        resolved = state["encoding"]
+        offset, rows = state["offset"], state["rows"]
+        daily = _daily_from_columns(state["daily"])
+
+    end = _complete_rows_end(csv_path, offset)
+    logger.info(f"Ingesting {end - offset} new byte(s) from {csv_path}")
+
+    partials = [daily]
+    if end > offset:
+        try:
+            for chunk in iter_byte_range_chunks(
+                csv_path,
+                (offset, end),
+                resolved,
+                chunk_size=chunk_size,
+                row_offset=rows,
+                max_errors=max_errors,
+            ):
+                partials.append(aggregate_by_day(chunk))
+                rows += len(chunk)
+        except UnicodeDecodeError as exc:
+            raise ValueError(
+                f"Failed to decode new rows of '{csv_path}' as {resolved}. "
+                "Delete the state file and use --encoding to rebuild it."
+            ) from exc
+
+    daily = merge_aggregates(partials)
+
+    save_state(
+        state_path,
+        IncrementalState(
+            version=STATE_FORMAT_VERSION,
+            csv_path=os.path.abspath(csv_path),
+            encoding=resolved,
+            offset=end,
+            rows=rows,
+            head_sha256=_head_digest(csv_path, end),
+            daily=_daily_to_columns(daily),
+        ),
+    )
+
+    tail = _read_unterminated_tail(csv_path, end, resolved, rows)
+
+    return daily if tail is None else merge_aggregates([daily, tail])
+
+
+def compute_report_incremental(
+    csv_path: str,
+    state_path: str,
+    start: str | None = None,
+    end: str | None = None,
+    encoding: str | None = None,
+    chunk_size: int | None = None,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+) -> SalesSummary:
+    """Refresh the persisted daily sums and compute the report from them.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the append-only CSV file.
+    state_path : str
+        Path to the JSON state file.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+    encoding : str | None, optional
+        Explicit input encoding, detected on the first run when omitted.
+    chunk_size : int | None, optional
+        Parse the appended rows in chunks of this many rows.
+    max_errors : int, optional
+        Number of row-level failures after which validation stops.
+
+    Returns
+    -------
+    SalesSummary
+        Summary over every row consumed so far.
+
+    """
+
+    daily = update_daily_aggregates(
+        csv_path,
+        state_path,
+        encoding=encoding,
+        chunk_size=chunk_size,
+        max_errors=max_errors,
+    )
+
+    return summarize_daily(daily, start=start, end=end)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+
+import pandas as pd
+from pydantic import TypeAdapter, ValidationError
+
+from .dataset import Dataset
+from .logger import get_logger
+from .schemas import ReportJob
+from .typing import OutputFormat
+
+logger = get_logger()
+
+_JOBS_ADAPTER = TypeAdapter(list[ReportJob])
+
+
+def load_jobs(jobs_path: str) -> list[ReportJob]:
+    """Read and validate a batch file of report specs.
+
+    The file holds a JSON list of objects with optional `start`, `end`,
+    `format` and `output` keys, e.g.
+    `[{"start": "2025-01-01", "end": "2025-01-31", "output": "jan.txt"}]`.
+
+    Parameters
+    ----------
+    jobs_path : str
+        Path to the JSON jobs file.
+
+    Returns
+    -------
+    list[ReportJob]
+        Validated report specs, in file order.
+
+    Raises
+    ------
+    ValueError
+        If the file cannot be read, is not valid JSON or a spec is invalid.
+
+    """
+
+    try:
+        with open(jobs_path, encoding="utf-8") as file:
+            raw = json.load(file)
+        jobs = _JOBS_ADAPTER.validate_python(raw)
+    except OSError as exc:
+        raise ValueError(f"Cannot read jobs file '{jobs_path}': {exc}") from None
+    except (json.JSONDecodeError, ValidationError) as exc:
+        raise ValueError(f"Invalid jobs file '{jobs_path}': {exc}") from None
+
+    if not jobs:
+        raise ValueError(f"Jobs file '{jobs_path}' does not list any report.")
+
+    return jobs
+
+
+def run_jobs(
+    daily: pd.DataFrame,
+    jobs: list[ReportJob],
+    default_format: OutputFormat = "text",
+) -> list[str]:
+    """Render every report of a batch from one daily aggregate.
+
+    One `dataset.Dataset` serves every spec, so each report only costs time
+    proportional to the number of products. Reports with an `output` path
+    are streamed to that file; the others are returned for printing.
+
+    Parameters
+    ----------
+    daily : pd.DataFrame
+        Aggregate indexed by (produto, data) over the whole dataset.
+    jobs : list[ReportJob]
+        Report specs, e.g. from `load_jobs`.
+    default_format : OutputFormat, optional
+        Format used by specs that do not set one.
+
+    Returns
+    -------
+    list[str]
+        Rendered reports without an `output` path, in spec order.
+
+    """
+
+    dataset = Dataset(daily)
+    stdout_reports: list[str] = []
+
+    for job in jobs:
+        output_format = job.format or default_format
+        start = job.start.isoformat() if job.start else None
+        end = job.end.isoformat() if job.end else None
+
+        if job.output is None:
+            stdout_reports.append(dataset.render(output_format, start=start, end=end))
+            continue
+
+        with open(job.output, "w", encoding="utf-8") as file:
+            dataset.write(file, output_format, start=start, end=end)
+        logger.info(f"Wrote report to {job.output}")
+
+    return stdout_reports
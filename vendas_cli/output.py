@@ -1,10 +1,57 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable, Iterator
+from json.encoder import encode_basestring
+from typing import TYPE_CHECKING, Any, BinaryIO, TextIO, get_args
 
 from .helpers import format_currency
 from .schemas import ProductTotal, ReportFilters, SalesSummary
-from .typing import OutputFormat
+from .typing import ExportFormat, OutputFormat
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+EXPORT_FORMATS: tuple[ExportFormat, ...] = get_args(ExportFormat)
+
+
+def _load_line_encoder() -> Callable[[Any], str]:
+    """Return a compact JSON encoder, `orjson` when it is installed."""
+
+    try:
+        import orjson
+    except ImportError:
+        return lambda obj: json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+    return lambda obj: orjson.dumps(obj).decode("utf-8")
+
+
+_encode_line = _load_line_encoder()
+
+
+def _iter_text_lines(
+    totals: list[ProductTotal],
+    total_value: float,
+    top_product: str,
+    filters: ReportFilters | None,
+) -> Iterator[str]:
+    """Yield the lines of the text table, without line breaks."""
+
+    if not totals:
+        yield "NO ITEMS FOUND IN THIS PERIOD"
+    else:
+        yield f"TOTAL SALES: {format_currency(total_value)}"
+        yield f"TOP PRODUCT: {top_product}"
+        yield ""
+        yield "PRODUCT                        QTY     TOTAL VALUE"
+        yield "--------------------------------------------------"
+
+        for entry in totals:
+            yield f"{entry.produto:<30}  {entry.quantidade_total:>4}  {format_currency(entry.total_vendas):>12}"
+
+    if filters:
+        yield ""
+        yield f"FILTER APPLIED: {filters.start} : {filters.end}"
 
 
 def render_text_table(
@@ -33,59 +80,202 @@ def render_text_table(
 
     """
 
-    lines: list[str] = []
+    return "\n".join(_iter_text_lines(totals, total_value, top_product, filters))
 
-    if not totals:
-        lines.append("NO ITEMS FOUND IN THIS PERIOD")
-    else:
-        lines.append(f"TOTAL SALES: { format_currency(total_value) }")
-        lines.append(f"TOP PRODUCT: { top_product }")
-        lines.append("")
-        lines.append("PRODUCT                        QTY     TOTAL VALUE")
-        lines.append("--------------------------------------------------")
 
-        for entry in totals:
-            lines.append(
-                f"{entry.produto:<30}  {entry.quantidade_total:>4}  { format_currency(entry.total_vendas):>12}"
+def _iter_json(summary: SalesSummary) -> Iterator[str]:
+    """Yield `json.dumps(summary, indent=2)` one product total at a time.
+
+    Keys follow the field order of `SalesSummary`, and each total is written
+    straight from its attributes instead of a `model_dump` dictionary, using
+    the same string escaping and float `repr` as `json.dumps`.
+    """
+
+    yield "{\n"
+    yield f'  "valor_total": {summary.valor_total!r},\n'
+    yield f'  "produto_mais_vendido": {encode_basestring(summary.produto_mais_vendido)},\n'
+
+    if not summary.totais_por_produto:
+        yield '  "totais_por_produto": []'
+    else:
+        yield '  "totais_por_produto": ['
+        separator = "\n"
+        for entry in summary.totais_por_produto:
+            yield (
+                f"{separator}    {{\n"
+                f'      "produto": {encode_basestring(entry.produto)},\n'
+                f'      "quantidade_total": {entry.quantidade_total},\n'
+                f'      "total_vendas": {entry.total_vendas!r}\n'
+                "    }"
             )
+            separator = ",\n"
+        yield "\n  ]"
 
-    if filters:
-        lines.append("")
-        lines.append(f"FILTER APPLIED: {filters.start} : {filters.end}")
+    if summary.filtros is not None:
+        yield (
+            ',\n  "filtros": {\n'
+            f'    "start": "{summary.filtros.start.isoformat()}",\n'
+            f'    "end": "{summary.filtros.end.isoformat()}"\n'
+            "  }"
+        )
 
-    return "\n".join(lines)
+    yield "\n}"
 
 
-def render_output(
+def _iter_ndjson(summary: SalesSummary) -> Iterator[str]:
+    """Yield one JSON line with the summary fields, then one per product."""
+
+    yield _encode_line(
+        summary.model_dump(
+            mode="json", exclude_none=True, exclude={"totais_por_produto"}
+        )
+    )
+
+    for entry in summary.totais_por_produto:
+        yield "\n" + _encode_line(
+            {
+                "produto": entry.produto,
+                "quantidade_total": entry.quantidade_total,
+                "total_vendas": entry.total_vendas,
+            }
+        )
+
+
+def iter_output(
     summary: SalesSummary,
     output_format: OutputFormat,
-) -> str:
-    """Render the sales summary in the requested output format.
+) -> Iterator[str]:
+    """Render the sales summary incrementally.
+
+    Only one product total is formatted at a time, so the first chunk is
+    available immediately and no complete copy of the report is built.
 
     Parameters
     ----------
     summary : SalesSummary
         The fully computed summary model.
     output_format : OutputFormat
-        Either "text" or "json".
+        "text", "json" or "ndjson".
 
     Returns
     -------
-    str
-        JSON string or formatted table string.
+    Iterator[str]
+        Chunks whose concatenation equals `render_output(summary, output_format)`.
 
     """
 
     if output_format == "json":
-        return json.dumps(
-            summary.model_dump(mode="json", exclude_none=True),
-            ensure_ascii=False,
-            indent=2,
-        )
+        return _iter_json(summary)
 
-    return render_text_table(
+    if output_format == "ndjson":
+        return _iter_ndjson(summary)
+
+    lines = _iter_text_lines(
         totals=summary.totais_por_produto,
         total_value=summary.valor_total,
         top_product=summary.produto_mais_vendido,
         filters=summary.filtros,
     )
+    return (line if index == 0 else f"\n{line}" for index, line in enumerate(lines))
+
+
+def write_output(
+    summary: SalesSummary,
+    output_format: OutputFormat,
+    file: TextIO,
+) -> None:
+    """Stream the rendered summary to `file`, followed by a line break.
+
+    Parameters
+    ----------
+    summary : SalesSummary
+        The fully computed summary model.
+    output_format : OutputFormat
+        "text", "json" or "ndjson".
+    file : TextIO
+        Destination, e.g. `sys.stdout` or a file opened for writing.
+
+    """
+
+    for chunk in iter_output(summary, output_format):
+        file.write(chunk)
+    file.write("\n")
+
+
+def render_output(
+    summary: SalesSummary,
+    output_format: OutputFormat,
+) -> str:
+    """Render the sales summary in the requested output format.
+
+    Parameters
+    ----------
+    summary : SalesSummary
+        The fully computed summary model.
+    output_format : OutputFormat
+        "text", "json" or "ndjson" (one JSON object per line: the summary
+        fields first, then one line per product total).
+
+    Returns
+    -------
+    str
+        JSON string or formatted table string.
+
+    """
+
+    return "".join(iter_output(summary, output_format))
+
+
+def export_totals(
+    aggregated: pd.DataFrame,
+    export_format: ExportFormat,
+    file: BinaryIO,
+) -> None:
+    """Write per-product totals as a CSV, Parquet or Arrow IPC table.
+
+    The columns are converted in bulk by the pandas and Arrow writers, so no
+    Python value is formatted per product. The table has the columns
+    `produto`, `quantidade_total` (int64) and `total_vendas` (float64), one
+    row per product in the order of `aggregated`.
+
+    Parameters
+    ----------
+    aggregated : pd.DataFrame
+        Per-product sums indexed by produto, as returned by
+        `core.aggregate_by_product` or `PrefixSumIndex.aggregate`.
+    export_format : ExportFormat
+        "csv", "parquet" or "arrow" (the Arrow IPC file format, also known
+        as Feather v2).
+    file : BinaryIO
+        Destination opened in binary mode, e.g. `sys.stdout.buffer`.
+
+    Raises
+    ------
+    ValueError
+        If `parquet` or `arrow` is requested and `pyarrow` is not installed.
+
+    """
+
+    table = (
+        aggregated.reset_index()
+        .loc[:, ["produto", "quantidade_total"]]
+        .astype({"quantidade_total": "int64"})
+        .assign(total_vendas=aggregated["total_centavos"].to_numpy("int64") / 100)
+    )
+
+    if export_format == "csv":
+        table.to_csv(file, index=False, encoding="utf-8")
+        return
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ValueError(
+            f"--format {export_format} requires pyarrow. Install it with "
+            "`pip install 'vendas-cli[arrow]'`."
+        ) from None
+
+    if export_format == "parquet":
+        table.to_parquet(file, index=False)
+    else:
+        table.to_feather(file)
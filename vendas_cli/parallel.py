@@ -0,0 +1,612 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+
+import pandas as pd
+
+from .cache import load_csv_cached
+from .core import (
+    aggregate_by_day,
+    aggregate_by_product,
+    aggregate_chunks,
+    filter_by_date,
+    merge_aggregates,
+    summarize_aggregate,
+)
+from .encoding import allows_latin1_fallback, resolve_encoding
+from .helpers import (
+    DEFAULT_MAX_ERRORS,
+    DataValidationError,
+    format_validation_failures,
+)
+from .logger import get_logger
+from .parser import (
+    count_rows_before,
+    iter_byte_range_chunks,
+    iter_csv_chunks,
+    load_csv,
+    split_byte_ranges,
+)
+from .schemas import SalesSummary
+
+logger = get_logger()
+
+
+def _prefix_errors(
+    task: Callable[[], pd.DataFrame], csv_path: str | None
+) -> pd.DataFrame:
+    """Run `task`, prefixing validation messages with `csv_path` when given."""
+
+    try:
+        return task()
+    except DataValidationError as exc:
+        if csv_path is None:
+            raise
+        raise DataValidationError(
+            f"{csv_path}: {exc}", exc.failures, exc.complete
+        ) from None
+
+
+def aggregate_file(
+    csv_path: str,
+    start: str | None = None,
+    end: str | None = None,
+    encoding: str | None = None,
+    chunk_size: int | None = None,
+    cache_dir: str | None = None,
+    cache_hash: bool = False,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+) -> pd.DataFrame:
+    """Load one CSV file and reduce it to per-product partial sums.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+    encoding : str | None, optional
+        Explicit input encoding, detected per file when omitted.
+    chunk_size : int | None, optional
+        Stream the file in chunks of this many rows instead of loading it whole.
+    cache_dir : str | None, optional
+        Reuse validated datasets cached in this directory (see
+        `cache.load_csv_cached`). Ignored in chunked mode.
+    cache_hash : bool, optional
+        Include a content hash in the cache key.
+    max_errors : int, optional
+        Number of row-level failures after which validation stops.
+
+    Returns
+    -------
+    pd.DataFrame
+        Per-product aggregate indexed by produto.
+
+    Raises
+    ------
+    DataValidationError
+        If the file fails validation. The message is prefixed with the file
+        path so errors from different inputs can be told apart.
+
+    """
+
+    def task() -> pd.DataFrame:
+        if chunk_size:
+            chunks = iter_csv_chunks(
+                csv_path,
+                chunk_size=chunk_size,
+                encoding=encoding,
+                max_errors=max_errors,
+            )
+            return aggregate_chunks(chunks, start=start, end=end)
+
+        return load_csv_aggregate(
+            csv_path,
+            start=start,
+            end=end,
+            encoding=encoding,
+            cache_dir=cache_dir,
+            cache_hash=cache_hash,
+            max_errors=max_errors,
+        )
+
+    return _prefix_errors(task, csv_path)
+
+
+def aggregate_byte_range(
+    csv_path: str,
+    byte_range: tuple[int, int],
+    encoding: str,
+    start: str | None = None,
+    end: str | None = None,
+    chunk_size: int | None = None,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+) -> pd.DataFrame:
+    """Parse, validate and aggregate the data rows inside one byte range.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    byte_range : tuple[int, int]
+        Newline-aligned `(start, end)` range from `parser.split_byte_ranges`.
+    encoding : str
+        Encoding resolved for the whole file.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+    chunk_size : int | None, optional
+        Stream the range in chunks of this many rows.
+    max_errors : int, optional
+        Number of row-level failures after which validation stops.
+
+    Returns
+    -------
+    pd.DataFrame
+        Per-product aggregate indexed by produto.
+
+    Raises
+    ------
+    DataValidationError
+        If rows fail validation. Row numbers are relative to the range.
+
+    """
+
+    chunks = iter_byte_range_chunks(
+        csv_path,
+        byte_range,
+        encoding=encoding,
+        chunk_size=chunk_size,
+        max_errors=max_errors,
+    )
+    return aggregate_chunks(chunks, start=start, end=end)
+
+
+def _collect_range_results(
+    csv_path: str,
+    byte_ranges: list[tuple[int, int]],
+    futures: list[Future[pd.DataFrame]],
+    max_errors: int = DEFAULT_MAX_ERRORS,
+) -> list[pd.DataFrame]:
+    """Gather range aggregates, re-raising validation errors with global rows.
+
+    Row-level failures from every failing range are shifted by the number of
+    data rows before that range, which is only counted on this error path,
+    and reported together exactly as a single-process run would.
+    """
+
+    results: list[pd.DataFrame] = []
+    failures: list[tuple[int, str, str]] = []
+    complete = True
+
+    for byte_range, future in zip(byte_ranges, futures, strict=True):
+        try:
+            results.append(future.result())
+        except DataValidationError as exc:
+            offset = count_rows_before(csv_path, byte_range[0])
+            failures.extend(
+                (row + offset, col, text) for row, col, text in exc.failures
+            )
+            complete = complete and exc.complete
+
+    if failures:
+        raise DataValidationError(
+            format_validation_failures(failures, max_errors, complete),
+            failures,
+            complete,
+        )
+
+    return results
+
+
+def aggregate_split_file(
+    csv_path: str,
+    start: str | None = None,
+    end: str | None = None,
+    workers: int | None = None,
+    encoding: str | None = None,
+    chunk_size: int | None = None,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+) -> pd.DataFrame:
+    """Aggregate one CSV file by parsing newline-aligned byte ranges in parallel.
+
+    The file is split into one byte range per worker; each range is parsed,
+    validated and reduced to per-product partials in its own process.
+    Validation errors keep the row numbers of a sequential run.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file. Quoted fields must not contain line breaks.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+    workers : int | None, optional
+        Number of worker processes and byte ranges. Defaults to the CPU count.
+    encoding : str | None, optional
+        Explicit input encoding, detected from the file prefix when omitted.
+    chunk_size : int | None, optional
+        Stream each range in chunks of this many rows.
+    max_errors : int, optional
+        Number of row-level failures after which validation stops.
+
+    Returns
+    -------
+    pd.DataFrame
+        Per-product aggregate indexed by produto.
+
+    """
+
+    workers = workers or os.cpu_count() or 1
+    encoding = resolve_encoding(csv_path, encoding)
+    byte_ranges = split_byte_ranges(csv_path, workers)
+
+    logger.info(
+        f"Parsing {csv_path} as {len(byte_ranges)} byte range(s) "
+        f"with {workers} worker(s)"
+    )
+
+    if not byte_ranges:
+        return load_csv_aggregate(
+            csv_path, start=start, end=end, encoding=encoding, max_errors=max_errors
+        )
+
+    def run(file_encoding: str) -> list[pd.DataFrame]:
+        task = partial(
+            aggregate_byte_range,
+            csv_path,
+            encoding=file_encoding,
+            start=start,
+            end=end,
+            chunk_size=chunk_size,
+            max_errors=max_errors,
+        )
+        with ProcessPoolExecutor(max_workers=min(workers, len(byte_ranges))) as pool:
+            futures = [pool.submit(task, byte_range) for byte_range in byte_ranges]
+            return _collect_range_results(csv_path, byte_ranges, futures, max_errors)
+
+    try:
+        return merge_aggregates(run(encoding))
+    except UnicodeDecodeError as exc:
+        if not allows_latin1_fallback(encoding):
+            raise ValueError(f"Failed to decode '{csv_path}' as {encoding}.") from exc
+
+        logger.warning("UTF-8 decoding failed; falling back to latin1.")
+        return merge_aggregates(run("latin1"))
+
+
+def load_csv_aggregate(
+    csv_path: str,
+    start: str | None = None,
+    end: str | None = None,
+    encoding: str | None = None,
+    cache_dir: str | None = None,
+    cache_hash: bool = False,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+) -> pd.DataFrame:
+    """Load a whole CSV file in-process and reduce it to per-product sums.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+    encoding : str | None, optional
+        Explicit input encoding, detected from the file prefix when omitted.
+    cache_dir : str | None, optional
+        Reuse validated datasets cached in this directory, or `None` to
+        always parse the file.
+    cache_hash : bool, optional
+        Include a content hash in the cache key.
+    max_errors : int, optional
+        Number of row-level failures after which validation stops.
+
+    Returns
+    -------
+    pd.DataFrame
+        Per-product aggregate indexed by produto.
+
+    """
+
+    df = (
+        load_csv_cached(
+            csv_path,
+            encoding=encoding,
+            cache_dir=cache_dir,
+            content_hash=cache_hash,
+            max_errors=max_errors,
+        )
+        if cache_dir
+        else load_csv(csv_path, encoding=encoding, max_errors=max_errors)
+    )
+    return aggregate_by_product(filter_by_date(df, start=start, end=end))
+
+
+def aggregate_files(
+    csv_paths: list[str],
+    start: str | None = None,
+    end: str | None = None,
+    workers: int | None = None,
+    encoding: str | None = None,
+    chunk_size: int | None = None,
+    split: bool = False,
+    cache_dir: str | None = None,
+    cache_hash: bool = False,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+) -> pd.DataFrame:
+    """Aggregate many CSV files in a process pool and merge their partials.
+
+    Parameters
+    ----------
+    csv_paths : list[str]
+        Paths of the CSV files to aggregate.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+    workers : int | None, optional
+        Number of worker processes. Defaults to the CPU count, capped at the
+        number of files. With a single worker, files are processed in-process.
+    encoding : str | None, optional
+        Explicit input encoding, detected per file when omitted.
+    chunk_size : int | None, optional
+        Stream each file in chunks of this many rows.
+    split : bool, optional
+        Process files one at a time, each split into byte ranges parsed by
+        all workers (see `aggregate_split_file`). Best for a few huge files.
+    cache_dir : str | None, optional
+        Reuse validated datasets cached in this directory when whole files
+        are loaded.
+    cache_hash : bool, optional
+        Include a content hash in the cache key.
+    max_errors : int, optional
+        Number of row-level failures after which validation stops.
+
+    Returns
+    -------
+    pd.DataFrame
+        Merged per-product aggregate indexed by produto.
+
+    """
+
+    if split:
+        return merge_aggregates(
+            _prefix_errors(
+                partial(
+                    aggregate_split_file,
+                    path,
+                    start=start,
+                    end=end,
+                    workers=workers,
+                    encoding=encoding,
+                    chunk_size=chunk_size,
+                    max_errors=max_errors,
+                ),
+                path if len(csv_paths) > 1 else None,
+            )
+            for path in csv_paths
+        )
+
+    workers = min(workers or os.cpu_count() or 1, len(csv_paths))
+
+    task = partial(
+        aggregate_file,
+        start=start,
+        end=end,
+        encoding=encoding,
+        chunk_size=chunk_size,
+        cache_dir=cache_dir,
+        cache_hash=cache_hash,
+        max_errors=max_errors,
+    )
+
+    logger.info(f"Aggregating {len(csv_paths)} file(s) with {workers} worker(s)")
+
+    if workers <= 1:
+        return merge_aggregates(task(path) for path in csv_paths)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return merge_aggregates(executor.map(task, csv_paths))
+
+
+def aggregate_file_by_day(
+    csv_path: str,
+    encoding: str | None = None,
+    chunk_size: int | None = None,
+    cache_dir: str | None = None,
+    cache_hash: bool = False,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+    reject_path: str | None = None,
+) -> pd.DataFrame:
+    """Load one CSV file and reduce it to per-(produto, day) partial sums.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    encoding : str | None, optional
+        Explicit input encoding, detected per file when omitted.
+    chunk_size : int | None, optional
+        Stream the file in chunks of this many rows instead of loading it whole.
+    cache_dir : str | None, optional
+        Reuse validated datasets cached in this directory. Ignored in chunked
+        mode.
+    cache_hash : bool, optional
+        Include a content hash in the cache key.
+    max_errors : int, optional
+        Number of row-level failures after which validation stops.
+    reject_path : str | None, optional
+        Quarantine invalid rows to this CSV file instead of failing. The cache
+        is bypassed, since it only holds fully valid datasets.
+
+    Returns
+    -------
+    pd.DataFrame
+        Daily aggregate indexed by (produto, data), covering every valid row.
+
+    """
+
+    if chunk_size:
+        chunks = iter_csv_chunks(
+            csv_path,
+            chunk_size=chunk_size,
+            encoding=encoding,
+            max_errors=max_errors,
+            reject_path=reject_path,
+        )
+        return merge_aggregates(aggregate_by_day(chunk) for chunk in chunks)
+
+    df = (
+        load_csv_cached(
+            csv_path,
+            encoding=encoding,
+            cache_dir=cache_dir,
+            content_hash=cache_hash,
+            max_errors=max_errors,
+        )
+        if cache_dir and not reject_path
+        else load_csv(
+            csv_path,
+            encoding=encoding,
+            max_errors=max_errors,
+            reject_path=reject_path,
+        )
+    )
+    return aggregate_by_day(df)
+
+
+def aggregate_files_by_day(
+    csv_paths: list[str],
+    workers: int | None = None,
+    encoding: str | None = None,
+    chunk_size: int | None = None,
+    cache_dir: str | None = None,
+    cache_hash: bool = False,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+) -> pd.DataFrame:
+    """Aggregate many CSV files into one per-(produto, day) aggregate.
+
+    Unlike `aggregate_files`, no date filter is applied, so the result can
+    answer reports for any date range (see `range_index.PrefixSumIndex`).
+
+    Parameters
+    ----------
+    csv_paths : list[str]
+        Paths of the CSV files to aggregate.
+    workers : int | None, optional
+        Number of worker processes; see `aggregate_files`.
+    encoding : str | None, optional
+        Explicit input encoding, detected per file when omitted.
+    chunk_size : int | None, optional
+        Stream each file in chunks of this many rows.
+    cache_dir : str | None, optional
+        Reuse validated datasets cached in this directory when whole files
+        are loaded.
+    cache_hash : bool, optional
+        Include a content hash in the cache key.
+    max_errors : int, optional
+        Number of row-level failures after which validation stops.
+
+    Returns
+    -------
+    pd.DataFrame
+        Merged daily aggregate indexed by (produto, data).
+
+    """
+
+    workers = min(workers or os.cpu_count() or 1, len(csv_paths))
+    prefix = len(csv_paths) > 1
+
+    task = partial(
+        aggregate_file_by_day,
+        encoding=encoding,
+        chunk_size=chunk_size,
+        cache_dir=cache_dir,
+        cache_hash=cache_hash,
+        max_errors=max_errors,
+    )
+
+    def run(path: str) -> pd.DataFrame:
+        return _prefix_errors(partial(task, path), path if prefix else None)
+
+    logger.info(f"Aggregating {len(csv_paths)} file(s) by day with {workers} worker(s)")
+
+    if workers <= 1:
+        return merge_aggregates(run(path) for path in csv_paths)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(task, path) for path in csv_paths]
+        return merge_aggregates(
+            _prefix_errors(future.result, path if prefix else None)
+            for path, future in zip(csv_paths, futures, strict=True)
+        )
+
+
+def compute_report_files(
+    csv_paths: list[str],
+    start: str | None = None,
+    end: str | None = None,
+    workers: int | None = None,
+    encoding: str | None = None,
+    chunk_size: int | None = None,
+    split: bool = False,
+    cache_dir: str | None = None,
+    cache_hash: bool = False,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+) -> SalesSummary:
+    """Compute a single sales summary across many CSV files.
+
+    Parameters
+    ----------
+    csv_paths : list[str]
+        Paths of the CSV files to aggregate.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+    workers : int | None, optional
+        Number of worker processes; see `aggregate_files`.
+    encoding : str | None, optional
+        Explicit input encoding, detected per file when omitted.
+    chunk_size : int | None, optional
+        Stream each file in chunks of this many rows.
+    split : bool, optional
+        Split each file into byte ranges parsed in parallel.
+    cache_dir : str | None, optional
+        Reuse validated datasets cached in this directory.
+    cache_hash : bool, optional
+        Include a content hash in the cache key.
+    max_errors : int, optional
+        Number of row-level failures after which validation stops.
+
+    Returns
+    -------
+    SalesSummary
+        Summary over the union of all rows from every file.
+
+    """
+
+    aggregated = aggregate_files(
+        csv_paths,
+        start=start,
+        end=end,
+        workers=workers,
+        encoding=encoding,
+        chunk_size=chunk_size,
+        split=split,
+        cache_dir=cache_dir,
+        cache_hash=cache_hash,
+        max_errors=max_errors,
+    )
+
+    return summarize_aggregate(aggregated, start=start, end=end)
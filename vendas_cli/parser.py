@@ -1,75 +1,872 @@
 from __future__ import annotations
 
 import csv
+import io
+import os
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from itertools import islice
+from typing import IO, Any, TextIO
 
+import numpy as np
 import pandas as pd
 
-from .helpers import validate_data
+from .encoding import allows_latin1_fallback, resolve_encoding
+from .engines import QUANTITY_PATTERN
+from .helpers import (
+    DEFAULT_MAX_ERRORS,
+    DataValidationError,
+    format_validation_failures,
+    validate_data,
+)
 from .logger import get_logger
-from .validators.validation import ProductsDFModel
+from .validators.validation import ProductsDFModel, is_valid_typed_frame
 
 logger = get_logger()
 
+_TEXT_CHUNK_SIZE = 50_000
+# The first text frame is kept small so a file broken from its first rows is
+# rejected after validating about `max_errors` rows, not a full frame.
+_MIN_TEXT_FRAME = 1_000
 
-def load_csv(
+# `produto`, `quantidade` and `data` repeat a few thousand distinct values
+# across millions of rows, so the C parser dictionary-encodes them while
+# reading. Quantities are kept as text until `_parse_quantities` checks them,
+# since an int64 read would also accept values such as `1.0`, `1e3` or `True`.
+_TYPED_DTYPES = {
+    "produto": "category",
+    "quantidade": "category",
+    "preco_unitario": "float64",
+    "data": "category",
+}
+
+
+def _parse_days(days: pd.Series) -> pd.Series:
+    """Parse a date column by converting each distinct string only once.
+
+    Parameters
+    ----------
+    days : pd.Series
+        Date strings, ideally already categorical.
+
+    Returns
+    -------
+    pd.Series
+        datetime64[ns] days (time of day dropped), `NaT` where a value is
+        missing or not an ISO 8601 date.
+
+    """
+
+    categorical = days.astype("category")
+    parsed = (
+        pd.DatetimeIndex(
+            pd.to_datetime(
+                categorical.cat.categories, format="ISO8601", errors="coerce"
+            )
+        )
+        .normalize()
+        .astype("datetime64[ns]")
+    )
+
+    # Missing values have code -1, which picks the trailing NaT.
+    lookup = np.append(parsed.to_numpy(), np.datetime64("NaT", "ns"))
+
+    return pd.Series(
+        lookup[categorical.cat.codes.to_numpy()], index=days.index, name=days.name
+    )
+
+
+def _parse_quantities(quantities: pd.Series) -> pd.Series:
+    """Convert quantities written as plain integer literals to int64.
+
+    Only values matching `engines.QUANTITY_PATTERN` are converted, each
+    distinct string once, so the typed path accepts exactly the literals the
+    schema would, independently of the rest of the file.
+
+    Parameters
+    ----------
+    quantities : pd.Series
+        Quantity strings, ideally already categorical.
+
+    Returns
+    -------
+    pd.Series
+        int64 quantities.
+
+    Raises
+    ------
+    ValueError
+        If a value is missing or is not a plain non-negative integer literal.
+
+    """
+
+    categorical = quantities.astype("category")
+    literals = categorical.cat.categories.astype(str)
+
+    if categorical.isna().any() or not literals.str.fullmatch(QUANTITY_PATTERN).all():
+        raise ValueError("quantidade contains values that are not integer literals")
+
+    lookup = literals.astype("int64").to_numpy()
+
+    return pd.Series(
+        lookup[categorical.cat.codes.to_numpy()],
+        index=quantities.index,
+        name=quantities.name,
+    )
+
+
+def _cast_fields(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast validated string columns to native int64/float64/datetime64 types.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame already accepted by `validate_data`.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with numeric and date columns cast and a categorical
+        `produto` column.
+
+    Raises
+    ------
+    ValueError
+        If numeric or date parsing fails after schema validation.
+
+    """
+
+    try:
+        df["produto"] = df["produto"].astype("category")
+        df["quantidade"] = pd.to_numeric(df["quantidade"], errors="raise").astype(
+            "int64"
+        )
+        df["preco_unitario"] = pd.to_numeric(
+            df["preco_unitario"], errors="raise"
+        ).astype("float64")
+        df["data"] = pd.to_datetime(df["data"], errors="coerce").dt.normalize()
+    except Exception as exc:
+        raise ValueError(f"Failed to parse fields: {exc}") from exc
+
+    return df
+
+
+def _validate_and_cast(df: pd.DataFrame) -> pd.DataFrame:
+    """Validate a raw string DataFrame and cast its fields to native types.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Raw DataFrame built from CSV rows, with normalized column names.
+
+    Returns
+    -------
+    pd.DataFrame
+        Validated DataFrame with numeric and date columns cast.
+
+    Raises
+    ------
+    ValueError
+        If numeric or date parsing fails after schema validation.
+
+    """
+
+    return _cast_fields(validate_data(df, ProductsDFModel))
+
+
+def _fit_row(row: list[str], width: int) -> list[str | None]:
+    """Pad or truncate a CSV row to the header width, like `csv.DictReader`."""
+
+    fitted: list[str | None] = list(row[:width])
+    fitted.extend([None] * (width - len(fitted)))
+    return fitted
+
+
+class _ByteRangeReader(io.RawIOBase):
+    """Read-only binary stream over the `[start, end)` byte range of a file."""
+
+    def __init__(self, csv_path: str, byte_range: tuple[int, int]) -> None:
+        super().__init__()
+        start, end = byte_range
+        self._file = open(csv_path, "rb")  # noqa: SIM115
+        self._file.seek(start)
+        self._remaining = end - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        size = min(len(buffer), self._remaining)
+        if size <= 0:
+            return 0
+        read = self._file.readinto(memoryview(buffer)[:size])
+        self._remaining -= read
+        return read
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+def _open_text(
+    csv_path: str, encoding: str, byte_range: tuple[int, int] | None
+) -> TextIO:
+    """Open the whole file, or only one byte range of it, as text."""
+
+    if byte_range is None:
+        return open(csv_path, encoding=encoding, newline="")  # noqa: SIM115
+
+    raw = io.BufferedReader(_ByteRangeReader(csv_path, byte_range))
+    return io.TextIOWrapper(raw, encoding=encoding, newline="")
+
+
+def _iter_raw_frames(
     csv_path: str,
-    encoding: str = "utf-8",
-) -> pd.DataFrame:
-    """Load and validate a CSV file into a pandas DataFrame.
+    encoding: str,
+    chunk_size: int | None,
+    skip_rows: int = 0,
+    byte_range: tuple[int, int] | None = None,
+    row_offset: int = 0,
+    first_size: int | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Read CSV rows as unvalidated string DataFrames using the `csv` module.
+
+    This is the reference decoding used to build row-numbered validation
+    errors: values are kept exactly as written and missing trailing fields
+    become `None`, as with `csv.DictReader`.
 
     Parameters
     ----------
     csv_path : str
         Path to the CSV file.
-    encoding : str, optional
-        Encoding used to read the CSV. Defaults to 'utf-8', with fallback to 'latin1'.
+    encoding : str
+        Encoding used to read the CSV.
+    chunk_size : int | None
+        Maximum number of data rows per frame, or `None` for a single frame.
+    skip_rows : int, optional
+        Number of leading data rows to skip. The row index still counts them.
+    byte_range : tuple[int, int] | None, optional
+        Only read data rows from this newline-aligned byte range; the header
+        is still taken from the start of the file.
+    row_offset : int, optional
+        Index of the first data row read, used as the start of the row index.
+    first_size : int | None, optional
+        Number of rows of the first frame. Later frames double in size until
+        they reach `chunk_size`.
 
-    Returns
-    -------
+    Yields
+    ------
+    pd.DataFrame
+        Raw string frame with normalized column names and a global row index.
+
+    """
+
+    with open(csv_path, encoding=encoding, newline="") as file:
+        header = [c.strip().lower() for c in next(csv.reader(file), [])]
+
+    width = len(header)
+
+    with _open_text(csv_path, encoding, byte_range) as file:
+        reader = csv.reader(file, delimiter=",")
+        if byte_range is None:
+            next(reader, None)
+        rows = islice((row for row in reader if row), skip_rows, None)
+
+        offset = row_offset + skip_rows
+        size = chunk_size if first_size is None else first_size
+        while batch := list(islice(rows, size)):
+            padded = [_fit_row(row, width) for row in batch]
+            index = pd.RangeIndex(offset, offset + len(padded))
+            offset += len(padded)
+            if size is not None and size != chunk_size:
+                size = 2 * size if chunk_size is None else min(2 * size, chunk_size)
+
+            yield pd.DataFrame(padded, columns=header, index=index)
+
+        if offset == row_offset == 0:
+            yield pd.DataFrame(columns=header)
+
+
+def _iter_typed_frames(
+    csv_path: str,
+    encoding: str,
+    chunk_size: int | None,
+    byte_range: tuple[int, int] | None = None,
+    row_offset: int = 0,
+) -> Iterator[pd.DataFrame]:
+    """Read CSV rows straight into native dtypes with the pandas C parser.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    encoding : str
+        Encoding used to read the CSV.
+    chunk_size : int | None
+        Maximum number of data rows per frame, or `None` for a single frame.
+    byte_range : tuple[int, int] | None, optional
+        Only read data rows from this newline-aligned byte range; the header
+        is still taken from the start of the file.
+    row_offset : int, optional
+        Index of the first data row read, used as the start of the row index.
+
+    Yields
+    ------
     pd.DataFrame
-        Fully validated DataFrame, optionally filtered by date range.
+        Frame with categorical `produto`, int64 `quantidade`, float64
+        `preco_unitario` and datetime64 `data`, not yet checked against the
+        schema. Dates are parsed once per distinct value.
 
     Raises
     ------
     ValueError
-        If file decoding fails, numeric parsing fails, or schema validation fails.
+        If any value cannot be converted to its column type, or a quantity
+        is not a plain integer literal.
 
     """
 
-    logger.info(f"Reading CSV from path: {csv_path}")
+    header = pd.read_csv(csv_path, encoding=encoding, nrows=0).columns
+    columns = [str(c).strip().lower() for c in header]
+
+    options = {
+        "encoding": encoding,
+        "header": 0 if byte_range is None else None,
+        "names": columns,
+        "index_col": False,
+        "keep_default_na": False,
+        "dtype": {c: _TYPED_DTYPES[c] for c in columns if c in _TYPED_DTYPES},
+    }
+
+    with ExitStack() as stack:
+        source: str | IO[bytes] = csv_path
+        if byte_range is not None:
+            source = stack.enter_context(
+                io.BufferedReader(_ByteRangeReader(csv_path, byte_range))
+            )
+
+        frames: Iterator[pd.DataFrame] = (
+            pd.read_csv(source, chunksize=chunk_size, **options)  # type: ignore[call-overload]
+            if chunk_size
+            else iter([pd.read_csv(source, **options)])  # type: ignore[call-overload]
+        )
+
+        for df in frames:
+            if row_offset:
+                df.index = df.index + row_offset
+            if "quantidade" in df.columns:
+                df["quantidade"] = _parse_quantities(df["quantidade"])
+            if "data" in df.columns:
+                df["data"] = _parse_days(df["data"])
+            yield df
+
+
+def _iter_checked_text_frames(
+    frames: Iterator[pd.DataFrame], max_errors: int
+) -> Iterator[pd.DataFrame]:
+    """Validate raw text frames, collecting row failures across frames.
+
+    Failing frames are not yielded; their failures are accumulated in row
+    order and raised together once `max_errors` are known or the input ends.
+    Frames after the first failure are only read to find more errors.
+    """
+
+    failures: list[tuple[int, str, str]] = []
+
+    for df in frames:
+        try:
+            validated = _validate_and_cast(df)
+        except DataValidationError as exc:
+            if not exc.failures:
+                # Frame-level errors such as missing columns end validation.
+                raise
+            failures.extend(exc.failures)
+            if len(failures) >= max_errors:
+                raise DataValidationError(
+                    format_validation_failures(failures, max_errors, complete=False),
+                    failures,
+                    complete=False,
+                ) from None
+            continue
+
+        if not failures:
+            yield validated
+
+    if failures:
+        raise DataValidationError(
+            format_validation_failures(failures, max_errors), failures
+        )
+
+
+class _RejectWriter:
+    """Append quarantined rows and their error reasons to a side CSV file.
+
+    The file is truncated when opened, and the header is written with the
+    first rejected frame, so it always describes the latest run only.
+    """
+
+    def __init__(self, reject_path: str) -> None:
+        self.path = reject_path
+        self.count = 0
+        self._file = open(reject_path, "w", encoding="utf-8", newline="")  # noqa: SIM115
+
+    def write(self, rejected: pd.DataFrame, reasons: pd.Series) -> None:
+        rejected = rejected.assign(erros=reasons.to_numpy())
+        rejected.insert(0, "linha", rejected.index + 1)
+        rejected.to_csv(self._file, header=not self.count, index=False)
+        self.count += len(rejected)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _iter_quarantined_text_frames(
+    frames: Iterator[pd.DataFrame], rejects: _RejectWriter
+) -> Iterator[pd.DataFrame]:
+    """Validate raw text frames, diverting failing rows to `rejects`.
+
+    Row-level failures of a frame are grouped by row in one pass and those
+    rows are dropped. Pandera skips value checks on columns that failed
+    coercion, so the rest of the frame is validated again until it passes;
+    the rejected rows are then written in row order with their reasons and
+    the valid rows are yielded (possibly as an empty frame).
+    """
+
+    for raw in frames:
+        df = raw
+        reasons: list[pd.Series] = []
+
+        while True:
+            try:
+                validated = _validate_and_cast(df)
+                break
+            except DataValidationError as exc:
+                if not exc.failures:
+                    raise
+                failures = pd.DataFrame(
+                    exc.failures, columns=["row", "column", "detail"]
+                )
+
+            reasons.append(
+                failures.drop_duplicates()
+                .sort_values(["row", "column"], kind="stable")
+                .groupby("row")["detail"]
+                .agg("; ".join)
+            )
+            df = df.drop(index=reasons[-1].index - 1)
+
+        if reasons:
+            rejected = pd.concat(reasons).sort_index()
+            rejects.write(raw.loc[rejected.index.to_numpy() - 1], rejected)
+
+        yield validated
+
 
-    rows = None
+def _iter_validated_frames(
+    csv_path: str,
+    encoding: str,
+    chunk_size: int | None,
+    byte_range: tuple[int, int] | None = None,
+    row_offset: int = 0,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+    rejects: _RejectWriter | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield validated, typed frames, preferring the typed fast path.
+
+    Frames are decoded once, straight into native dtypes, and checked with
+    the vectorized `is_valid_typed_frame` instead of Pandera. As soon as a
+    frame fails conversion or that check, the remaining rows are re-read as
+    text and go through `validate_data`, so Pandera only runs on dirty data
+    and error messages are exactly the row-numbered ones produced for raw
+    CSV values. The text pass starts with a frame of `10 * max_errors` rows
+    (at least `_MIN_TEXT_FRAME`), doubles the frames up to `chunk_size` or
+    `_TEXT_CHUNK_SIZE` and stops as soon as
+    `max_errors` failures are known, so rejecting a broken file does not
+    require checking all of it. With `rejects`, invalid rows are quarantined
+    to that writer instead and only the valid rows are yielded.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    encoding : str
+        Encoding used to read the CSV.
+    chunk_size : int | None
+        Maximum number of data rows per frame, or `None` for a single frame.
+    byte_range : tuple[int, int] | None, optional
+        Only read data rows from this newline-aligned byte range.
+    row_offset : int, optional
+        Index of the first data row read, used as the start of the row index.
+    max_errors : int, optional
+        Number of row-level failures after which validation stops.
+    rejects : _RejectWriter | None, optional
+        Quarantine invalid rows here instead of failing.
+
+    Yields
+    ------
+    pd.DataFrame
+        Validated frame with numeric and date columns cast.
+
+    Raises
+    ------
+    DataValidationError
+        If rows fail validation without `rejects`, listing up to
+        `max_errors` of them.
+
+    """
+
+    consumed = 0
 
     try:
-        with open(csv_path, encoding=encoding, newline="") as file:
-            reader = csv.DictReader(file, delimiter=",")
-            rows = list(reader)
+        for df in _iter_typed_frames(
+            csv_path, encoding, chunk_size, byte_range, row_offset
+        ):
+            if not is_valid_typed_frame(df):
+                raise ValueError("typed frame does not satisfy ProductsDFModel")
+            consumed += len(df)
+            yield df
+        return
     except UnicodeDecodeError:
-        logger.warning("UTF-8 decoding failed; falling back to latin1.")
-        with open(csv_path, encoding="latin1", newline="") as file:
-            reader = csv.DictReader(file, delimiter=",")
-            rows = list(reader)
+        raise
+    except ValueError:
+        logger.info(
+            "Typed fast path rejected the data; re-reading remaining rows as text "
+            "for detailed validation."
+        )
 
-    logger.info(
-        f"CSV successfully read using Python's 'csv' module. Total rows: {len(rows)}"
+    frame_size = chunk_size or _TEXT_CHUNK_SIZE
+    text_frames = _iter_raw_frames(
+        csv_path,
+        encoding,
+        frame_size,
+        skip_rows=consumed,
+        byte_range=byte_range,
+        row_offset=row_offset,
+        first_size=min(frame_size, max(_MIN_TEXT_FRAME, 10 * max_errors)),
     )
+    checked = (
+        _iter_quarantined_text_frames(text_frames, rejects)
+        if rejects
+        else _iter_checked_text_frames(text_frames, max_errors)
+    )
+
+    if chunk_size:
+        yield from checked
+    elif frames := list(checked):
+        yield pd.concat(frames) if len(frames) > 1 else frames[0]
+
+
+def data_start_offset(csv_path: str) -> int:
+    """Return the byte offset of the first data row, right after the header.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+
+    Returns
+    -------
+    int
+        Size in bytes of the header line, including its line break.
+
+    """
+
+    with open(csv_path, "rb") as file:
+        file.readline()
+        return file.tell()
+
+
+def split_byte_ranges(csv_path: str, parts: int) -> list[tuple[int, int]]:
+    """Split the data rows of a CSV file into newline-aligned byte ranges.
+
+    The header line is excluded. Each boundary is moved forward to just after
+    the next newline, so every range holds whole rows. Quoted fields must not
+    contain line breaks.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    parts : int
+        Desired number of ranges. Fewer are returned for small files.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Non-empty `(start, end)` byte ranges covering every data row in order.
+
+    """
+
+    data_start = data_start_offset(csv_path)
+
+    with open(csv_path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+
+        step = max((size - data_start) // max(parts, 1), 1)
+        boundaries = [data_start]
+
+        for target in range(data_start + step, size, step):
+            if target <= boundaries[-1]:
+                continue
+            file.seek(target - 1)
+            file.readline()
+            boundaries.append(min(file.tell(), size))
+
+    boundaries.append(size)
+
+    return [
+        (start, end)
+        for start, end in zip(boundaries, boundaries[1:], strict=False)
+        if end > start
+    ]
+
+
+def count_rows_before(csv_path: str, offset: int) -> int:
+    """Count the non-blank data rows stored before a byte offset.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    offset : int
+        Newline-aligned byte offset, as produced by `split_byte_ranges`.
+
+    Returns
+    -------
+    int
+        Number of data rows between the header and `offset`.
+
+    """
+
+    rows = 0
+
+    with open(csv_path, "rb") as file:
+        file.readline()
+        while file.tell() < offset and (line := file.readline()):
+            rows += line not in (b"\n", b"\r\n")
+
+    return rows
+
+
+def iter_byte_range_chunks(
+    csv_path: str,
+    byte_range: tuple[int, int],
+    encoding: str,
+    chunk_size: int | None = None,
+    row_offset: int = 0,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+) -> Iterator[pd.DataFrame]:
+    """Stream validated frames for the data rows inside one byte range.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    byte_range : tuple[int, int]
+        Newline-aligned `(start, end)` range from `split_byte_ranges`.
+    encoding : str
+        Encoding used to read the CSV. Must be resolved beforehand, since a
+        range taken from the middle of the file cannot be detected reliably.
+    chunk_size : int | None, optional
+        Maximum number of data rows per frame, or `None` for a single frame.
+    row_offset : int, optional
+        Number of data rows before the range, so validation errors can report
+        global row numbers.
+    max_errors : int, optional
+        Number of row-level failures after which validation stops.
+
+    Yields
+    ------
+    pd.DataFrame
+        Validated frame with numeric and date columns cast.
 
-    df = pd.DataFrame(rows)
+    """
+
+    yield from _iter_validated_frames(
+        csv_path,
+        encoding,
+        chunk_size,
+        byte_range=byte_range,
+        row_offset=row_offset,
+        max_errors=max_errors,
+    )
 
-    df.columns = [c.strip().lower() for c in df.columns]
 
-    df = validate_data(df, ProductsDFModel)
+@contextmanager
+def _open_rejects(reject_path: str | None) -> Iterator[_RejectWriter | None]:
+    """Open a `_RejectWriter` for `reject_path`, or yield `None` without one."""
 
-    logger.info("Casting numeric fields with strict validation")
+    if reject_path is None:
+        yield None
+        return
 
+    rejects = _RejectWriter(reject_path)
     try:
-        df["quantidade"] = pd.to_numeric(
-            df["quantidade"], errors="raise", downcast="integer"
+        yield rejects
+    finally:
+        rejects.close()
+
+
+def iter_csv_chunks(
+    csv_path: str,
+    chunk_size: int,
+    encoding: str | None = None,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+    reject_path: str | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Stream a CSV file as validated DataFrames of at most `chunk_size` rows.
+
+    Only one chunk is held in memory at a time. Each chunk keeps a global
+    row index, so validation errors report the same row numbers as
+    `load_csv` would for the whole file.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    chunk_size : int
+        Maximum number of data rows per chunk.
+    encoding : str | None, optional
+        Encoding used to read the CSV. Detected from the file prefix when
+        omitted. A UTF-8 failure before the first chunk falls back to 'latin1'.
+    max_errors : int, optional
+        Number of row-level failures after which validation stops.
+    reject_path : str | None, optional
+        Quarantine invalid rows to this CSV file, with their 1-based row
+        number and error reasons, and keep streaming the valid ones.
+
+    Yields
+    ------
+    pd.DataFrame
+        Validated chunk with numeric and date columns cast.
+
+    Raises
+    ------
+    ValueError
+        If numeric parsing fails for any chunk, or if the file stops decoding
+        after chunks were already produced.
+
+    """
+
+    logger.info(f"Streaming CSV from path: {csv_path} (chunk size: {chunk_size})")
+
+    encoding = resolve_encoding(csv_path, encoding)
+
+    total = 0
+    with _open_rejects(reject_path) as rejects:
+        try:
+            for df in _iter_validated_frames(
+                csv_path, encoding, chunk_size, max_errors=max_errors, rejects=rejects
+            ):
+                total += len(df)
+                yield df
+        except UnicodeDecodeError as exc:
+            if (
+                total
+                or (rejects and rejects.count)
+                or not allows_latin1_fallback(encoding)
+            ):
+                raise ValueError(
+                    f"Failed to decode '{csv_path}' as {encoding} after {total} rows. "
+                    "Use --encoding to select the correct encoding."
+                ) from exc
+
+            logger.warning("UTF-8 decoding failed; falling back to latin1.")
+            for df in _iter_validated_frames(
+                csv_path, "latin1", chunk_size, max_errors=max_errors, rejects=rejects
+            ):
+                total += len(df)
+                yield df
+
+        invalid = rejects.count if rejects else 0
+
+    logger.info(f"CSV streamed in chunks. Total rows: {total}")
+
+    if rejects:
+        logger.warning(f"Quarantined {invalid} invalid rows to {reject_path}.")
+
+
+def _read_validated(
+    csv_path: str,
+    encoding: str,
+    max_errors: int,
+    reject_path: str | None,
+) -> pd.DataFrame:
+    """Read the whole file as one validated frame, recording quarantined rows."""
+
+    with _open_rejects(reject_path) as rejects:
+        df = next(
+            _iter_validated_frames(
+                csv_path,
+                encoding,
+                chunk_size=None,
+                max_errors=max_errors,
+                rejects=rejects,
+            )
         )
-        df["preco_unitario"] = pd.to_numeric(df["preco_unitario"], errors="raise")
-        df["data"] = pd.to_datetime(df["data"], errors="coerce").dt.date
-    except Exception as exc:
-        raise ValueError(f"Failed to parse fields: {exc}") from exc
+
+    if rejects:
+        df.attrs["invalid_products"] = {
+            "total_invalid": rejects.count,
+            "reject_path": reject_path,
+        }
+
+    return df
+
+
+def load_csv(
+    csv_path: str,
+    encoding: str | None = None,
+    max_errors: int = DEFAULT_MAX_ERRORS,
+    reject_path: str | None = None,
+) -> pd.DataFrame:
+    """Load and validate a CSV file into a pandas DataFrame.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    encoding : str | None, optional
+        Encoding used to read the CSV. Detected from the file prefix when
+        omitted. A UTF-8 failure falls back to 'latin1'.
+    max_errors : int, optional
+        Number of row-level failures after which validation stops.
+    reject_path : str | None, optional
+        Quarantine invalid rows to this CSV file, with their 1-based row
+        number and error reasons, and return only the valid ones. Their count
+        is kept in `df.attrs["invalid_products"]["total_invalid"]`.
+
+    Returns
+    -------
+    pd.DataFrame
+        Fully validated DataFrame with categorical `produto`, int64
+        `quantidade`, float64 `preco_unitario` and datetime64 `data` columns,
+        sorted by `data`
+        (stable, so rows of the same day keep their file order and index).
+
+    Raises
+    ------
+    ValueError
+        If file decoding fails, numeric parsing fails, or schema validation fails.
+
+    """
+
+    logger.info(f"Reading CSV from path: {csv_path}")
+
+    encoding = resolve_encoding(csv_path, encoding)
+
+    try:
+        df = _read_validated(csv_path, encoding, max_errors, reject_path)
+    except UnicodeDecodeError as exc:
+        if not allows_latin1_fallback(encoding):
+            raise ValueError(f"Failed to decode '{csv_path}' as {encoding}.") from exc
+
+        logger.warning("UTF-8 decoding failed; falling back to latin1.")
+        df = _read_validated(csv_path, "latin1", max_errors, reject_path)
+
+    logger.info(f"CSV successfully read and typed. Total rows: {len(df)}")
+
+    if not df["data"].is_monotonic_increasing:
+        df = df.sort_values("data", kind="stable")
 
     logger.info(
         f"CSV validated. Discarded {df.attrs.get('invalid_products', {}).get('total_invalid', 0)} invalid rows."
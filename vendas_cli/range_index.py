@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from .core import aggregate_by_day, aggregate_by_product, summarize_aggregate
+from .schemas import SalesSummary
+from .typing import SortKey
+
+
+def _day_ordinal(value: str | pd.Timestamp) -> int:
+    """Return the number of days between the Unix epoch and `value`."""
+
+    return int(np.datetime64(pd.Timestamp(value).date(), "D").astype("int64"))
+
+
+class PrefixSumIndex:
+    """Per-product cumulative sums by day, answering date ranges in O(products).
+
+    The index is built once from per-(produto, day) sums sorted by product and
+    day. Each entry gets the key `product_code * span + day`, and running
+    totals are kept over that order. The sum of a product between two days is
+    then the difference of two running totals, located with one vectorized
+    binary search per bound, so a report costs time proportional to the
+    number of products and is independent of the number of rows. Sales values
+    are integer cents, so the differences are exact. Memory is proportional
+    to the number of distinct (produto, day) pairs.
+
+    Building the index sorts the daily aggregate, which only pays off when
+    several ranges are answered from one load: `dataset.Dataset` builds it
+    for `--jobs` batches, the `serve` mode and library callers. A single
+    CLI report filters the rows while aggregating them instead.
+
+    Parameters
+    ----------
+    daily : pd.DataFrame
+        Aggregate indexed by (produto, data), as returned by
+        `core.aggregate_by_day`.
+
+    """
+
+    __slots__ = (
+        "_products",
+        "_keys",
+        "_first_day",
+        "_span",
+        "_cum_quantity",
+        "_cum_cents",
+    )
+
+    def __init__(self, daily: pd.DataFrame) -> None:
+        flat = daily.reset_index().sort_values(["produto", "data"], kind="stable")
+
+        codes, products = pd.factorize(flat["produto"], sort=True)
+        days = flat["data"].to_numpy().astype("datetime64[D]").astype("int64")
+
+        self._products = np.asarray(products, dtype=object)
+        self._first_day = int(days.min()) if len(days) else 0
+        self._span = int(days.max()) - self._first_day + 1 if len(days) else 1
+        self._keys = codes.astype("int64") * self._span + (days - self._first_day)
+
+        self._cum_quantity = np.concatenate(
+            ([0], np.cumsum(flat["quantidade_total"].to_numpy(dtype="int64")))
+        )
+        self._cum_cents = np.concatenate(
+            ([0], np.cumsum(flat["total_centavos"].to_numpy(dtype="int64")))
+        )
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> PrefixSumIndex:
+        """Build the index from a validated sales DataFrame.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            DataFrame as returned by `parser.load_csv`.
+
+        Returns
+        -------
+        PrefixSumIndex
+            Index over every row of `df`.
+
+        """
+
+        return cls(aggregate_by_day(df))
+
+    def aggregate(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> pd.DataFrame:
+        """Return per-product sums for the inclusive date range.
+
+        Parameters
+        ----------
+        start : str | None, optional
+            Optional start date in ISO YYYY-MM-DD format.
+        end : str | None, optional
+            Optional end date in ISO YYYY-MM-DD format.
+
+        Returns
+        -------
+        pd.DataFrame
+            Frame indexed by produto, like `core.aggregate_by_product`, holding
+            only products with at least one sale in the range.
+
+        """
+
+        if start and end:
+            first = max(_day_ordinal(start) - self._first_day, 0)
+            last = min(_day_ordinal(end) - self._first_day, self._span - 1)
+        else:
+            first, last = 0, self._span - 1
+
+        if first > last or not len(self._products):
+            return aggregate_by_product(pd.DataFrame())
+
+        base = np.arange(len(self._products), dtype="int64") * self._span
+        lower = np.searchsorted(self._keys, base + first, side="left")
+        upper = np.searchsorted(self._keys, base + last, side="right")
+        present = upper > lower
+
+        lower, upper = lower[present], upper[present]
+
+        return pd.DataFrame(
+            {
+                "quantidade_total": self._cum_quantity[upper]
+                - self._cum_quantity[lower],
+                "total_centavos": self._cum_cents[upper] - self._cum_cents[lower],
+            },
+            index=pd.Index(self._products[present], name="produto"),
+        )
+
+    def report(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        top: int | None = None,
+        sort_by: SortKey | None = None,
+    ) -> SalesSummary:
+        """Compute the sales summary for the inclusive date range.
+
+        Parameters
+        ----------
+        start : str | None, optional
+            Optional start date in ISO YYYY-MM-DD format.
+        end : str | None, optional
+            Optional end date in ISO YYYY-MM-DD format.
+        top : int | None, optional
+            List only this many products; see `core.select_products`.
+        sort_by : SortKey | None, optional
+            Order of the listed products; see `core.select_products`.
+
+        Returns
+        -------
+        SalesSummary
+            Same summary `core.compute_report` produces for the indexed rows.
+
+        """
+
+        return summarize_aggregate(
+            self.aggregate(start, end), start=start, end=end, top=top, sort_by=sort_by
+        )
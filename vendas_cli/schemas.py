@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from datetime import date
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, model_validator
+
+from .typing import OutputFormat
 
 
 class ReportFilters(BaseModel):
@@ -60,3 +62,35 @@ class SalesSummary(BaseModel):
     produto_mais_vendido: str
     totais_por_produto: list[ProductTotal]
     filtros: ReportFilters | None = None
+
+
+class ReportJob(BaseModel):
+    """One report requested in a `--jobs` batch file.
+
+    Attributes
+    ----------
+    start : date | None
+        Inclusive start date, given together with `end`.
+    end : date | None
+        Inclusive end date, given together with `start`.
+    format : OutputFormat | None
+        Output format, or `None` to use the `--format` of the CLI run.
+    output : str | None
+        File the rendered report is written to, or `None` for stdout.
+
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    start: date | None = None
+    end: date | None = None
+    format: OutputFormat | None = None
+    output: str | None = None
+
+    @model_validator(mode="after")
+    def _check_date_range(self) -> ReportJob:
+        if (self.start is None) != (self.end is None):
+            raise ValueError("start and end must be provided together")
+        if self.start and self.end and self.start > self.end:
+            raise ValueError(f"start ({self.start}) cannot be after end ({self.end})")
+        return self
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import argparse
+import os
+import threading
+import urllib.parse
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import cast
+
+from .client import DEFAULT_HOST, DEFAULT_MAX_DATASETS, DEFAULT_PORT
+from .dataset import Dataset
+from .helpers import (
+    DEFAULT_MAX_ERRORS,
+    DataValidationError,
+    validate_csv_path,
+    validate_filter_date,
+)
+from .logger import get_logger
+from .typing import OutputFormat
+
+logger = get_logger()
+
+_CONTENT_TYPES = {
+    "text": "text/plain; charset=utf-8",
+    "json": "application/json; charset=utf-8",
+    "ndjson": "application/x-ndjson; charset=utf-8",
+}
+
+
+class DatasetStore:
+    """Warm per-file datasets answering reports without re-reading the CSV.
+
+    Each file is loaded into a `dataset.Dataset` on its first request. Later
+    requests only `stat` the file and reuse the dataset, with its index and
+    memoized reports, while its size and modification time are unchanged.
+    Validation errors are kept the same way, so an invalid file is not
+    re-parsed on every request. At most `max_datasets` files are kept; the
+    least recently requested one is dropped first, like the on-disk cache's
+    eviction, so a long-running server does not grow without bound.
+
+    Parameters
+    ----------
+    encoding : str | None, optional
+        Explicit input encoding, detected per file when omitted.
+    max_errors : int, optional
+        Number of row-level failures after which validation stops.
+    cache_dir : str | None, optional
+        On-disk cache of validated datasets used when a file is (re)loaded.
+    max_datasets : int, optional
+        Number of files kept loaded.
+
+    """
+
+    def __init__(
+        self,
+        encoding: str | None = None,
+        max_errors: int = DEFAULT_MAX_ERRORS,
+        cache_dir: str | None = None,
+        max_datasets: int = DEFAULT_MAX_DATASETS,
+    ) -> None:
+        self._encoding = encoding
+        self._max_errors = max_errors
+        self._cache_dir = cache_dir
+        self._max_datasets = max_datasets
+        self._entries: OrderedDict[
+            str, tuple[tuple[int, int], Dataset | DataValidationError]
+        ] = OrderedDict()
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock(self, csv_path: str) -> threading.Lock:
+        """Return the lock serializing loads of `csv_path`."""
+
+        with self._locks_guard:
+            return self._locks.setdefault(csv_path, threading.Lock())
+
+    def _remember(
+        self,
+        csv_path: str,
+        entry: tuple[tuple[int, int], Dataset | DataValidationError],
+    ) -> None:
+        """Store `entry` as the most recent one and evict beyond `max_datasets`."""
+
+        with self._locks_guard:
+            self._entries[csv_path] = entry
+            self._entries.move_to_end(csv_path)
+
+            while len(self._entries) > self._max_datasets:
+                evicted, _ = self._entries.popitem(last=False)
+                self._locks.pop(evicted, None)
+                logger.info(f"Evicted dataset {evicted}")
+
+    def dataset(self, csv_path: str) -> Dataset:
+        """Return the warm dataset of `csv_path`, reloading it if the file changed.
+
+        Parameters
+        ----------
+        csv_path : str
+            Path to the CSV file.
+
+        Returns
+        -------
+        Dataset
+            Dataset over every row of the current file contents.
+
+        Raises
+        ------
+        DataValidationError
+            The validation error of the current file contents, if any.
+
+        """
+
+        csv_path = os.path.abspath(csv_path)
+
+        with self._lock(csv_path):
+            stat = os.stat(csv_path)
+            version = (stat.st_size, stat.st_mtime_ns)
+            with self._locks_guard:
+                entry = self._entries.get(csv_path)
+
+            if entry is None or entry[0] != version:
+                logger.info(f"Loading dataset {csv_path}")
+                loaded: Dataset | DataValidationError
+                try:
+                    loaded = Dataset.from_csv(
+                        csv_path,
+                        encoding=self._encoding,
+                        cache_dir=self._cache_dir,
+                        max_errors=self._max_errors,
+                    )
+                except DataValidationError as exc:
+                    loaded = exc
+                entry = (version, loaded)
+
+            self._remember(csv_path, entry)
+
+        if isinstance(entry[1], DataValidationError):
+            raise entry[1]
+
+        return entry[1]
+
+
+def _parse_query(query: str) -> tuple[str, str | None, str | None, OutputFormat]:
+    """Validate the parameters of a `/report` request like the CLI does.
+
+    Raises
+    ------
+    ValueError
+        If a parameter is missing or invalid.
+    """
+
+    params = {key: values[-1] for key, values in urllib.parse.parse_qs(query).items()}
+
+    try:
+        csv_path = validate_csv_path(params.get("path", ""))
+        start = validate_filter_date(params["start"]) if "start" in params else None
+        end = validate_filter_date(params["end"]) if "end" in params else None
+    except argparse.ArgumentTypeError as exc:
+        raise ValueError(str(exc)) from None
+
+    output_format = params.get("format", "text")
+
+    if output_format not in _CONTENT_TYPES:
+        raise ValueError(f"Invalid format '{output_format}'. Use text, json or ndjson.")
+
+    if bool(start) ^ bool(end):
+        raise ValueError("Both start and end must be provided together.")
+
+    if start and end and start > end:
+        raise ValueError(f"start date ({start}) cannot be greater than end ({end}).")
+
+    return csv_path, start, end, cast(OutputFormat, output_format)
+
+
+class _ReportHandler(BaseHTTPRequestHandler):
+    """Serve `GET /report?path=...&start=...&end=...&format=...`."""
+
+    server: _ReportServer
+
+    def _reply(self, status: HTTPStatus, body: str, content_type: str) -> None:
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        url = urllib.parse.urlsplit(self.path)
+
+        if url.path != "/report":
+            self._reply(HTTPStatus.NOT_FOUND, "Unknown path.", _CONTENT_TYPES["text"])
+            return
+
+        try:
+            csv_path, start, end, output_format = _parse_query(url.query)
+        except ValueError as exc:
+            self._reply(HTTPStatus.BAD_REQUEST, str(exc), _CONTENT_TYPES["text"])
+            return
+
+        try:
+            output = self.server.store.dataset(csv_path).render(
+                output_format, start=start, end=end
+            )
+        except DataValidationError as exc:
+            self._reply(
+                HTTPStatus.UNPROCESSABLE_ENTITY, str(exc), _CONTENT_TYPES["text"]
+            )
+            return
+        except Exception as exc:
+            logger.error(f"Error: {exc}")
+            self._reply(
+                HTTPStatus.INTERNAL_SERVER_ERROR, str(exc), _CONTENT_TYPES["text"]
+            )
+            return
+
+        self._reply(HTTPStatus.OK, output, _CONTENT_TYPES[output_format])
+
+    def log_message(self, format: str, *args: object) -> None:
+        logger.info(f"{self.address_string()} - {format % args}")
+
+
+class _ReportServer(ThreadingHTTPServer):
+    """HTTP server sharing one `DatasetStore` between request threads."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], store: DatasetStore) -> None:
+        super().__init__(address, _ReportHandler)
+        self.store = store
+
+
+def make_server(
+    store: DatasetStore,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+) -> ThreadingHTTPServer:
+    """Create the report server without starting it.
+
+    Parameters
+    ----------
+    store : DatasetStore
+        Warm datasets shared by every request.
+    host : str, optional
+        Interface to bind; the loopback interface by default, since any CSV
+        file readable by the server process can be requested.
+    port : int, optional
+        TCP port to bind; 0 picks a free port.
+
+    Returns
+    -------
+    ThreadingHTTPServer
+        Server answering `GET /report` requests; call `serve_forever()`.
+
+    """
+
+    return _ReportServer((host, port), store)
+
+
+def serve(
+    store: DatasetStore,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+) -> None:
+    """Answer report requests until interrupted.
+
+    Parameters
+    ----------
+    store : DatasetStore
+        Warm datasets shared by every request.
+    host : str, optional
+        Interface to bind.
+    port : int, optional
+        TCP port to bind.
+
+    """
+
+    with make_server(store, host, port) as server:
+        logger.info(
+            f"Serving sales reports on http://{host}:{server.server_port}/report"
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Shutting down.")
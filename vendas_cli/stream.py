@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import csv
+import os
+import re
+from datetime import date
+
+from .encoding import allows_latin1_fallback, resolve_encoding
+from .engines import (
+    DAY_PATTERN,
+    MAX_SALE_CENTS,
+    PRICE_PATTERN,
+    QUANTITY_PATTERN,
+    SCHEMA_COLUMNS,
+    EngineFallback,
+    normalize_header,
+    summarize_totals,
+)
+from .logger import get_logger
+from .schemas import SalesSummary
+
+logger = get_logger()
+
+STREAM_ENGINE_MAX_BYTES = 1 << 20
+
+_QUANTITY = re.compile(QUANTITY_PATTERN)
+_PRICE = re.compile(PRICE_PATTERN)
+_DAY = re.compile(DAY_PATTERN)
+
+
+class StreamFallback(EngineFallback):
+    """Raised when a row needs the pandas engine to be validated exactly."""
+
+
+def use_stream_engine(csv_path: str) -> bool:
+    """Return whether `csv_path` is small enough to prefer the stream engine.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+
+    Returns
+    -------
+    bool
+        `True` if the file is at most `STREAM_ENGINE_MAX_BYTES` long, where
+        importing pandas costs more than parsing the rows in Python.
+
+    """
+
+    return os.path.getsize(csv_path) <= STREAM_ENGINE_MAX_BYTES
+
+
+def _aggregate_rows(
+    csv_path: str,
+    encoding: str,
+    day_range: tuple[str, str] | None,
+) -> dict[str, list[int]]:
+    """Validate every row and sum quantity and cents per product in range.
+
+    Prices and days repeat across rows, so each distinct string is parsed
+    once and looked up afterwards.
+    """
+
+    totals: dict[str, list[int]] = {}
+    cents_by_price: dict[str, int] = {}
+    days: set[str] = set()
+
+    with open(csv_path, encoding=encoding, newline="") as file:
+        reader = csv.reader(file)
+        columns = normalize_header(next(reader, []))
+        width = len(columns)
+        p_idx, q_idx, price_idx, day_idx = (columns.index(c) for c in SCHEMA_COLUMNS)
+
+        for row in reader:
+            if not row:
+                continue
+            if len(row) != width:
+                raise StreamFallback(f"row {reader.line_num}")
+
+            quantidade, preco, day = row[q_idx], row[price_idx], row[day_idx]
+
+            if day not in days:
+                if not _DAY.fullmatch(day):
+                    raise StreamFallback(f"row {reader.line_num}")
+                try:
+                    date.fromisoformat(day)
+                except ValueError:
+                    raise StreamFallback(f"row {reader.line_num}") from None
+                days.add(day)
+
+            cents = cents_by_price.get(preco)
+            if cents is None:
+                if not _PRICE.fullmatch(preco):
+                    raise StreamFallback(f"row {reader.line_num}")
+                cents = cents_by_price[preco] = round(float(preco) * 100)
+
+            if not _QUANTITY.fullmatch(quantidade):
+                raise StreamFallback(f"row {reader.line_num}")
+
+            units = int(quantidade)
+            sale = units * cents
+            if sale > MAX_SALE_CENTS:
+                raise StreamFallback(f"row {reader.line_num}")
+
+            if day_range and not day_range[0] <= day <= day_range[1]:
+                continue
+
+            entry = totals.get(row[p_idx])
+            if entry is None:
+                totals[row[p_idx]] = [units, sale]
+            else:
+                entry[0] += units
+                entry[1] += sale
+
+    return totals
+
+
+def compute_report_stream(
+    csv_path: str,
+    start: str | None = None,
+    end: str | None = None,
+    encoding: str | None = None,
+) -> SalesSummary:
+    """Compute the sales report in pure Python, without pandas.
+
+    Rows are streamed with `csv.reader` into per-product integer
+    accumulators, so memory is proportional to the number of products and
+    no DataFrame is built. Meant for small files, where importing pandas
+    dominates the run time; the result is identical to
+    `core.compute_report(parser.load_csv(csv_path), start, end)`.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    start : str | None, optional
+        Optional start date in ISO YYYY-MM-DD format.
+    end : str | None, optional
+        Optional end date in ISO YYYY-MM-DD format.
+    encoding : str | None, optional
+        Encoding used to read the CSV. Detected from the file prefix when
+        omitted. A UTF-8 failure falls back to 'latin1'.
+
+    Returns
+    -------
+    SalesSummary
+        Report over the rows inside the inclusive date range.
+
+    Raises
+    ------
+    StreamFallback
+        If a row is invalid or not in the plain form the stream engine
+        decodes; the pandas engine should process the file instead.
+    ValueError
+        If the file cannot be decoded with an explicit non-UTF-8 encoding.
+
+    """
+
+    logger.info(f"Streaming CSV rows from path: {csv_path}")
+
+    day_range = (
+        (date.fromisoformat(start).isoformat(), date.fromisoformat(end).isoformat())
+        if start and end
+        else None
+    )
+    encoding = resolve_encoding(csv_path, encoding)
+
+    try:
+        totals = _aggregate_rows(csv_path, encoding, day_range)
+    except UnicodeDecodeError as exc:
+        if not allows_latin1_fallback(encoding):
+            raise ValueError(f"Failed to decode '{csv_path}' as {encoding}.") from exc
+
+        logger.warning("UTF-8 decoding failed; falling back to latin1.")
+        totals = _aggregate_rows(csv_path, "latin1", day_range)
+
+    return summarize_totals(
+        ((produto, units, cents) for produto, (units, cents) in sorted(totals.items())),
+        start,
+        end,
+    )
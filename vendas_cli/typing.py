@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Literal, TypedDict
+from typing import Any, Literal, TypedDict
 
-OutputFormat = Literal["text", "json"]
+OutputFormat = Literal["text", "json", "ndjson"]
+ExportFormat = Literal["csv", "parquet", "arrow"]
+SortKey = Literal["quantidade", "valor"]
 
 
 class CLIArgs(TypedDict):
@@ -10,18 +12,97 @@ class CLIArgs(TypedDict):
 
     Attributes
     ----------
-    csv_path : str
-        Path to the CSV file, already validated for existence and extension.
-    format : OutputFormat
-        Output formatting style (`text` or `json`).
+    csv_paths : list[str]
+        Paths to the CSV files, already expanded from directories and globs
+        and validated for existence and extension.
+    format : OutputFormat | ExportFormat
+        Output formatting style (`text`, `json` or `ndjson`), or a tabular
+        export of the per-product totals (`csv`, `parquet` or `arrow`).
     start : str | None
         Start date filter in `YYYY-MM-DD` format, if provided.
     end : str | None
         End date filter in `YYYY-MM-DD` format, if provided.
+    chunk_size : int | None
+        Number of rows per chunk for streaming ingestion, or `None` to load
+        the whole file at once.
+    encoding : str | None
+        Explicit input encoding, or `None` to detect it from the file prefix.
+    workers : int | None
+        Number of worker processes for multi-file input, or `None` to use
+        every available core.
+    split : bool
+        Whether each file is split into byte ranges parsed in parallel.
+    cache_dir : str | None
+        Directory of the validated dataset cache, or `None` when caching is
+        disabled with `--no-cache`.
+    cache_hash : bool
+        Whether cache keys include a hash of the file contents.
+    state_path : str | None
+        State file for incremental ingestion of an append-only CSV, if any.
+    jobs_path : str | None
+        JSON file listing the reports of a batch run, if any.
+    max_errors : int
+        Number of row-level validation failures after which validation stops
+        and that are listed in the error message.
+    reject_path : str | None
+        CSV file receiving quarantined invalid rows, or `None` to fail on
+        invalid data.
+    engine : str
+        Name of a registered report engine (see `engines.available_engines`),
+        or `auto` to pick `stream` for small single files.
+    top : int | None
+        Number of products listed in the report, largest first, if limited.
+    sort_by : SortKey | None
+        Ranking of the listed products (`quantidade` or `valor`), if any.
 
     """
 
-    csv_path: str
-    format: OutputFormat
+    csv_paths: list[str]
+    format: OutputFormat | ExportFormat
     start: str | None
     end: str | None
+    chunk_size: int | None
+    encoding: str | None
+    workers: int | None
+    split: bool
+    cache_dir: str | None
+    cache_hash: bool
+    state_path: str | None
+    jobs_path: str | None
+    max_errors: int
+    reject_path: str | None
+    engine: str
+    top: int | None
+    sort_by: SortKey | None
+
+
+class IncrementalState(TypedDict):
+    """Persisted progress of incremental ingestion for one append-only CSV file.
+
+    Attributes
+    ----------
+    version : int
+        State format version; other versions are discarded and rebuilt.
+    csv_path : str
+        Absolute path of the tracked CSV file.
+    encoding : str
+        Encoding resolved on the first run and reused for every tail.
+    offset : int
+        Byte offset just after the last consumed line break.
+    rows : int
+        Number of data rows consumed so far, used for global row numbers.
+    head_sha256 : str
+        Hash of the file start, used to detect a replaced or rewritten file.
+    daily : dict[str, list[Any]]
+        Columnar per-(produto, day) sums: `produto`, `data` (ISO dates),
+        `quantidade_total` and `total_centavos` (integer cents).
+
+    """
+
+    version: int
+    csv_path: str
+    encoding: str
+    offset: int
+    rows: int
+    head_sha256: str
+    daily: dict[str, list[Any]]
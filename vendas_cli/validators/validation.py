@@ -1,8 +1,56 @@
 from __future__ import annotations
 
+import numpy as np
+import pandas as pd
 import pandera as pa
 from pandera.typing import Series
 
+from ..engines import MAX_SALE_CENTS
+
+# Relative tolerance for a price times 100 to count as a whole number of
+# cents; it only absorbs the float64 error of parsing a decimal price.
+_CENTS_RTOL = 1e-14
+
+
+def whole_cents(prices: pd.Series) -> pd.Series:
+    """Return whether each price is a whole number of cents.
+
+    Parameters
+    ----------
+    prices : pd.Series
+        Unit prices as floats.
+
+    Returns
+    -------
+    pd.Series
+        Boolean mask, `False` for prices such as 0.333.
+
+    """
+
+    scaled = prices * 100
+    return (scaled - scaled.round()).abs() <= scaled.abs() * _CENTS_RTOL
+
+
+def sale_in_range(quantities: pd.Series, prices: pd.Series) -> pd.Series:
+    """Return whether each row's sale value is at most `MAX_SALE_CENTS`.
+
+    Parameters
+    ----------
+    quantities : pd.Series
+        Quantities sold.
+    prices : pd.Series
+        Unit prices as floats.
+
+    Returns
+    -------
+    pd.Series
+        Boolean mask, `False` for rows whose value in cents would not be
+        exact or could overflow the int64 sums.
+
+    """
+
+    return quantities.astype("float64") * prices * 100 <= MAX_SALE_CENTS
+
 
 class ProductsDFModel(pa.DataFrameModel):
     """Pandera validation schema for the sales CSV dataset.
@@ -18,7 +66,8 @@ class ProductsDFModel(pa.DataFrameModel):
     quantidade : int
         Units sold per record row.
     preco_unitario : float
-        Unit price of the product.
+        Unit price of the product, finite, zero or positive and in whole
+        cents.
     data : datetime
         Sale date, automatically coerced to `datetime.date`.
 
@@ -35,9 +84,71 @@ class ProductsDFModel(pa.DataFrameModel):
         ge=0, description="Quantity must be zero or positive."
     )
     preco_unitario: Series[float] = pa.Field(
-        ge=0.0, description="Unit price must be zero or positive."
+        ge=0.0,
+        lt=float("inf"),
+        description="Unit price must be zero or positive and finite.",
     )
     data: Series[pa.DateTime]
 
+    @pa.check("preco_unitario", name="whole_cents")
+    @classmethod
+    def _price_in_whole_cents(cls, prices: pd.Series) -> pd.Series:
+        return whole_cents(prices)
+
+    @pa.dataframe_check(name="sale_value_range")
+    @classmethod
+    def _sale_value_in_range(cls, df: pd.DataFrame) -> pd.Series:
+        return sale_in_range(df["quantidade"], df["preco_unitario"])
+
     class Config:
         coerce = True
+
+
+def is_valid_typed_frame(df: pd.DataFrame) -> bool:
+    """Check a natively typed frame against `ProductsDFModel` without Pandera.
+
+    Mirrors the schema with a few vectorized column operations: required
+    columns, dtypes, nulls, the `ge=0` and finite-price bounds, whole-cent
+    prices and the per-row `MAX_SALE_CENTS` bound. It is meant as a fast
+    acceptance test for clean data; frames it rejects should go through
+    `ProductsDFModel` to find out what is wrong.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Frame with string or categorical `produto`, int64 `quantidade`,
+        float64 `preco_unitario` and datetime64 `data` columns, e.g. read
+        with explicit dtypes.
+
+    Returns
+    -------
+    bool
+        Whether every row satisfies the schema.
+
+    """
+
+    columns = ["produto", "quantidade", "preco_unitario", "data"]
+    if not set(columns).issubset(df.columns):
+        return False
+
+    products = df["produto"]
+    if isinstance(products.dtype, pd.CategoricalDtype):
+        products = products.cat.categories.to_series()
+
+    typed = (
+        pd.api.types.is_string_dtype(products)
+        and pd.api.types.is_integer_dtype(df["quantidade"])
+        and pd.api.types.is_float_dtype(df["preco_unitario"])
+        and pd.api.types.is_datetime64_dtype(df["data"])
+    )
+    if not typed:
+        return False
+
+    return not (
+        df[columns].isna().to_numpy().any()
+        or (df["quantidade"] < 0).any()
+        or (df["preco_unitario"] < 0).any()
+        or np.isinf(df["preco_unitario"].to_numpy()).any()
+        or not whole_cents(df["preco_unitario"]).all()
+        or not sale_in_range(df["quantidade"], df["preco_unitario"]).all()
+    )